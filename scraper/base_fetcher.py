@@ -14,6 +14,17 @@ from bs4.element import NavigableString, PageElement
 class BaseFetcher:
     """Base class with common BeautifulSoup helper methods"""
 
+    headers: dict[str, str]
+
+    def _conditional_headers(self, etag: str | None, last_modified: str | None) -> dict[str, str]:
+        """Build request headers with the cache validators of a previously fetched page"""
+        headers = self.headers.copy()
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
     @staticmethod
     def safe_get_attr(element: Tag | PageElement | NavigableString | None, attr: str, default: str = "") -> str:
         """Safely get attribute from BeautifulSoup element"""
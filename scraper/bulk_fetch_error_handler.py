@@ -7,6 +7,9 @@ Separated from HTTP and business logic for better maintainability.
 
 import contextlib
 import logging
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import requests
@@ -49,11 +52,13 @@ class BulkFetchErrorHandler:
 
         return new_batch_size, should_continue, delay
 
-    def handle_rate_limit(self, rate_limit_attempts: int) -> tuple[bool, float]:
+    def handle_rate_limit(self, rate_limit_attempts: int, retry_after: str | None = None) -> tuple[bool, float]:
         """
         Handle HTTP 429 rate limiting with exponential backoff and caps
 
         Rate limits require respectful exponential backoff but with reasonable caps.
+        A Retry-After header from the server takes precedence over the backoff, within the same cap.
+        The backoff itself is jittered so concurrent batch workers don't retry in lockstep.
 
         Returns:
             tuple: (should_retry, delay_seconds)
@@ -61,15 +66,35 @@ class BulkFetchErrorHandler:
         should_retry = self._should_retry_rate_limit(rate_limit_attempts)
 
         if should_retry:
-            base_delay = self.config['rate_limit_delay']
-            max_delay = self.config['rate_limit_max_delay']
-            delay = min(base_delay * (2 ** rate_limit_attempts), max_delay)
-            logging.warning(f"Rate limited (attempt {rate_limit_attempts + 1}), waiting {delay}s")
+            delay = self.parse_retry_after(retry_after)
+            if delay is None:
+                base_delay = self.config['rate_limit_delay']
+                max_delay = self.config['rate_limit_max_delay']
+                delay = min(base_delay * (2 ** rate_limit_attempts) * random.uniform(0.8, 1.2), max_delay)
+            logging.warning(f"Rate limited (attempt {rate_limit_attempts + 1}), waiting {delay:.1f}s")
             return True, delay
         else:
             logging.error(f"Rate limit exceeded after {rate_limit_attempts + 1} attempts")
             return False, 0.0
 
+    def parse_retry_after(self, retry_after: str | None) -> float | None:
+        """Parse a Retry-After header given as seconds or an HTTP date, capped at the rate limit max delay"""
+        if not retry_after:
+            return None
+
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=UTC)
+            delay = max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+        return min(delay, self.config['rate_limit_max_delay'])
+
     def handle_unexpected_http_error(self, status_code: int, error_response: requests.Response | None = None) -> bool:
         """
         Handle unexpected HTTP errors (not 500 or 429)
@@ -28,6 +28,7 @@ class CLICommands:
     def __init__(self) -> None:
         self.parser = self._create_parser()
         self.lock_file_path: Path | None = None
+        self._config_manager: ConfigManager | None = None
 
     def _create_lock_file(self) -> None:
         """Create a lock file in the data directory"""
@@ -258,6 +259,12 @@ Examples:
         script_dir = Path(__file__).resolve().parent
         return script_dir.parent
 
+    def _get_config_manager(self) -> ConfigManager:
+        """Get the config manager shared by this run, so config.json is parsed once"""
+        if self._config_manager is None:
+            self._config_manager = ConfigManager(self._get_project_root())
+        return self._config_manager
+
     def _calculate_backfill_allocation(self, enabled_channels: list[str], total_budget: int) -> dict[str, int]:
         """
         Calculate video allocation per channel for cron backfill.
@@ -367,7 +374,7 @@ Examples:
         """Handle reprocess command"""
         if args.channel:
             # Single channel reprocess mode
-            scraper = YouTubeSteamScraper(args.channel)
+            scraper = YouTubeSteamScraper(args.channel, self._get_config_manager())
 
             if not scraper.config_manager.validate_channel_exists(args.channel):
                 print(f"Error: Channel '{args.channel}' not found in config.json")
@@ -381,8 +388,7 @@ Examples:
 
     def _handle_backfill(self, args: argparse.Namespace) -> None:
         """Handle backfill command"""
-        project_root = self._get_project_root()
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         channels = config_manager.get_channels()
 
         # Use global defaults if not specified via command line
@@ -412,7 +418,7 @@ Examples:
         scrapers_to_save = []
         for channel_id in channels_to_process:
             logging.info(f"Processing channel: {channel_id}")
-            scraper = YouTubeSteamScraper(channel_id)
+            scraper = YouTubeSteamScraper(channel_id, config_manager)
             channel_url = config_manager.get_channel_url(channel_id)
 
             # Process videos without saving
@@ -426,7 +432,7 @@ Examples:
             scrapers_to_save.append(scraper)
 
         # Update other platform games first (may contain Steam links)
-        other_games_updater = OtherGamesUpdater()
+        other_games_updater = OtherGamesUpdater(self._get_config_manager())
         steam_updater = SteamDataUpdater()
 
         # Enable deferred save to prevent validation errors during cross-platform reference setup
@@ -465,7 +471,7 @@ Examples:
     def _handle_cron(self, args: argparse.Namespace) -> None:
         """Handle cron command"""
         project_root = self._get_project_root()
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         channels = config_manager.get_channels()
 
         # Process each enabled channel for recent videos (collect without saving)
@@ -478,7 +484,7 @@ Examples:
 
             enabled_channels.append(channel_id)
             logging.info(f"Processing channel @{channel_id} (cron mode)")
-            scraper = YouTubeSteamScraper(channel_id)
+            scraper = YouTubeSteamScraper(channel_id, config_manager)
 
             # Process recent videos only (smaller batch for cron) - fetch newest first
             # Use process_videos_no_save to avoid saving before Steam updates
@@ -523,7 +529,7 @@ Examples:
 
                     for channel_id, videos_to_process in allocation.items():
                         logging.info(f"Cron backfill: processing {videos_to_process} videos for {channel_id}")
-                        scraper = YouTubeSteamScraper(channel_id)
+                        scraper = YouTubeSteamScraper(channel_id, config_manager)
                         channel_url = config_manager.get_channel_url(channel_id)
 
                         # Process backfill videos without saving
@@ -568,7 +574,7 @@ Examples:
                     logging.error(f"Bulk price refresh with removal detection failed: {e}")
                     # Continue with regular cron workflow even if removal detection fails
 
-            other_games_updater = OtherGamesUpdater()
+            other_games_updater = OtherGamesUpdater(self._get_config_manager())
             steam_updater = SteamDataUpdater()
 
             # Enable deferred save to prevent validation errors during cross-platform reference setup
@@ -597,7 +603,7 @@ Examples:
                 # Run cross-platform auto-linking after all updates
                 logging.info("Running cross-platform auto-linking")
                 from .cross_platform_matcher import run_cross_platform_matching
-                stats = run_cross_platform_matching(project_root)
+                stats = run_cross_platform_matching(project_root, self._get_config_manager())
                 if 'error' not in stats:
                     logging.info(f"Auto-linking results: {stats['approved_links']} new links, "
                                f"{stats['conflicting_links_removed']} conflicts resolved")
@@ -644,26 +650,24 @@ Examples:
 
     def _handle_data_quality(self, _args: argparse.Namespace) -> None:
         """Handle data-quality command"""
-        project_root = self._get_project_root()
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         channels = config_manager.get_channels()
 
         # Use first available channel to access data files
         first_channel = next(iter(channels.keys()))
-        scraper = YouTubeSteamScraper(first_channel)
+        scraper = YouTubeSteamScraper(first_channel, config_manager)
 
         logging.info("Data quality check: analyzing all channels and games")
         scraper.check_data_quality(channels)
 
     def _handle_resolve_games(self, _args: argparse.Namespace) -> None:
         """Handle resolve-games command"""
-        project_root = self._get_project_root()
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         channels = config_manager.get_channels()
 
         # Use first available channel to access data files
         first_channel = next(iter(channels.keys()))
-        scraper = YouTubeSteamScraper(first_channel)
+        scraper = YouTubeSteamScraper(first_channel, config_manager)
 
         logging.info("Resolving games: finding games for videos with missing, broken, or stub game data")
         scraper.resolve_games(channels)
@@ -678,8 +682,7 @@ Examples:
 
     def _handle_fetch_videos(self, args: argparse.Namespace) -> None:
         """Handle fetch-videos command - only fetch new YouTube videos without processing game data"""
-        project_root = self._get_project_root()
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         channels = config_manager.get_channels()
 
         if args.channel:
@@ -695,7 +698,7 @@ Examples:
         total_new_videos = 0
         for channel_id in channels_to_process:
             logging.info(f"Fetching videos for channel: {channel_id}")
-            scraper = YouTubeSteamScraper(channel_id)
+            scraper = YouTubeSteamScraper(channel_id, config_manager)
             channel_url = config_manager.get_channel_url(channel_id)
 
             new_videos = scraper.process_videos(
@@ -712,8 +715,7 @@ Examples:
 
     def _handle_refresh_steam(self, args: argparse.Namespace) -> None:
         """Handle refresh-steam command - only refresh Steam game data"""
-        project_root = self._get_project_root()
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         channels = config_manager.get_channels()
 
         # Get all enabled channels for Steam updates
@@ -733,7 +735,7 @@ Examples:
     def _handle_refresh_other(self, args: argparse.Namespace) -> None:
         """Handle refresh-other command - only refresh other games (Itch.io, CrazyGames) data"""
         logging.info("Refreshing other games data (Itch.io, CrazyGames)")
-        other_games_updater = OtherGamesUpdater()
+        other_games_updater = OtherGamesUpdater(self._get_config_manager())
         other_games_updater.update_all_other_games(force_update=args.force)
 
     def _handle_steam_changes(self, args: argparse.Namespace) -> None:
@@ -763,7 +765,7 @@ Examples:
         validator = ReferenceValidator(data_manager)
 
         # Get all channel IDs from config
-        config_manager = ConfigManager(project_root)
+        config_manager = self._get_config_manager()
         all_channels = config_manager.get_channels()
         channel_ids = list(all_channels.keys())
 
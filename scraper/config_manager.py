@@ -127,6 +127,12 @@ class ConfigManager:
             return max_videos
         return None
 
+    def get_compact_json(self) -> bool:
+        """Get whether data files are written as compact JSON instead of indented"""
+        global_settings = self.get_global_settings()
+        compact_json = global_settings.get('compact_json', False)
+        return bool(compact_json)
+
     def get_cron_enable_backfill(self) -> bool:
         """Get whether cron should include backfill processing"""
         global_settings = self.get_global_settings()
@@ -6,6 +6,7 @@ Centralized constants for the scraper application
 STEAM_BULK_DEFAULTS = {
     'default_batch_size': 500,
     'max_retries': 10,
+    'concurrent_batches': 2,  # Batch streams fetched in parallel, kept low to stay clear of Steam rate limits
 
     # Server Error (500) Configuration
     'server_error_batch_reduction': 0.8,  # Reduce batch size by 20% on server overload
@@ -24,7 +25,14 @@ STEAM_BULK_DEFAULTS = {
 # HTTP Configuration
 HTTP_TIMEOUT_SECONDS = 30
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+STEAM_FETCH_WORKERS = 4  # Concurrent Steam app fetches during channel updates
+STEAM_SAVE_INTERVAL = 25  # Flush Steam data after this many updates so an interrupted run keeps its progress
+STEAM_SEARCH_WORKERS = 4  # Concurrent Steam store searches while resolving game names
+STEAM_SEARCH_CACHE_SIZE = 4096  # Most recent store search queries (and their best matches) kept per inference engine
+OTHER_GAMES_FETCH_WORKERS = 4  # Concurrent Itch.io/CrazyGames page fetches during other games updates
 
 # Video Processing Configuration
 DEFAULT_MAX_VIDEOS_PER_CHANNEL = 50
 CONSECUTIVE_KNOWN_BATCHES_THRESHOLD = 3
+VIDEO_METADATA_FETCH_WORKERS = 4  # Concurrent per-video metadata fetches, kept low to stay clear of YouTube throttling
+YOUTUBE_DETECTION_RECHECK_DAYS = 30  # Re-probe videos without a YouTube detected game after this long
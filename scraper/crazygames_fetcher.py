@@ -14,6 +14,25 @@ from .base_fetcher import BaseFetcher
 from .models import OtherGameData
 from .utils import clean_tag_text
 
+# CrazyGames emits its structured data as JSON-LD script blocks; matching them
+# directly on the raw HTML avoids walking the whole parsed tree
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Text fallbacks only capture digits, so they match against lower-cased page text without IGNORECASE
+RATING_TEXT_PATTERNS = [
+    re.compile(r'(\d+\.?\d*)\s*(?:/|out of)\s*10\b'),  # "X.X / 10" or "X.X out of 10" ratings
+    re.compile(r'rating["\s:]+(\d+\.?\d*)'),
+    re.compile(r'"ratingvalue"[:\s]+["\']?(\d+\.?\d*)'),
+]
+REVIEW_COUNT_TEXT_PATTERNS = [
+    re.compile(r'(\d{1,3}(?:,\d{3})*)\s*(?:votes?|ratings?)'),
+    re.compile(r'"ratingcount"[:\s]+["\']?(\d+)'),
+    re.compile(r'total votes[:\s]+(\d{1,3}(?:,\d{3})*)'),
+]
+
 
 class CrazyGamesDataFetcher(BaseFetcher):
     """Handles fetching and parsing CrazyGames game data"""
@@ -23,10 +42,17 @@ class CrazyGamesDataFetcher(BaseFetcher):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-    def fetch_data(self, crazygames_url: str) -> OtherGameData | None:
+    def fetch_data(self, crazygames_url: str, existing_data: OtherGameData | None = None) -> OtherGameData | None:
         """Fetch game data from CrazyGames"""
         try:
-            response = requests.get(crazygames_url, headers=self.headers)
+            headers = self.headers
+            if existing_data and not existing_data.is_stub:
+                headers = self._conditional_headers(existing_data.page_etag, existing_data.page_last_modified)
+            response = requests.get(crazygames_url, headers=headers)
+            if response.status_code == 304 and existing_data:
+                logging.debug(f"CrazyGames page not modified for {crazygames_url}, reusing cached data")
+                return existing_data.model_copy()
+
             if response.status_code != 200:
                 return None
 
@@ -41,11 +67,13 @@ class CrazyGamesDataFetcher(BaseFetcher):
                 is_free=True,  # CrazyGames are free browser games
                 release_date=self._extract_release_date(soup),
                 header_image=self._extract_header_image(soup),
-                tags=self._extract_tags(soup)
+                tags=self._extract_tags(soup),
+                page_etag=response.headers.get('ETag'),
+                page_last_modified=response.headers.get('Last-Modified')
             )
 
             # Extract rating information
-            rating_data = self._extract_rating(soup, page_text)
+            rating_data = self._extract_rating(page_text)
             if rating_data:
                 game_data.positive_review_percentage = rating_data.get('percentage')
                 game_data.review_count = rating_data.get('count')
@@ -102,26 +130,21 @@ class CrazyGamesDataFetcher(BaseFetcher):
 
         return tags
 
-    def _extract_rating(self, soup: BeautifulSoup, page_text: str) -> dict[str, int] | None:
+    def _extract_rating(self, page_text: str) -> dict[str, int] | None:
         """Extract rating information from CrazyGames page"""
         # Look for rating in structured data (JSON-LD)
-        rating_data = self._extract_rating_from_json_ld(soup)
+        rating_data = self._extract_rating_from_json_ld(page_text)
         if rating_data:
             return rating_data
 
         # Fallback: Look for rating in page text using regex patterns
         return self._extract_rating_from_text(page_text)
 
-    def _extract_rating_from_json_ld(self, soup: BeautifulSoup) -> dict[str, int] | None:
+    def _extract_rating_from_json_ld(self, page_text: str) -> dict[str, int] | None:
         """Extract rating from JSON-LD structured data"""
-        script_tags = soup.find_all('script', type='application/ld+json')
-        for script in script_tags:
+        for match in JSON_LD_PATTERN.finditer(page_text):
             try:
-                script_content = self.safe_string(script)
-                if isinstance(script_content, str):
-                    json_data = json.loads(script_content)
-                else:
-                    continue
+                json_data = json.loads(match.group(1))
 
                 # Handle both single dict and array of dicts
                 if isinstance(json_data, list):
@@ -162,15 +185,11 @@ class CrazyGamesDataFetcher(BaseFetcher):
 
     def _extract_rating_from_text(self, page_text: str) -> dict[str, int] | None:
         """Extract rating from page text using regex patterns"""
-        # Pattern for "X.X / 10" or "X.X out of 10" ratings
-        rating_patterns = [
-            r'(\d+\.?\d*)\s*(?:/|out of)\s*10\b',
-            r'rating["\s:]+(\d+\.?\d*)',
-            r'"ratingValue"[:\s]+["\']?(\d+\.?\d*)',
-        ]
-
-        for pattern in rating_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        # Lower-case once instead of case-folding in every pattern scan
+        page_text_lower = page_text.lower()
+
+        for pattern in RATING_TEXT_PATTERNS:
+            match = pattern.search(page_text_lower)
             if match:
                 rating = float(match.group(1))
                 if rating <= 10:  # Out of 10 rating
@@ -183,7 +202,7 @@ class CrazyGamesDataFetcher(BaseFetcher):
                 result = {'percentage': percentage}
 
                 # Look for vote/review count
-                count = self._extract_review_count_from_text(page_text)
+                count = self._extract_review_count_from_text(page_text_lower)
                 if count:
                     result['count'] = count
 
@@ -191,16 +210,10 @@ class CrazyGamesDataFetcher(BaseFetcher):
 
         return None
 
-    def _extract_review_count_from_text(self, page_text: str) -> int | None:
-        """Extract review count from page text"""
-        count_patterns = [
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:votes?|ratings?)',
-            r'"ratingCount"[:\s]+["\']?(\d+)',
-            r'Total Votes[:\s]+(\d{1,3}(?:,\d{3})*)',
-        ]
-
-        for pattern in count_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+    def _extract_review_count_from_text(self, page_text_lower: str) -> int | None:
+        """Extract review count from lower-cased page text"""
+        for pattern in REVIEW_COUNT_TEXT_PATTERNS:
+            match = pattern.search(page_text_lower)
             if match:
                 count_str = match.group(1).replace(',', '')
                 return int(count_str)
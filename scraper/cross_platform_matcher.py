@@ -7,16 +7,25 @@ with intelligent precedence rules to avoid conflicts.
 
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
+from .config_manager import ConfigManager
+from .utils import save_data
+
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+STEAM_APP_PATH_PATTERN = re.compile(r'/app/(\d+)')
+
 
 class CrossPlatformMatcher:
     """Handles cross-platform game matching and linking with precedence rules"""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, config_manager: ConfigManager | None = None):
         self.project_root = project_root
         self.data_dir = project_root / 'data'
+        self.config_manager = config_manager or ConfigManager(project_root)
 
     def normalize_name(self, name: str) -> str:
         """Normalize game name for comparison"""
@@ -38,9 +47,8 @@ class CrossPlatformMatcher:
                 normalized = normalized[:-len(suffix)].strip()
 
         # Remove special characters and extra spaces
-        import re
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = NON_WORD_PATTERN.sub('', normalized)
+        normalized = WHITESPACE_RUN_PATTERN.sub(' ', normalized).strip()
 
         return normalized
 
@@ -187,13 +195,11 @@ class CrossPlatformMatcher:
 
         # Save updated data
         if steam_updated > 0:
-            with (self.data_dir / 'steam_games.json').open('w') as f:
-                json.dump(steam_data, f, indent=2)
+            save_data(steam_data, self.data_dir / 'steam_games.json', compact=self.config_manager.get_compact_json())
             logging.info(f"Updated {steam_updated} Steam games with cross-platform links")
 
         if other_updated > 0:
-            with (self.data_dir / 'other_games.json').open('w') as f:
-                json.dump(other_data, f, indent=2)
+            save_data(other_data, self.data_dir / 'other_games.json', compact=self.config_manager.get_compact_json())
             logging.info(f"Updated {other_updated} other platform games with Steam links")
 
         return steam_updated, other_updated
@@ -233,8 +239,7 @@ class CrossPlatformMatcher:
                 continue  # No link or approved link
 
             # Extract Steam app ID from URL
-            import re
-            match = re.search(r'/app/(\d+)', steam_url)
+            match = STEAM_APP_PATH_PATTERN.search(steam_url)
             if not match:
                 continue
 
@@ -269,11 +274,9 @@ class CrossPlatformMatcher:
 
         # Save updated data if changes were made
         if removed_count > 0:
-            with (self.data_dir / 'steam_games.json').open('w') as f:
-                json.dump(steam_data, f, indent=2)
+            save_data(steam_data, self.data_dir / 'steam_games.json', compact=self.config_manager.get_compact_json())
 
-            with (self.data_dir / 'other_games.json').open('w') as f:
-                json.dump(other_data, f, indent=2)
+            save_data(other_data, self.data_dir / 'other_games.json', compact=self.config_manager.get_compact_json())
 
             logging.info(f"Removed {removed_count} conflicting cross-platform links")
 
@@ -331,8 +334,8 @@ class CrossPlatformMatcher:
         return stats
 
 
-def run_cross_platform_matching(project_root: Path) -> dict[str, int | str]:
+def run_cross_platform_matching(project_root: Path, config_manager: ConfigManager | None = None) -> dict[str, int | str]:
     """Convenience function to run cross-platform matching"""
-    matcher = CrossPlatformMatcher(project_root)
+    matcher = CrossPlatformMatcher(project_root, config_manager)
     return matcher.run_auto_linking()
 
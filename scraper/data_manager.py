@@ -35,12 +35,14 @@ class OtherGamesDataDict(TypedDict):
 class DataManager:
     """Handles loading, saving, and managing data files"""
 
-    def __init__(self, project_root: Path, validate_on_save: bool = True):
+    def __init__(self, project_root: Path, validate_on_save: bool = True, config_manager: ConfigManager | None = None):
         self.project_root = project_root
         self.data_dir = project_root / 'data'
         self.validate_on_save = validate_on_save
         self._validator: ReferenceValidator | None = None  # Lazy-loaded to avoid circular imports
-        self.config_manager = ConfigManager(project_root)
+        self.config_manager = config_manager or ConfigManager(project_root)
+        # Last payload written per file, keyed with the file's mtime so external writes invalidate it
+        self._saved_snapshots: dict[Path, tuple[int, dict[str, Any]]] = {}
 
     def get_videos_file_path(self, channel_id: str) -> Path:
         """Get path to videos data file for a channel"""
@@ -61,6 +63,27 @@ class DataManager:
             self._validator = ReferenceValidator(self)
         return self._validator
 
+    def _is_unchanged_since_last_save(self, file_path: Path, data_to_save: dict[str, Any]) -> bool:
+        """Check whether data matches what this manager last wrote to an untouched file"""
+        snapshot = self._saved_snapshots.get(file_path)
+        if snapshot is None:
+            return False
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            return False
+        saved_mtime_ns, saved_data = snapshot
+        return mtime_ns == saved_mtime_ns and saved_data == data_to_save
+
+    def _write_data(self, data_to_save: dict[str, Any], file_path: Path, from_models: bool) -> None:
+        """Write data atomically and, if built from models, remember it so unchanged re-saves can be skipped"""
+        save_data(data_to_save, file_path, compact=self.config_manager.get_compact_json())
+        if from_models:
+            self._saved_snapshots[file_path] = (file_path.stat().st_mtime_ns, data_to_save)
+        else:
+            # Payload holds the caller's own dicts, which could be mutated in place and compare equal to themselves
+            self._saved_snapshots.pop(file_path, None)
+
     def _run_validation_if_enabled(self, channel_ids: list[str] | None = None,
                                   context: 'ValidationContext | None' = None) -> bool:
         """Run validation with optional pre-loaded context. Returns True if validation passes or is disabled."""
@@ -70,9 +93,7 @@ class DataManager:
         if channel_ids is None:
             # Try to discover channel IDs
             try:
-                from .config_manager import ConfigManager
-                config_manager = ConfigManager(self.project_root)
-                channels = config_manager.get_channels()
+                channels = self.config_manager.get_channels()
                 channel_ids = list(channels.keys())
             except Exception as e:
                 logging.warning(f"Could not load channel IDs for validation: {e}")
@@ -164,6 +185,7 @@ class DataManager:
 
         # Convert VideoData objects to dictionaries for JSON serialization
         videos_dict = {}
+        from_models = True
         for video_id, video_data in videos_data['videos'].items():
             if isinstance(video_data, VideoData):
                 video_dict = video_data.model_dump(exclude_none=True)
@@ -172,11 +194,16 @@ class DataManager:
                 videos_dict[video_id] = video_dict
             else:
                 videos_dict[video_id] = video_data
+                from_models = False
 
         data_to_save = {
             'videos': videos_dict
         }
 
+        if self._is_unchanged_since_last_save(videos_file, data_to_save):
+            logging.debug(f"No changes to {videos_file.name}, skipping save")
+            return
+
         # Create validation context with current data
         from .reference_validator import ValidationContext
         videos_data_dict = {channel_id: videos_data}
@@ -190,7 +217,7 @@ class DataManager:
         if not self._run_validation_if_enabled([channel_id], context=context):
             raise ValueError("Data validation failed - save operation aborted")
 
-        save_data(data_to_save, videos_file)
+        self._write_data(data_to_save, videos_file, from_models)
 
     def save_steam_data(self, steam_data: SteamDataDict) -> None:
         """Save Steam data to JSON file"""
@@ -198,6 +225,7 @@ class DataManager:
 
         # Convert SteamGameData objects to dictionaries for JSON serialization
         games_dict = {}
+        from_models = True
         for app_id, game_data in steam_data['games'].items():
             if isinstance(game_data, SteamGameData):
                 game_dict = game_data.model_dump(exclude_none=True)
@@ -206,19 +234,22 @@ class DataManager:
                 games_dict[app_id] = game_dict
             else:
                 games_dict[app_id] = game_data
+                from_models = False
 
         data_to_save = {
             'games': games_dict
         }
 
+        if self._is_unchanged_since_last_save(steam_file, data_to_save):
+            logging.debug(f"No changes to {steam_file.name}, skipping save")
+            return
+
         # Create validation context with current in-memory data
         from .reference_validator import ValidationContext
 
         # Load all videos data for complete validation context
         try:
-            from .config_manager import ConfigManager
-            config_manager = ConfigManager(self.project_root)
-            channels = config_manager.get_channels()
+            channels = self.config_manager.get_channels()
             videos_data_dict = {}
             for channel_id in channels:
                 videos_data_dict[channel_id] = self.load_videos_data(channel_id)
@@ -236,7 +267,7 @@ class DataManager:
         if not self._run_validation_if_enabled(context=context):
             raise ValueError("Data validation failed - save operation aborted")
 
-        save_data(data_to_save, steam_file)
+        self._write_data(data_to_save, steam_file, from_models)
 
     def save_other_games_data(self, other_games_data: OtherGamesDataDict, pending_steam_data: 'SteamDataDict | None' = None) -> None:
         """Save other games data to JSON file"""
@@ -244,6 +275,7 @@ class DataManager:
 
         # Convert OtherGameData objects to dictionaries for JSON serialization
         games_dict = {}
+        from_models = True
         for game_id, game_data in other_games_data['games'].items():
             if isinstance(game_data, OtherGameData):
                 game_dict = game_data.model_dump(exclude_none=True)
@@ -252,19 +284,22 @@ class DataManager:
                 games_dict[game_id] = game_dict
             else:
                 games_dict[game_id] = game_data
+                from_models = False
 
         data_to_save = {
             'games': games_dict
         }
 
+        if self._is_unchanged_since_last_save(other_games_file, data_to_save):
+            logging.debug(f"No changes to {other_games_file.name}, skipping save")
+            return
+
         # Create validation context with current data
         from .reference_validator import ValidationContext
 
         # Load all videos data for validation context
         try:
-            from .config_manager import ConfigManager
-            config_manager = ConfigManager(self.project_root)
-            channels = config_manager.get_channels()
+            channels = self.config_manager.get_channels()
             videos_data_dict = {}
             for channel_id in channels:
                 videos_data_dict[channel_id] = self.load_videos_data(channel_id)
@@ -282,7 +317,7 @@ class DataManager:
         if not self._run_validation_if_enabled(context=context):
             raise ValueError("Data validation failed - save operation aborted")
 
-        save_data(data_to_save, other_games_file)
+        self._write_data(data_to_save, other_games_file, from_models)
 
     def _ensure_video_data(self, data: Any, video_id: str = "unknown") -> VideoData:
         """Ensure data is VideoData instance - fail fast on invalid data"""
@@ -3,6 +3,7 @@ Data quality checking and reporting utilities
 """
 
 import json
+import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -12,16 +13,58 @@ from .config_manager import ConfigManager
 if TYPE_CHECKING:
     from .data_manager import OtherGamesDataDict, SteamDataDict
 
+# Video fields the quality checks read; everything else (notably descriptions) is dropped after loading,
+# with the game triage result precomputed as 'has_game'
+VIDEO_QUALITY_FIELDS = ('title', 'steam_app_id')
+
 
 class DataQualityChecker:
     """Handles data quality analysis and reporting"""
 
-    def __init__(self, project_root: Path, steam_data: "SteamDataDict", other_games_data: "OtherGamesDataDict"):
+    def __init__(self, project_root: Path, steam_data: "SteamDataDict", other_games_data: "OtherGamesDataDict",
+                 config_manager: ConfigManager | None = None):
         self.project_root = project_root
         self.steam_data = steam_data
         self.other_games_data = other_games_data
-        self.config_manager = ConfigManager(project_root)
+        self.config_manager = config_manager or ConfigManager(project_root)
         self.skip_steam_matching_games = self.config_manager.get_skip_steam_matching_games()
+        # Informational per-item lines (examples, optional fields, stale games) follow the log level, so quiet
+        # runs skip building them; errors and counts are always reported
+        self.show_details = logging.getLogger().isEnabledFor(logging.INFO)
+        self._skip_games_lower = [skip_game.lower() for skip_game in self.skip_steam_matching_games]
+        self._channel_videos: dict[str, dict[str, dict[str, Any]] | None] = {}
+        # (stale Steam, stale other) counts from the stale data check, reused by the summary
+        self._stale_counts: tuple[int, int] | None = None
+
+    def _load_channel_videos(self, channel_id: str) -> dict[str, dict[str, Any]] | None:
+        """Load a channel's videos once per report, returning None if its video file is missing"""
+        if channel_id not in self._channel_videos:
+            videos_file = self.project_root / 'data' / f'videos-{channel_id}.json'
+            try:
+                # Parse the raw bytes; json decodes UTF-8 itself, skipping the text-mode decoding layer
+                videos = json.loads(videos_file.read_bytes()).get('videos', {})
+            except FileNotFoundError:
+                self._channel_videos[channel_id] = None
+            else:
+                self._channel_videos[channel_id] = {
+                    video_id: {field: video[field] for field in VIDEO_QUALITY_FIELDS if field in video}
+                    | {'has_game': self._video_has_game(video)}
+                    for video_id, video in videos.items()
+                }
+        return self._channel_videos[channel_id]
+
+    def _video_has_game(self, video: dict[str, Any]) -> bool:
+        """Check whether a video has game data or a detected game that's intentionally skipped"""
+        get = video.get
+        if get('steam_app_id') or get('itch_url') or get('crazygames_url'):
+            return True
+
+        # Check if this video has a detected game that's intentionally skipped
+        youtube_detected_game = get('youtube_detected_game', '')
+        if not youtube_detected_game:
+            return False
+        youtube_detected_game = youtube_detected_game.lower()
+        return any(skip_game in youtube_detected_game for skip_game in self._skip_games_lower)
 
     def check_data_quality(self, channels_config: dict[str, Any]) -> int:
         """Check data quality across all channels and games"""
@@ -61,33 +104,24 @@ class DataQualityChecker:
         total_issues = 0
 
         for channel_id in channels_config:
-            videos_file = self.project_root / 'data' / f'videos-{channel_id}.json'
-            if not videos_file.exists():
+            channel_videos = self._load_channel_videos(channel_id)
+            if channel_videos is None:
+                videos_file = self.project_root / 'data' / f'videos-{channel_id}.json'
                 print(f"⚠️  Missing video file for channel {channel_id}: {videos_file}")
                 total_issues += 1
                 continue
 
-            with videos_file.open() as f:
-                channel_data = json.load(f)
-
             channel_videos_missing = 0
             channel_videos_with_games = 0
 
-            for video_id, video in channel_data.get('videos', {}).items():
-                has_game = bool(video.get('steam_app_id') or video.get('itch_url') or video.get('crazygames_url'))
-
-                # Check if this video has a detected game that's intentionally skipped
-                youtube_detected_game = video.get('youtube_detected_game', '')
-                is_intentionally_skipped = any(skip_game.lower() in youtube_detected_game.lower()
-                                             for skip_game in self.skip_steam_matching_games)
-
-                if has_game or is_intentionally_skipped:
+            for video_id, video in channel_videos.items():
+                if video['has_game']:
                     videos_with_games += 1
                     channel_videos_with_games += 1
                 else:
                     videos_missing_games += 1
                     channel_videos_missing += 1
-                    if channel_videos_missing <= 5:  # Show first 5 examples
+                    if self.show_details and channel_videos_missing <= 5:  # Show first 5 examples
                         print(f"   📺 {channel_id}: '{video.get('title', 'Unknown')}' (ID: {video_id})")
 
             if channel_videos_missing > 5:
@@ -111,12 +145,9 @@ class DataQualityChecker:
         # Collect all Steam app IDs referenced in videos
         referenced_steam_apps = set()
         for channel_id in channels_config:
-            videos_file = self.project_root / 'data' / f'videos-{channel_id}.json'
-            if videos_file.exists():
-                with videos_file.open() as f:
-                    channel_data = json.load(f)
-
-                for video in channel_data.get('videos', {}).values():
+            channel_videos = self._load_channel_videos(channel_id)
+            if channel_videos is not None:
+                for video in channel_videos.values():
                     steam_app_id = video.get('steam_app_id')
                     if steam_app_id:
                         referenced_steam_apps.add(steam_app_id)
@@ -154,42 +185,41 @@ class DataQualityChecker:
         steam_issues = 0
         required_steam_fields = ['name', 'steam_app_id', 'tags', 'positive_review_percentage']
         optional_steam_fields = ['header_image', 'review_summary', 'price']
+        required_without_score = [field for field in required_steam_fields if field != 'positive_review_percentage']
+        optional_coming_soon_fields = [field for field in optional_steam_fields if field not in ('review_summary', 'price')]
+        coming_soon_count = 0
+        insufficient_reviews_count = 0
+        no_reviews_count = 0
+        # Per-game findings are collected and printed in one write; there can be thousands of them
+        report_lines: list[str] = []
 
         for app_id, game in self.steam_data.get('games', {}).items():
-            missing_required = []
-            missing_optional = []
-
-            # Check required fields, but skip positive_review_percentage for coming soon games
-            for field in required_steam_fields:
-                if not getattr(game, field, None):
-                    # Coming soon games legitimately don't have review data
-                    if field == 'positive_review_percentage' and game.coming_soon:
-                        continue
-                    # Games with insufficient reviews also legitimately don't have percentage scores
-                    if field == 'positive_review_percentage' and game.insufficient_reviews:
-                        continue
-                    # Games with no reviews also legitimately don't have percentage scores
-                    if field == 'positive_review_percentage' and game.review_count == 0:
-                        continue
-                    missing_required.append(field)
-
-            for field in optional_steam_fields:
-                if not getattr(game, field, None):
-                    # Coming soon games legitimately don't have price or review data
-                    if game.coming_soon and field in ['review_summary', 'price']:
-                        continue
-                    missing_optional.append(field)
+            # Count coming soon games and insufficient reviews for informational purposes
+            if game.coming_soon:
+                coming_soon_count += 1
+            if game.insufficient_reviews:
+                insufficient_reviews_count += 1
+            if game.review_count == 0:
+                no_reviews_count += 1
+
+            # Coming soon games and games with insufficient or no reviews legitimately don't have percentage scores,
+            # and coming soon games don't have price or review data either; work out the exemptions once per game
+            required_fields = required_without_score if (
+                game.coming_soon or game.insufficient_reviews or game.review_count == 0
+            ) else required_steam_fields
+            optional_fields = optional_coming_soon_fields if game.coming_soon else optional_steam_fields
+
+            missing_required = [field for field in required_fields if not getattr(game, field, None)]
+            missing_optional = [field for field in optional_fields if not getattr(game, field, None)]
 
             if missing_required:
-                print(f"❌ Steam game {app_id} ({game.name}) missing required: {', '.join(missing_required)}")
+                report_lines.append(f"❌ Steam game {app_id} ({game.name}) missing required: {', '.join(missing_required)}")
                 steam_issues += 1
-            elif missing_optional:
-                print(f"⚠️  Steam game {app_id} ({game.name}) missing optional: {', '.join(missing_optional)}")
+            elif missing_optional and self.show_details:
+                report_lines.append(f"⚠️  Steam game {app_id} ({game.name}) missing optional: {', '.join(missing_optional)}")
 
-        # Count coming soon games and insufficient reviews for informational purposes
-        coming_soon_count = sum(1 for game in self.steam_data.get('games', {}).values() if game.coming_soon)
-        insufficient_reviews_count = sum(1 for game in self.steam_data.get('games', {}).values() if game.insufficient_reviews)
-        no_reviews_count = sum(1 for game in self.steam_data.get('games', {}).values() if game.review_count == 0)
+        if report_lines:
+            print('\n'.join(report_lines))
 
         print(f"\nSteam games checked: {len(self.steam_data.get('games', {}))}")
         print(f"Coming soon games (no reviews expected): {coming_soon_count}")
@@ -212,6 +242,7 @@ class DataQualityChecker:
         other_issues = 0
         required_other_fields = ['name', 'platform', 'tags']
         optional_other_fields = ['header_image', 'positive_review_percentage', 'review_count']
+        report_lines: list[str] = []
 
         for game in self.other_games_data.get('games', {}).values():
             missing_required = []
@@ -228,10 +259,13 @@ class DataQualityChecker:
             ]
 
             if missing_required:
-                print(f"❌ {game.platform} game '{game.name}' missing required: {', '.join(missing_required)}")
+                report_lines.append(f"❌ {game.platform} game '{game.name}' missing required: {', '.join(missing_required)}")
                 other_issues += 1
-            elif missing_optional:
-                print(f"⚠️  {game.platform} game '{game.name}' missing optional: {', '.join(missing_optional)}")
+            elif missing_optional and self.show_details:
+                report_lines.append(f"⚠️  {game.platform} game '{game.name}' missing optional: {', '.join(missing_optional)}")
+
+        if report_lines:
+            print('\n'.join(report_lines))
 
         print(f"\nOther games checked: {len(self.other_games_data.get('games', {}))}")
         if other_issues == 0:
@@ -246,20 +280,23 @@ class DataQualityChecker:
         print("\n\n5. CHECKING FOR STALE DATA")
         print("-" * 50)
 
-        stale_threshold = datetime.now() - timedelta(days=30)  # 30 days
+        now = datetime.now()
+        stale_threshold = now - timedelta(days=30)  # 30 days
         stale_steam = 0
         stale_other = 0
+        report_lines: list[str] = []
 
         for app_id, game in self.steam_data.get('games', {}).items():
             if game.last_updated:
                 try:
                     last_updated_date = datetime.fromisoformat(game.last_updated)
                     if last_updated_date < stale_threshold:
-                        days_old = (datetime.now() - last_updated_date).days
-                        print(f"🕐 Steam game {app_id} ({game.name}) is {days_old} days old")
+                        if self.show_details:
+                            days_old = (now - last_updated_date).days
+                            report_lines.append(f"🕐 Steam game {app_id} ({game.name}) is {days_old} days old")
                         stale_steam += 1
                 except ValueError:
-                    print(f"❌ Steam game {app_id} has invalid last_updated format: {game.last_updated}")
+                    report_lines.append(f"❌ Steam game {app_id} has invalid last_updated format: {game.last_updated}")
 
         for other_game in self.other_games_data.get('games', {}).values():
             last_updated = other_game.last_updated
@@ -267,11 +304,17 @@ class DataQualityChecker:
                 try:
                     last_updated_date = datetime.fromisoformat(last_updated)
                     if last_updated_date < stale_threshold:
-                        days_old = (datetime.now() - last_updated_date).days
-                        print(f"🕐 {other_game.platform} game '{other_game.name}' is {days_old} days old")
+                        if self.show_details:
+                            days_old = (now - last_updated_date).days
+                            report_lines.append(f"🕐 {other_game.platform} game '{other_game.name}' is {days_old} days old")
                         stale_other += 1
                 except ValueError:
-                    print(f"❌ {other_game.platform} game has invalid last_updated format: {last_updated}")
+                    report_lines.append(f"❌ {other_game.platform} game has invalid last_updated format: {last_updated}")
+
+        if report_lines:
+            print('\n'.join(report_lines))
+
+        self._stale_counts = (stale_steam, stale_other)
 
         if stale_steam == 0 and stale_other == 0:
             print("✅ No stale game data found")
@@ -290,30 +333,24 @@ class DataQualityChecker:
         videos_missing_games = 0
 
         for channel_id in channels_config:
-            videos_file = self.project_root / 'data' / f'videos-{channel_id}.json'
-            if videos_file.exists():
-                with videos_file.open() as f:
-                    channel_data = json.load(f)
-                for video in channel_data.get('videos', {}).values():
+            channel_videos = self._load_channel_videos(channel_id)
+            if channel_videos is not None:
+                for video in channel_videos.values():
                     total_videos += 1
-                    has_game = bool(video.get('steam_app_id') or video.get('itch_url') or video.get('crazygames_url'))
-
-                    # Check if this video has a detected game that's intentionally skipped
-                    youtube_detected_game = video.get('youtube_detected_game', '')
-                    is_intentionally_skipped = any(skip_game.lower() in youtube_detected_game.lower()
-                                                 for skip_game in self.skip_steam_matching_games)
-
-                    if has_game or is_intentionally_skipped:
+                    if video['has_game']:
                         videos_with_games += 1
                     else:
                         videos_missing_games += 1
 
-        # Count stale games
-        stale_threshold = datetime.now() - timedelta(days=30)
-        stale_steam = sum(1 for game in self.steam_data.get('games', {}).values()
-                         if game.last_updated and datetime.fromisoformat(game.last_updated) < stale_threshold)
-        stale_other = sum(1 for game in self.other_games_data.get('games', {}).values()
-                         if game.last_updated and datetime.fromisoformat(game.last_updated) < stale_threshold)
+        # Count stale games, reusing the stale data check's counts when it already ran
+        if self._stale_counts is not None:
+            stale_steam, stale_other = self._stale_counts
+        else:
+            stale_threshold = datetime.now() - timedelta(days=30)
+            stale_steam = sum(1 for game in self.steam_data.get('games', {}).values()
+                             if game.last_updated and datetime.fromisoformat(game.last_updated) < stale_threshold)
+            stale_other = sum(1 for game in self.other_games_data.get('games', {}).values()
+                             if game.last_updated and datetime.fromisoformat(game.last_updated) < stale_threshold)
 
         print(f"📊 Total videos: {total_videos}")
         print(f"📊 Videos with games: {videos_with_games}")
@@ -3,18 +3,60 @@ Game inference and Steam matching utilities
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 import requests
 
+from .constants import HTTP_TIMEOUT_SECONDS, STEAM_SEARCH_CACHE_SIZE
 from .utils import extract_potential_game_names
 
 
+@lru_cache(maxsize=4096)
+def name_words(name: str) -> frozenset[str]:
+    """Lowercased word set of a game name, cached since the same Steam names come back across searches"""
+    return frozenset(name.lower().split())
+
+
 class GameInferenceEngine:
     """Handles game name inference and Steam matching"""
 
+    def __init__(self) -> None:
+        # Shared session so store searches and availability checks reuse keep-alive connections
+        self.session = requests.Session()
+        # Successful store search results by query; many videos infer the same names.
+        # Both caches are LRU-bounded since a long backfill sees an open-ended set of names.
+        self._search_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        # Best matches by (name, threshold), the same detected game recurs across many uploads
+        self._match_cache: OrderedDict[tuple[str, float], dict[str, Any] | None] = OrderedDict()
+        # Searches run from worker threads, so cache reads and evictions are serialised
+        self._cache_lock = threading.Lock()
+
+    def _cache_lookup(self, cache: OrderedDict[Any, Any], key: Any) -> tuple[bool, Any]:
+        """Get (found, value) from an LRU cache, marking the entry as recently used"""
+        with self._cache_lock:
+            if key not in cache:
+                return False, None
+            cache.move_to_end(key)
+            return True, cache[key]
+
+    def _cache_store(self, cache: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+        """Add an entry to an LRU cache, evicting the least recently used one when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > STEAM_SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+
     def search_steam_games(self, query: str) -> list[dict[str, Any]]:
         """Search Steam for games by name"""
+        found, cached = self._cache_lookup(self._search_cache, query)
+        if found:
+            return list(cached)
+
         url = "https://store.steampowered.com/api/storesearch/"
         params = {
             'term': query,
@@ -23,18 +65,49 @@ class GameInferenceEngine:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=HTTP_TIMEOUT_SECONDS)
             if response.status_code == 200:
                 data = response.json()
                 items = data.get('items', [])
-                return items if isinstance(items, list) else []
+                results = items if isinstance(items, list) else []
+                self._cache_store(self._search_cache, query, results)
+                return list(results)
         except Exception as e:
             logging.error(f"Error searching Steam for '{query}': {e}")
 
         return []
 
+    def search_steam_games_concurrently(self, queries: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Search Steam for several names in parallel, keyed by query"""
+        unique_queries = list(dict.fromkeys(queries))
+        if not unique_queries:
+            return {}
+
+        from .constants import STEAM_SEARCH_WORKERS
+        with ThreadPoolExecutor(max_workers=STEAM_SEARCH_WORKERS, thread_name_prefix='steam-search') as executor:
+            return dict(zip(unique_queries, executor.map(self.search_steam_games, unique_queries), strict=True))
+
+    def _word_overlap_confidence(self, search_words: frozenset[str], steam_game_name: str) -> float:
+        """Calculate similarity (simple word overlap) between pre-split search words and a Steam name"""
+        game_words = name_words(steam_game_name)
+        overlap = len(search_words & game_words)
+        return overlap / max(len(search_words), len(game_words))
+
     def find_steam_match(self, game_name: str, confidence_threshold: float = 0.5) -> dict[str, Any] | None:
         """Find best Steam match for a game name with confidence scoring"""
+        cache_key = (game_name, confidence_threshold)
+        found, cached = self._cache_lookup(self._match_cache, cache_key)
+        if found:
+            return dict(cached) if cached else None
+
+        match = self._find_steam_match_uncached(game_name, confidence_threshold)
+        # Only remember outcomes backed by a successful search, failed requests are retried next time
+        if game_name in self._search_cache:
+            self._cache_store(self._match_cache, cache_key, dict(match) if match else None)
+        return match
+
+    def _find_steam_match_uncached(self, game_name: str, confidence_threshold: float) -> dict[str, Any] | None:
+        """Search Steam and score the top results against the game name"""
         try:
             results = self.search_steam_games(game_name)
             if not results:
@@ -42,20 +115,16 @@ class GameInferenceEngine:
 
             best_match = None
             best_confidence = 0.0
+            search_words = name_words(game_name)
 
             for result in results[:3]:  # Check top 3 results
-                steam_game_name = result['name'].lower()
-                search_name = game_name.lower()
-
-                # Calculate similarity (simple word overlap)
-                search_words = set(search_name.split())
-                game_words = set(steam_game_name.split())
-                overlap = len(search_words & game_words)
-                confidence = overlap / max(len(search_words), len(game_words))
+                confidence = self._word_overlap_confidence(search_words, result['name'])
 
                 if confidence > best_confidence and confidence > confidence_threshold:
                     best_match = result
                     best_confidence = confidence
+                    if best_confidence == 1.0:
+                        break  # Exact word match, later results can't score higher
 
             if best_match:
                 return {
@@ -70,10 +139,14 @@ class GameInferenceEngine:
             logging.error(f"Error finding Steam match for '{game_name}': {e}")
             return None
 
-    def find_steam_match_interactive(self, game_name: str, confidence_threshold: float = 0.5) -> dict[str, Any] | None:
-        """Find Steam match with interactive prompting for low confidence results"""
+    def find_steam_match_interactive(self, game_name: str, confidence_threshold: float = 0.5,
+                                     search_results: list[dict[str, Any]] | None = None) -> dict[str, Any] | None:
+        """Find Steam match with interactive prompting for low confidence results
+
+        search_results can carry an already fetched search for game_name to skip the request.
+        """
         try:
-            results = self.search_steam_games(game_name)
+            results = search_results if search_results is not None else self.search_steam_games(game_name)
             if not results:
                 print(f"      ❌ No Steam search results for '{game_name}'")
                 return None
@@ -81,22 +154,19 @@ class GameInferenceEngine:
             best_match = None
             best_confidence = 0.0
             low_confidence_matches = []
+            search_words = name_words(game_name)
 
             # Check all results
             for result in results[:5]:  # Check top 5 instead of 3
-                steam_game_name = result['name']
-                search_name = game_name.lower()
-
                 # Calculate similarity (same logic as find_steam_match)
-                search_words = set(search_name.split())
-                game_words = set(steam_game_name.lower().split())
-                overlap = len(search_words & game_words)
-                confidence = overlap / max(len(search_words), len(game_words))
+                confidence = self._word_overlap_confidence(search_words, result['name'])
 
                 if confidence >= confidence_threshold:
                     if confidence > best_confidence:
                         best_match = result
                         best_confidence = confidence
+                        if best_confidence == 1.0:
+                            break  # Exact word match, later results can't score higher
                 elif confidence >= 0.3:  # Low confidence but potentially valid
                     low_confidence_matches.append((result, confidence))
 
@@ -151,7 +221,7 @@ class GameInferenceEngine:
         """Check if Steam app is still available"""
         url = f"https://store.steampowered.com/app/{app_id}"
         try:
-            response = requests.head(url, timeout=5)
+            response = self.session.head(url, timeout=5)
             if response.status_code == 404:
                 return "depublished"
             elif response.status_code == 200:
@@ -37,10 +37,17 @@ class ItchDataFetcher(BaseFetcher):
             self.headers['Cookie'] = itch_cookies
             logging.info("Using Itch.io authentication token for enhanced data access")
 
-    def fetch_data(self, itch_url: str) -> OtherGameData | None:
+    def fetch_data(self, itch_url: str, existing_data: OtherGameData | None = None) -> OtherGameData | None:
         """Fetch game data from Itch.io"""
         try:
-            response = requests.get(itch_url, headers=self.headers)
+            headers = self.headers
+            if existing_data and not existing_data.is_stub:
+                headers = self._conditional_headers(existing_data.page_etag, existing_data.page_last_modified)
+            response = requests.get(itch_url, headers=headers)
+            if response.status_code == 304 and existing_data:
+                logging.debug(f"Itch.io page not modified for {itch_url}, reusing cached data")
+                return existing_data.model_copy()
+
             if response.status_code != 200:
                 # Only create stub entry if the game is referenced by videos
                 if self.data_manager and self.data_manager.is_game_referenced_by_videos('itch', itch_url):
@@ -69,7 +76,9 @@ class ItchDataFetcher(BaseFetcher):
                 is_free=True,  # Most itch games are free or pay-what-you-want
                 release_date=self._extract_release_date(soup),
                 header_image=self._extract_header_image(soup),
-                tags=self._extract_tags(soup)
+                tags=self._extract_tags(soup),
+                page_etag=response.headers.get('ETag'),
+                page_last_modified=response.headers.get('Last-Modified')
             )
 
             # Extract rating information
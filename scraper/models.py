@@ -31,6 +31,7 @@ class VideoData(BaseModel):
     published_at: str
     thumbnail: str = ""
     youtube_detected_game: str | None = None
+    youtube_detection_checked: str | None = None  # ISO timestamp of the last YouTube detection that found no game
     inference_reason: str | None = None
     last_updated: str = Field(default_factory=lambda: datetime.now().isoformat())
     game_references: list[VideoGameReference] = Field(default_factory=list)
@@ -80,6 +81,10 @@ class SteamGameData(BaseModel):
     is_on_sale: bool = False  # True if discount_percent > 0
     last_updated: str = Field(default_factory=lambda: datetime.now().isoformat())
 
+    # Store page cache validators for conditional GETs
+    store_page_etag: str | None = None  # ETag header of the last fetched store page
+    store_page_last_modified: str | None = None  # Last-Modified header of the last fetched store page
+
     # Removal detection fields
     removal_detected: str | None = None  # Date when removal was detected
     removal_pending: bool = False  # True if game needs removal processing
@@ -119,6 +124,8 @@ class OtherGameData(BaseModel):
     review_count: int | None = None
     steam_url: str = ""  # Steam link if found and name matches
     last_updated: str = Field(default_factory=lambda: datetime.now().isoformat())
+    page_etag: str | None = None  # ETag header of the last fetched game page
+    page_last_modified: str | None = None  # Last-Modified header of the last fetched game page
     is_stub: bool = False  # True if this is a stub entry for a failed fetch
     stub_reason: str | None = None  # Reason for stub creation (e.g., "HTTP 400", "Not found")
     resolved_to: str | None = None  # URL this stub should resolve to
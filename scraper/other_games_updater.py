@@ -6,6 +6,7 @@ similar to the Steam updater approach.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -33,13 +34,13 @@ class OtherGamesUpdater:
     4. Using platform-specific fetchers for individual game fetching
     """
 
-    def __init__(self) -> None:
+    def __init__(self, config_manager: ConfigManager | None = None) -> None:
         # Get project root
         script_dir = Path(__file__).resolve().parent
         project_root = script_dir.parent
 
-        self.data_manager = DataManager(project_root)
-        self.config_manager = ConfigManager(project_root)
+        self.config_manager = config_manager or ConfigManager(project_root)
+        self.data_manager = DataManager(project_root, config_manager=self.config_manager)
         self.other_games_data = self.data_manager.load_other_games_data()
         self.itch_fetcher = ItchDataFetcher(self.data_manager)
         self.crazygames_fetcher = CrazyGamesDataFetcher()
@@ -206,11 +207,12 @@ class OtherGamesUpdater:
 
     def _fetch_game_data(self, url: str, platform: str) -> OtherGameData | None:
         """Fetch game data for the specified platform and URL"""
+        existing_game = self.other_games_data.get('games', {}).get(url)
         try:
             if platform == 'itch':
-                return self.itch_fetcher.fetch_data(url)
+                return self.itch_fetcher.fetch_data(url, existing_game)
             elif platform == 'crazygames':
-                return self.crazygames_fetcher.fetch_data(url)
+                return self.crazygames_fetcher.fetch_data(url, existing_game)
             else:
                 logging.error(f"Unknown platform: {platform}")
                 return None
@@ -218,6 +220,19 @@ class OtherGamesUpdater:
             logging.error(f"Error fetching {platform} game {url}: {e}")
             return None
 
+    def _fetch_games_concurrently(self, games: list[tuple[str, str]]) -> list[OtherGameData | None]:
+        """Fetch game data for several (url, platform) pairs in parallel, in input order
+
+        Page fetches are independent network round-trips, so they run concurrently and callers
+        apply the results sequentially.
+        """
+        if not games:
+            return []
+
+        from .constants import OTHER_GAMES_FETCH_WORKERS
+        with ThreadPoolExecutor(max_workers=OTHER_GAMES_FETCH_WORKERS, thread_name_prefix='other-games') as executor:
+            return list(executor.map(self._fetch_game_data, [url for url, _ in games], [platform for _, platform in games]))
+
     def update_games_from_channels(self, channel_ids: list[str], max_updates: int | None = None,
                                    pending_scrapers: list['YouTubeSteamScraper'] | None = None) -> int:
         """
@@ -304,7 +319,10 @@ class OtherGamesUpdater:
             else:
                 logging.info(f"Updating {platform} game: {url} ({reason})")
 
-            game_data = self._fetch_game_data(url, platform)
+        for (url, platform, _), game_data in zip(
+            games_to_update, self._fetch_games_concurrently([(url, platform) for url, platform, _ in games_to_update]),
+            strict=True
+        ):
             if game_data:
                 # Update timestamp and store object directly
                 game_data.last_updated = datetime.now().isoformat()
@@ -354,6 +372,7 @@ class OtherGamesUpdater:
 
         logging.info(f"Updating {total_games} existing other platform games...")
 
+        games_to_update = []
         for url, game_data in games.items():
             platform = game_data.platform
             game_name = game_data.name or "Unknown"
@@ -364,21 +383,7 @@ class OtherGamesUpdater:
                 should_update, reason = self._should_update_game(url, game_data)
 
             if should_update:
-                refresh_interval_days = self._calculate_refresh_interval(game_data)
-                release_date_info = self._get_release_date_info(game_data)
-                GameUpdateLogger.log_game_update_start(platform, game_name, game_data.last_updated,
-                                                     refresh_interval_days, reason, release_info=release_date_info)
-
-                updated_data = self._fetch_game_data(url, platform)
-
-                if updated_data:
-                    # Update timestamp and store object directly
-                    updated_data.last_updated = datetime.now().isoformat()
-                    self.other_games_data['games'][url] = updated_data
-                    updated_count += 1
-                    GameUpdateLogger.log_game_update_success(updated_data.name)
-                else:
-                    GameUpdateLogger.log_game_update_failure(url, platform)
+                games_to_update.append((url, game_data, reason))
             else:
                 # Log skip info with detailed reason
                 refresh_interval_days = self._calculate_refresh_interval(game_data)
@@ -386,6 +391,26 @@ class OtherGamesUpdater:
                 GameUpdateLogger.log_game_skip(platform, game_name, game_data.last_updated,
                                              refresh_interval_days, reason, release_date_info)
 
+        for _, game_data, reason in games_to_update:
+            refresh_interval_days = self._calculate_refresh_interval(game_data)
+            release_date_info = self._get_release_date_info(game_data)
+            GameUpdateLogger.log_game_update_start(game_data.platform, game_data.name or "Unknown", game_data.last_updated,
+                                                 refresh_interval_days, reason, release_info=release_date_info)
+
+        for (url, game_data, _), updated_data in zip(
+            games_to_update,
+            self._fetch_games_concurrently([(url, game_data.platform) for url, game_data, _ in games_to_update]),
+            strict=True
+        ):
+            if updated_data:
+                # Update timestamp and store object directly
+                updated_data.last_updated = datetime.now().isoformat()
+                self.other_games_data['games'][url] = updated_data
+                updated_count += 1
+                GameUpdateLogger.log_game_update_success(updated_data.name)
+            else:
+                GameUpdateLogger.log_game_update_failure(url, game_data.platform)
+
         if updated_count > 0:
             self._save_other_games_data()
             logging.info(f"Other games refresh completed. Updated {updated_count}/{total_games} games")
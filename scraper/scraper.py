@@ -5,6 +5,9 @@ YouTube Channel Video Scraper with Steam Game Data Integration
 
 import json
 import logging
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -17,20 +20,21 @@ from .game_inference import GameInferenceEngine
 from .game_unifier import load_all_unified_games
 from .models import SteamGameData, VideoData
 from .steam_fetcher import SteamDataFetcher
+from .utils import save_data
 from .video_processor import VideoProcessor
-from .youtube_extractor import YouTubeExtractor
+from .youtube_extractor import YouTubeDetectionError, YouTubeExtractor
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class YouTubeSteamScraper:
-    def __init__(self, channel_id: str):
+    def __init__(self, channel_id: str, config_manager: ConfigManager | None = None):
         # Get the directory of this script, then build paths relative to project root
         script_dir = Path(__file__).resolve().parent
         project_root = script_dir.parent
 
         # Initialize managers and utilities
-        self.config_manager = ConfigManager(project_root)
-        self.data_manager = DataManager(project_root)
+        self.config_manager = config_manager or ConfigManager(project_root)
+        self.data_manager = DataManager(project_root, config_manager=self.config_manager)
         self.youtube_extractor = YouTubeExtractor()
         self.game_inference = GameInferenceEngine()
 
@@ -51,6 +55,9 @@ class YouTubeSteamScraper:
             self.game_inference, self.other_games_data
         )
 
+        # Read-only parsed channel video files, keyed by path and reused while the file's mtime is unchanged
+        self._channel_cache: dict[Path, tuple[int, dict[str, Any]]] = {}
+
 
 
     def save_videos(self) -> None:
@@ -85,8 +92,8 @@ class YouTubeSteamScraper:
         self.save_videos()
         return updated_count
 
-    def get_channel_videos_lightweight(self, channel_url: str, skip_count: int, batch_size: int) -> list[dict[str, Any]]:
-        """Fetch lightweight video info (just IDs and titles) from YouTube channel"""
+    def get_channel_videos_lightweight(self, channel_url: str, skip_count: int, batch_size: int) -> Iterator[dict[str, Any]]:
+        """Yield lightweight video info (just IDs and titles) from YouTube channel"""
         return self.video_processor.get_channel_videos_lightweight(channel_url, skip_count, batch_size)
 
 
@@ -101,7 +108,7 @@ class YouTubeSteamScraper:
         script_dir = Path(__file__).resolve().parent
         project_root = script_dir.parent
 
-        quality_checker = DataQualityChecker(project_root, self.steam_data, self.other_games_data)
+        quality_checker = DataQualityChecker(project_root, self.steam_data, self.other_games_data, self.config_manager)
         return quality_checker.check_data_quality(channels_config)
 
     def search_steam_games(self, query: str) -> list[dict[str, Any]]:
@@ -112,9 +119,10 @@ class YouTubeSteamScraper:
         """Find best Steam match for a game name with confidence scoring"""
         return self.game_inference.find_steam_match(game_name, confidence_threshold)
 
-    def find_steam_match_interactive(self, game_name: str, confidence_threshold: float = 0.5) -> dict[str, Any] | None:
+    def find_steam_match_interactive(self, game_name: str, confidence_threshold: float = 0.5,
+                                     search_results: list[dict[str, Any]] | None = None) -> dict[str, Any] | None:
         """Find Steam match with interactive prompting for low confidence results"""
-        return self.game_inference.find_steam_match_interactive(game_name, confidence_threshold)
+        return self.game_inference.find_steam_match_interactive(game_name, confidence_threshold, search_results)
 
 
     def _should_process_video_for_inference(self, video: dict[str, Any]) -> str | None:
@@ -125,11 +133,12 @@ class YouTubeSteamScraper:
             return "no_game_data"
 
         # Case 2: Has Steam references but they're missing from our database
+        steam_games = self.steam_data.get('games', {})
         for game_ref in game_references:
             if game_ref.get('platform') == 'steam':
                 steam_app_id = game_ref.get('platform_id')
                 if steam_app_id:
-                    game_data = self.steam_data.get('games', {}).get(steam_app_id)
+                    game_data = steam_games.get(steam_app_id)
                     if not game_data:
                         return "missing_steam_game"
                     # Case 3: Has Steam reference but it points to an unresolved stub
@@ -159,41 +168,42 @@ class YouTubeSteamScraper:
 
         for channel_id in channels_config:
             videos_file = project_root / 'data' / f'videos-{channel_id}.json'
-            if not videos_file.exists():
+            try:
+                with videos_file.open() as f:
+                    channel_data = json.load(f)
+            except FileNotFoundError:
                 print(f"⚠️  Missing video file for channel {channel_id}: {videos_file}")
                 continue
 
-            with videos_file.open() as f:
-                channel_data = json.load(f)
-
             print(f"\n📺 Processing channel: {channel_id}")
 
-            # Find videos that need processing
+            # Find videos that need processing, categorizing them in the same pass
             videos_to_process = []
-            for video_id, video in channel_data.get('videos', {}).items():
+            reason_counts: Counter[str] = Counter()
+            for video in channel_data.get('videos', {}).values():
                 process_reason = self._should_process_video_for_inference(video)
                 if process_reason:
-                    videos_to_process.append((video_id, video, process_reason))
+                    videos_to_process.append((video, process_reason))
+                    reason_counts[process_reason] += 1
 
             if not videos_to_process:
                 print("   ✅ All videos have valid game data")
                 continue
 
-            # Categorize videos
-            no_game_data = [v for v in videos_to_process if v[2] == "no_game_data"]
-            missing_steam = [v for v in videos_to_process if v[2] == "missing_steam_game"]
-            stub_entries = [v for v in videos_to_process if v[2] == "stub_entry"]
-
-            print(f"   🔍 Found {len(no_game_data)} videos without game data")
-            print(f"   🔍 Found {len(missing_steam)} videos with missing Steam games")
-            print(f"   🔍 Found {len(stub_entries)} videos with unresolved stub entries")
+            print(f"   🔍 Found {reason_counts['no_game_data']} videos without game data")
+            print(f"   🔍 Found {reason_counts['missing_steam_game']} videos with missing Steam games")
+            print(f"   🔍 Found {reason_counts['stub_entry']} videos with unresolved stub entries")
 
             channel_games_found = 0
             channel_missing_resolved = 0
             channel_stubs_resolved = 0
+            matched_app_ids: list[str] = []  # Full game data is fetched for all matches after the channel's loop
+            inferred_at = datetime.now().isoformat()  # Shared by every video inferred in this channel pass
+            channel_videos_changed = False  # Missing games resolved by a direct fetch leave the videos untouched
+            channel_detections_checked = False  # Probe results are stamped on the videos even without a match
 
             # Process all videos that need inference
-            for _video_id, video, reason in videos_to_process:
+            for video, reason in videos_to_process:
                 total_videos_processed += 1
                 title = video.get('title', '')
 
@@ -226,6 +236,7 @@ class YouTubeSteamScraper:
                         # Mark the original as broken and try to find alternatives
                         video['broken_app_id'] = missing_app_id
                         video['steam_app_id'] = None  # Clear so we can find alternative
+                        channel_videos_changed = True
 
                     else:
                         print(f"      ❓ Steam app {missing_app_id} status unknown, searching for alternatives...")
@@ -253,8 +264,20 @@ class YouTubeSteamScraper:
                 # First try YouTube detection as it's more reliable than title parsing
                 potential_names = []
 
-                print("      🔍 Trying YouTube game detection...")
-                detected_game = self.extract_youtube_detected_game(video.get('video_id'))
+                detected_game = video.get('youtube_detected_game')
+                if not detected_game and VideoProcessor.youtube_detection_recently_checked(
+                        video.get('youtube_detection_checked')):
+                    print("      ⏭️  YouTube detection recently found no game, skipping")
+                elif not detected_game:
+                    print("      🔍 Trying YouTube game detection...")
+                    try:
+                        detected_game = self.extract_youtube_detected_game(video.get('video_id'))
+                    except YouTubeDetectionError as e:
+                        print(f"      ⚠️  YouTube detection failed: {e}")
+                    else:
+                        # Remember a page without a detected game so later runs skip the probe
+                        video['youtube_detection_checked'] = None if detected_game else datetime.now().isoformat()
+                        channel_detections_checked = True
                 if detected_game:
                     print(f"      🎮 YouTube detected: {detected_game}")
                     potential_names.append(detected_game)
@@ -286,11 +309,13 @@ class YouTubeSteamScraper:
                     print(f"      🚫 Steam matching skipped for {skipped_names} (in config skip list)")
                     continue
 
-                # Search Steam for each potential name
+                # Search Steam for all potential names up front, then match each one (possibly prompting) in order
                 best_match = None
+                search_results = self.game_inference.search_steam_games_concurrently(potential_names)
 
                 for name in potential_names:
-                    steam_match = self.find_steam_match_interactive(name, confidence_threshold=0.5)
+                    steam_match = self.find_steam_match_interactive(name, confidence_threshold=0.5,
+                                                                    search_results=search_results[name])
                     if steam_match and (not best_match or steam_match['confidence'] > best_match['confidence']):
                             best_match = steam_match
 
@@ -315,24 +340,19 @@ class YouTubeSteamScraper:
                         video['steam_app_id'] = app_id
                         video['inferred_game'] = True  # Mark as inferred for review
                         video['inference_reason'] = reason
-                        video['last_updated'] = datetime.now().isoformat()
+                        video['last_updated'] = inferred_at
+                        channel_videos_changed = True
 
                     # Store YouTube detection info if it was used
                     if detected_game:
                         video['youtube_detected_game'] = detected_game
                         if detected_game == best_match['name']:
                             video['youtube_detected_matched'] = True
+                        channel_videos_changed = True
 
-                    # Fetch full game data
-                    try:
-                        steam_url = f"https://store.steampowered.com/app/{app_id}"
-                        steam_data = self.fetch_steam_data(steam_url)
-                        if steam_data:
-                            steam_data = steam_data.model_copy(update={'last_updated': datetime.now().isoformat()})
-                            self.steam_data['games'][app_id] = steam_data
-                            print(f"      📊 Fetched game metadata: {steam_data.name}")
-                    except Exception as e:
-                        logging.error(f"      ❌ Error fetching Steam data for {app_id}: {e}")
+                    # Queue full game data fetch
+                    if app_id not in matched_app_ids:
+                        matched_app_ids.append(app_id)
 
                     games_found += 1
                     if reason == "stub_entry":
@@ -346,19 +366,20 @@ class YouTubeSteamScraper:
                 else:
                     print("      ❌ No confident matches found on Steam")
 
-            # Save updated video data and steam data
-            if channel_games_found > 0 or channel_missing_resolved > 0:
-                with videos_file.open('w') as f:
-                    json.dump(channel_data, f, indent=2, sort_keys=True)
+            self._fetch_matched_steam_games(matched_app_ids)
+
+            # Save updated video data, skipping the rewrite when no video was actually modified
+            if (((channel_games_found > 0 or channel_missing_resolved > 0) and channel_videos_changed)
+                    or channel_detections_checked):
+                save_data(channel_data, videos_file, compact=self.config_manager.get_compact_json())
                 print(f"   💾 Saved {channel_games_found} game inferences and {channel_missing_resolved} resolved missing games for {channel_id}")
 
             if channel_stubs_resolved > 0:
-                self.data_manager.save_steam_data(self.steam_data)
-                print(f"   💾 Saved {channel_stubs_resolved} resolved stub entries")
+                print(f"   🔗 Resolved {channel_stubs_resolved} stub entries (saved with Steam data at the end)")
                 stubs_resolved += channel_stubs_resolved
 
-        # Save updated Steam data
-        if games_found > 0 or missing_resolved > 0:
+        # Save updated Steam data once for all channels, including resolved stubs
+        if games_found > 0 or missing_resolved > 0 or stubs_resolved > 0:
             self.save_steam()
 
         print("\n" + "="*80)
@@ -382,6 +403,40 @@ class YouTubeSteamScraper:
 
         return games_found + missing_resolved + stubs_resolved
 
+    def _fetch_matched_steam_games(self, app_ids: list[str]) -> None:
+        """Fetch full game data for matched Steam apps concurrently and store it"""
+        if not app_ids:
+            return
+
+        from .constants import STEAM_FETCH_WORKERS
+        with ThreadPoolExecutor(max_workers=STEAM_FETCH_WORKERS, thread_name_prefix='steam-match') as executor:
+            futures = {
+                app_id: executor.submit(self.fetch_steam_data, f"https://store.steampowered.com/app/{app_id}")
+                for app_id in app_ids
+            }
+
+        fetched_at = datetime.now().isoformat()
+        for app_id, future in futures.items():
+            try:
+                steam_data = future.result()
+                if steam_data:
+                    steam_data = steam_data.model_copy(update={'last_updated': fetched_at})
+                    self.steam_data['games'][app_id] = steam_data
+                    print(f"      📊 Fetched game metadata: {steam_data.name}")
+            except Exception as e:
+                logging.error(f"      ❌ Error fetching Steam data for {app_id}: {e}")
+
+    def _load_channel_videos_file(self, videos_file: Path) -> dict[str, Any]:
+        """Load a channel video file for reading, reusing the cached parse if the file hasn't changed"""
+        mtime_ns = videos_file.stat().st_mtime_ns
+        cached = self._channel_cache.get(videos_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        channel_data: dict[str, Any] = json.loads(videos_file.read_bytes())
+        self._channel_cache[videos_file] = (mtime_ns, channel_data)
+        return channel_data
+
     def _extract_game_names_from_videos_with_steam_id(self, steam_app_id: str) -> list[str]:
         """Extract potential game names from videos that reference a specific Steam app ID"""
         game_names = set()
@@ -392,8 +447,7 @@ class YouTubeSteamScraper:
 
         for videos_file in project_root.glob('data/videos-*.json'):
             try:
-                with videos_file.open() as f:
-                    channel_data = json.load(f)
+                channel_data = self._load_channel_videos_file(videos_file)
 
                 for video in channel_data.get('videos', {}).values():
                     if video.get('steam_app_id') == steam_app_id:
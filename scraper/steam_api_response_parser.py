@@ -6,18 +6,42 @@ Separated from HTTP and business logic for better maintainability.
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
+from .models import SteamGameData
+
+# Per currency: (price, original price) fields to set
+CURRENCY_PRICE_FIELDS = {
+    'EUR': ('price_eur', 'original_price_eur'),
+    'USD': ('price_usd', 'original_price_usd'),
+}
+
+
+@dataclass(slots=True)
+class PriceRow:
+    """Parsed price data for a single app, None meaning the API response didn't provide the field"""
+    is_on_sale: bool = False
+    is_free: bool | None = None
+    price_eur: int | None = None
+    original_price_eur: int | None = None
+    price_usd: int | None = None
+    original_price_usd: int | None = None
+    discount_percent: int | None = None  # Only set when non-zero
+    needs_full_refresh: bool = False
+
 
 class SteamApiResponseParser:
     """Parses Steam API responses into standardized format"""
 
-    def parse_bulk_response(self, response: dict[str, Any], app_ids: list[str], existing_games: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+    __slots__ = ()
+
+    def parse_bulk_response(self, response: dict[str, Any], app_ids: list[str], existing_games: dict[str, SteamGameData] | None = None) -> dict[str, PriceRow]:
         """Parse Steam bulk API response into standardized format"""
         results, _ = self.parse_bulk_response_with_removal_info(response, app_ids, existing_games)
         return results
 
-    def parse_bulk_response_with_removal_info(self, response: dict[str, Any], app_ids: list[str], existing_games: dict[str, Any] | None = None) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    def parse_bulk_response_with_removal_info(self, response: dict[str, Any], app_ids: list[str], existing_games: dict[str, SteamGameData] | None = None) -> tuple[dict[str, PriceRow], list[str]]:
         """
         Parse bulk Steam API response and return both successful results and removed games
 
@@ -34,6 +58,9 @@ class SteamApiResponseParser:
         results = {}
         removed_games = []
         existing_games = existing_games or {}
+        # Bound once, these run for every app in the batch
+        get_existing_game = existing_games.get
+        parse_app = self._parse_single_app_response
 
         for app_id in app_ids:
             app_data = response.get(app_id, {})
@@ -41,52 +68,44 @@ class SteamApiResponseParser:
             if not app_data.get('success', False):
                 # Steam explicitly said this game doesn't exist
                 removed_games.append(app_id)
-                logging.debug(f"Steam API returned success=false for app {app_id}")
                 continue
 
-            existing_game = existing_games.get(app_id)
-            parsed_data = self._parse_single_app_response(app_data.get('data', {}), app_id, existing_game)
-            if parsed_data:
+            parsed_data = parse_app(app_data.get('data', {}), app_id, get_existing_game(app_id))
+            if parsed_data is not None:
                 results[app_id] = parsed_data
 
+        # One summary line per batch rather than a log call for every removed app, formatted only when debug logging is on
+        if removed_games:
+            logging.debug("Steam API returned success=false for %d apps: %s", len(removed_games), removed_games)
+
         return results, removed_games
 
-    def _parse_single_app_response(self, app_data: dict[str, Any], app_id: str, existing_game: Any = None) -> dict[str, Any] | None:
+    def _parse_single_app_response(self, app_data: dict[str, Any], app_id: str, existing_game: SteamGameData | None = None) -> PriceRow | None:
         """Parse individual app response from Steam API"""
-        # Handle empty data array (Steam returns [] for free/demo/unreleased games)
-        if not app_data or isinstance(app_data, list):
+        # Whether the stored game had a price, checked once for all the transitions below
+        had_price = existing_game is not None and bool(existing_game.price_eur or existing_game.price_usd)
+
+        # Handle empty data, both {} and the empty array Steam returns for free/demo/unreleased games.
+        # The per-app skip messages use lazy %-formatting as they fire for every unpriced app in each batch
+        if not app_data:
             # Check if this game had pricing before but now doesn't (price disappeared)
-            if existing_game and (getattr(existing_game, 'price_eur', None) or getattr(existing_game, 'price_usd', None)):
+            if had_price:
                 logging.info(f"App {app_id} had pricing before but now has empty response - flagging for full refresh")
-                return {
-                    'needs_full_refresh': True,
-                    'price_eur': None,
-                    'price_usd': None,
-                    'original_price_eur': None,
-                    'original_price_usd': None,
-                    'is_on_sale': False
-                }
+                return PriceRow(needs_full_refresh=True)
             else:
                 # No existing price data, probably unreleased - skip
-                logging.debug(f"No data or empty data array for app {app_id} - skipping (no existing price data)")
+                logging.debug("No data or empty data array for app %s - skipping (no existing price data)", app_id)
                 return None
 
         price_overview = app_data.get('price_overview')
         if not price_overview:
             # Check if this game had pricing before but now doesn't (price disappeared)
-            if existing_game and (getattr(existing_game, 'price_eur', None) or getattr(existing_game, 'price_usd', None)):
+            if had_price:
                 logging.info(f"App {app_id} had pricing before but now has no price_overview - flagging for full refresh")
-                return {
-                    'needs_full_refresh': True,
-                    'price_eur': None,
-                    'price_usd': None,
-                    'original_price_eur': None,
-                    'original_price_usd': None,
-                    'is_on_sale': False
-                }
+                return PriceRow(needs_full_refresh=True)
             else:
                 # No existing price data and no price_overview - skip
-                logging.debug(f"No price_overview for app {app_id} - skipping (no existing price data)")
+                logging.debug("No price_overview for app %s - skipping (no existing price data)", app_id)
                 return None
 
         # Extract price information
@@ -95,45 +114,34 @@ class SteamApiResponseParser:
         initial_price_cents = price_overview.get('initial', final_price_cents)  # Original price in cents
         discount_percent = price_overview.get('discount_percent', 0)
 
+        # Derive the numeric decisions once, they feed both the refresh check and the row
+        has_price = final_price_cents > 0
+        is_on_sale = discount_percent > 0
+        has_original_price = initial_price_cents != final_price_cents and initial_price_cents > 0
+
         # Check if this game didn't have pricing before but now does (price appeared)
         needs_full_refresh = False
-        if (existing_game and
-            not (getattr(existing_game, 'price_eur', None) or getattr(existing_game, 'price_usd', None)) and
-            final_price_cents > 0):  # New pricing appeared
+        if existing_game is not None and not had_price and has_price:  # New pricing appeared
             logging.info(f"App {app_id} didn't have pricing before but now has price data - flagging for full refresh")
             needs_full_refresh = True
 
         # Determine which currency this is
-        is_eur = currency == 'EUR'
-        is_usd = currency == 'USD'
-
-        result = {
-            'is_free': final_price_cents == 0,
-            'is_on_sale': discount_percent > 0
-        }
-
-        if needs_full_refresh:
-            result['needs_full_refresh'] = True
-
-        # Only set discount_percent if it's non-zero
-        if discount_percent > 0:
-            result['discount_percent'] = discount_percent
-
-        # Set currency-specific fields (storing cents directly)
-        if is_eur:
-            result['price_eur'] = final_price_cents if final_price_cents > 0 else None
-            result['original_price_eur'] = initial_price_cents if initial_price_cents != final_price_cents and initial_price_cents > 0 else None
-            result['price_usd'] = None
-            result['original_price_usd'] = None
-        elif is_usd:
-            result['price_usd'] = final_price_cents if final_price_cents > 0 else None
-            result['original_price_usd'] = initial_price_cents if initial_price_cents != final_price_cents and initial_price_cents > 0 else None
-            result['price_eur'] = None
-            result['original_price_eur'] = None
-        else:
+        price_fields = CURRENCY_PRICE_FIELDS.get(currency)
+        if price_fields is None:
             # Unknown currency, skip
             logging.warning(f"Unknown currency {currency} for app {app_id}")
             return None
 
-        return result
+        # Set currency-specific fields (storing cents directly)
+        price_field, original_price_field = price_fields
+        return PriceRow(
+            is_on_sale=is_on_sale,
+            is_free=final_price_cents == 0,
+            discount_percent=discount_percent if is_on_sale else None,
+            needs_full_refresh=needs_full_refresh,
+            **{
+                price_field: final_price_cents if has_price else None,
+                original_price_field: initial_price_cents if has_original_price else None
+            }
+        )
 
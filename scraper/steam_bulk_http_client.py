@@ -5,23 +5,41 @@ Handles HTTP requests to Steam API with retry logic and rate limiting.
 Separated from business logic for better maintainability.
 """
 
+import json
+import threading
 import time
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 import requests
 
 from .constants import HTTP_TIMEOUT_SECONDS, USER_AGENT
 
+STEAM_APPDETAILS_URL = 'https://store.steampowered.com/api/appdetails'
+
 
 class SteamBulkHttpClient:
     """Handles HTTP requests to Steam API with retry logic"""
 
+    __slots__ = ('_rate_limit_lock', '_rate_limited_until', 'config', 'cookies', 'headers', 'session')
+
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
         self.headers = {
             'User-Agent': USER_AGENT
         }
         self.cookies = {'birthtime': '0', 'mature_content': '1'}
+        # Shared session so bulk batches, retries and single app requests reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.cookies.update(self.cookies)
+        # Steam sets country, language and session cookies on responses; keeping them would let one
+        # request change which store page variant later ones are served. No domain is allowed to set cookies,
+        # while the age gate cookies above are still sent with every request.
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # A 429 seen by one bulk worker pauses every worker sharing this client until the cooldown ends
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limited_until = 0.0
 
     def make_bulk_request(self, app_ids: list[str], country_code: str) -> dict[str, Any] | None:
         """Make a bulk price request to Steam API"""
@@ -31,6 +49,18 @@ class SteamBulkHttpClient:
         """Make a single app request to Steam API (for full game data)"""
         return self._make_steam_api_request([app_id], country_code)
 
+    def wait_for_rate_limit(self) -> None:
+        """Sleep out a rate limit cooldown set by any thread using this client"""
+        with self._rate_limit_lock:
+            remaining = self._rate_limited_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def set_rate_limit_cooldown(self, delay: float) -> None:
+        """Extend the shared rate limit cooldown to at least delay seconds from now"""
+        with self._rate_limit_lock:
+            self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
+
     def _make_steam_api_request(self, app_ids: list[str], country_code: str, filters: str | None = None) -> dict[str, Any] | None:
         """Make a request to Steam API with comprehensive retry logic
 
@@ -45,30 +75,34 @@ class SteamBulkHttpClient:
         from .bulk_fetch_error_handler import BulkFetchErrorHandler
         error_handler = BulkFetchErrorHandler(self.config)
 
-        # Build the request URL
-        app_ids_str = ','.join(app_ids)
-        url = f"https://store.steampowered.com/api/appdetails?appids={app_ids_str}&cc={country_code}"
+        # Build the query once, it is the same for every retry attempt. The app ids are
+        # deduplicated and sorted so the same set always maps to the same cacheable URL,
+        # the response is keyed by app id so callers don't depend on the order
+        params = {
+            'appids': ','.join(sorted(set(app_ids))),
+            'cc': country_code
+        }
 
         if filters:
-            url += f"&filters={filters}"
+            params['filters'] = filters
 
         max_retries = int(self.config.get('max_retries', 5))
 
         for attempt in range(max_retries):
+            self.wait_for_rate_limit()
             try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    cookies=self.cookies,
-                    timeout=HTTP_TIMEOUT_SECONDS
-                )
+                response = self.session.get(STEAM_APPDETAILS_URL, params=params, timeout=HTTP_TIMEOUT_SECONDS)
 
                 if response.status_code == 200:
-                    return response.json()
+                    # Decode the raw bytes directly instead of building response.text for large payloads
+                    try:
+                        return json.loads(response.content)
+                    except json.JSONDecodeError as e:
+                        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
                 elif response.status_code == 429:  # Rate limited
-                    should_retry, delay = error_handler.handle_rate_limit(attempt)
+                    should_retry, delay = error_handler.handle_rate_limit(attempt, response.headers.get('Retry-After'))
                     if should_retry:
-                        time.sleep(delay)
+                        self.set_rate_limit_cooldown(delay)
                         continue
                     else:
                         response.raise_for_status()  # Final failure
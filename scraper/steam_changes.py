@@ -8,11 +8,13 @@ import json
 import logging
 import re
 import subprocess
+import threading
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import IO, Any, ClassVar
 
 
 @dataclass
@@ -114,6 +116,82 @@ class CommitInfo:
             return self.date
 
 
+class GitBlobReader:
+    """Reads file contents at many revisions through one long-running `git cat-file --batch` process."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.process: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> 'GitBlobReader':
+        self.process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=str(self.project_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.process is None:
+            return
+        if exc_info[0] is not None:
+            # Stopped early, don't leave a pending request write blocked on git's unread output
+            self.process.kill()
+        if self.process.stdin:
+            self.process.stdin.close()
+        try:
+            self.process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        if self.process.stdout:
+            self.process.stdout.close()
+        self.process = None
+
+    def read_many(self, revisions: list[str]) -> Iterator[bytes | None]:
+        """Yield the blob named by each `<commit>:<path>` revision in order, or None if git reports it missing.
+
+        A writer thread queues all requests up front so git can look up and decompress the
+        next objects while the caller is still parsing the previous one.
+        """
+        stdin = self._pipes()[0]
+
+        def write_requests() -> None:
+            try:
+                stdin.write("".join(f"{revision}\n" for revision in revisions).encode())
+                stdin.flush()
+            except (OSError, ValueError):
+                pass  # Process went away or the reader was closed, the read side reports it
+
+        threading.Thread(target=write_requests, name='git-cat-file-writer', daemon=True).start()
+        for _ in revisions:
+            yield self._read_response()
+
+    def _pipes(self) -> tuple[IO[bytes], IO[bytes]]:
+        """Get the process's (stdin, stdout) pipes."""
+        if self.process is None or self.process.stdin is None or self.process.stdout is None:
+            raise RuntimeError("GitBlobReader used outside of its context")
+        return self.process.stdin, self.process.stdout
+
+    def _read_response(self) -> bytes | None:
+        """Read the next object from the batch output."""
+        stdout = self._pipes()[1]
+
+        # Header is "<sha> <type> <size>", or "<revision> missing" for unknown objects
+        header = stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file --batch exited unexpectedly")
+        parts = header.split()
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+
+        content = stdout.read(int(parts[2]))
+        stdout.read(1)  # Trailing newline after the object contents
+        return content if parts[1] == b'blob' else None
+
+
 class PriceChangeFormatter:
     """Handles formatting of price changes with discount logic."""
 
@@ -276,6 +354,7 @@ class SteamChangesAnalyzer:
         'tags', 'genres', 'categories', 'developers', 'publishers'
     ]
     MAX_FIELD_LENGTH: ClassVar[int] = 50
+    CURRENCY_SYMBOLS: ClassVar[dict[str, str]] = {'EUR': '€', 'USD': '$'}
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
@@ -375,55 +454,37 @@ class SteamChangesAnalyzer:
             return {}
 
         relative_path = self.steam_games_path.relative_to(self.project_root)
-        results = {}
-
-        # Batch process commits to reduce subprocess overhead
-        batch_size = 10  # Process commits in batches to avoid too-long command lines
-        for i in range(0, len(commits), batch_size):
-            batch = commits[i:i + batch_size]
-            batch_results = self._process_commit_batch(batch, relative_path)
-            results.update(batch_results)
-
-        return results
+        return self._process_commit_batch(commits, relative_path)
 
     def _process_commit_batch(self, commits: list[tuple[str, str]], relative_path: Path) -> dict[str, dict[str, Any]]:
-        """Process a batch of commits using git batch commands."""
+        """Process commits through a single pipelined git cat-file --batch process instead of one git call each."""
         results = {}
 
-        for commit_hash, _ in commits:
-            try:
-                # Use git cat-file for better performance than git show
-                cmd = ["git", "cat-file", "blob", f"{commit_hash}:{relative_path}"]
-
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=str(self.project_root),
-                    timeout=15  # Shorter timeout for individual operations
-                )
-
-                if result.returncode == 0:
+        try:
+            revisions = [f"{commit_hash}:{relative_path}" for commit_hash, _ in commits]
+            with GitBlobReader(self.project_root) as reader:
+                for (commit_hash, _), content in zip(commits, reader.read_many(revisions), strict=True):
                     try:
-                        data = json.loads(result.stdout)
-                        if isinstance(data, dict):
-                            results[commit_hash] = data
+                        if content is not None:
+                            try:
+                                data = json.loads(content)
+                                if isinstance(data, dict):
+                                    results[commit_hash] = data
+                                else:
+                                    logging.warning(f"Invalid data type from {commit_hash}: {type(data)}")
+                            except json.JSONDecodeError as e:
+                                logging.warning(f"JSON decode error for {commit_hash}: {e}")
                         else:
-                            logging.warning(f"Invalid data type from {commit_hash}: {type(data)}")
-                    except json.JSONDecodeError as e:
-                        logging.warning(f"JSON decode error for {commit_hash}: {e}")
-                else:
-                    # Fallback to git show for edge cases
-                    fallback_data = self.get_file_at_commit(commit_hash)
-                    if fallback_data:
-                        results[commit_hash] = fallback_data
+                            # Fallback to git show for edge cases
+                            fallback_data = self.get_file_at_commit(commit_hash)
+                            if fallback_data:
+                                results[commit_hash] = fallback_data
 
-            except subprocess.TimeoutExpired:
-                logging.warning(f"Timeout processing commit {commit_hash}")
-                continue
-            except Exception as e:
-                logging.warning(f"Error processing commit {commit_hash}: {e}")
-                continue
+                    except Exception as e:
+                        logging.warning(f"Error processing commit {commit_hash}: {e}")
+                        continue
+        except (OSError, RuntimeError) as e:
+            logging.error(f"Could not read commits through git cat-file: {e}")
 
         return results
 
@@ -453,15 +514,8 @@ class SteamChangesAnalyzer:
             if cents == 0:
                 return "Free"
 
-            # Convert cents to decimal amount
-            amount = cents / 100
-
-            if currency == 'EUR':
-                return f"€{amount:.2f}"
-            elif currency == 'USD':
-                return f"${amount:.2f}"
-            else:
-                return f"{amount:.2f}"
+            # Convert cents to decimal amount, prefixed with the currency symbol if known
+            return f"{self.CURRENCY_SYMBOLS.get(currency, '')}{cents / 100:.2f}"
         except (ValueError, TypeError):
             return value
 
@@ -512,7 +566,10 @@ class SteamChangesAnalyzer:
         """Find games that were modified."""
         changes = []
 
-        for game_id in set(old_games.keys()) & set(new_games.keys()):
+        # Key views intersect without copying either key set; identical entries can't have changes
+        for game_id in old_games.keys() & new_games.keys():
+            if old_games[game_id] == new_games[game_id]:
+                continue
             game_changes = self._analyze_single_game_changes(game_id, old_games[game_id], new_games[game_id])
             changes.extend(game_changes)
 
@@ -6,6 +6,8 @@ import json
 import logging
 import re
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -18,13 +20,63 @@ if TYPE_CHECKING:
 from .base_fetcher import BaseFetcher
 from .batch_manager import BatchManager
 from .bulk_fetch_error_handler import BulkFetchErrorHandler
-from .constants import HTTP_TIMEOUT_SECONDS, STEAM_BULK_DEFAULTS, USER_AGENT
+from .constants import HTTP_TIMEOUT_SECONDS, STEAM_BULK_DEFAULTS, STEAM_FETCH_WORKERS, USER_AGENT
 from .models import SteamGameData
-from .steam_api_response_parser import SteamApiResponseParser
+from .steam_api_response_parser import PriceRow, SteamApiResponseParser
 from .steam_bulk_http_client import SteamBulkHttpClient
 from .steam_price_update_service import PriceUpdateResult, SteamPriceUpdateService
 from .utils import extract_steam_app_id, is_valid_date_string
 
+# Fields populated from the store page, reused as-is when the page is not modified
+STORE_PAGE_FIELDS = (
+    'tags', 'is_demo', 'full_game_app_id', 'has_demo', 'demo_app_id', 'has_playtest',
+    'is_early_access', 'positive_review_percentage', 'review_count', 'review_summary',
+    'recent_review_percentage', 'recent_review_count', 'recent_review_summary',
+    'insufficient_reviews', 'planned_release_date', 'store_page_etag', 'store_page_last_modified'
+)
+
+
+# Steam renders the store page tags from an inline script call: InitAppTagModal( <appid>, [{"tagid":..., "name":...}, ...], ...)
+APP_TAG_MODAL_PATTERN = re.compile(r'InitAppTagModal\(\s*\d+\s*,\s*(\[[^\]]*\])', re.DOTALL)
+
+# Review summaries: "All Reviews: Very Positive (1,234) - 95% of the 1,234 user reviews ..."
+# "Overall Reviews:" is the older label and carries "(1,234 reviews)"
+# One pattern per label: the literal label prefix lets the regex engine skip ahead quickly, which a
+# single alternation over the labels can't, and the percentage may sit any distance after the label
+ALL_REVIEWS_PATTERN = re.compile(
+    r'All Reviews:\s*(?P<summary>[^\n\(]+)\s*\((?P<count>\d{1,3}(?:,\d{3})*)\s*\).*?(?P<percentage>\d+)%.*?\d',
+    re.IGNORECASE | re.DOTALL
+)
+OVERALL_REVIEWS_PATTERN = re.compile(
+    r'Overall Reviews:\s*(?P<summary>[^\n\(]+)\s*\((?P<count>\d{1,3}(?:,\d{3})*)\s*reviews?\).*?(?P<percentage>\d+)%.*?\d',
+    re.IGNORECASE | re.DOTALL
+)
+RECENT_REVIEWS_PATTERN = re.compile(
+    r'Recent Reviews:\s*(?P<summary>[^\n\(]+)\s*\((?P<count>\d{1,3}(?:,\d{3})*)\s*\).*?(?P<percentage>\d+)%.*?\d',
+    re.IGNORECASE | re.DOTALL
+)
+# Tried in order, the first pattern that matches anywhere in the page gives the count
+INSUFFICIENT_REVIEWS_PATTERNS = [
+    re.compile(r'Need more user reviews to generate a score.*?(\d+)\s*user review', re.IGNORECASE | re.DOTALL),
+    re.compile(r'(\d+)\s*user review.*?Need more user reviews', re.IGNORECASE | re.DOTALL),
+    re.compile(r'(\d+)\s*review.*?Need more.*?score', re.IGNORECASE | re.DOTALL),
+]
+
+# Coming soon date patterns, tried in order: the first pattern that matches anywhere wins
+PLANNED_RELEASE_DATE_PATTERNS = [
+    re.compile(r'Coming Soon.*?(\w+ \d{1,2},? \d{4})', re.IGNORECASE),  # "Coming Soon - January 15, 2025"
+    re.compile(r'Coming Soon.*?(\w+ \d{4})', re.IGNORECASE),            # "Coming Soon - March 2025"
+    re.compile(r'Coming Soon.*?(Q[1-4] \d{4})', re.IGNORECASE),         # "Coming Soon - Q2 2025"
+    re.compile(r'Coming Soon.*?(\d{4})', re.IGNORECASE),                # "Coming Soon - 2025"
+    re.compile(r'Release Date.*?(\w+ \d{1,2},? \d{4})', re.IGNORECASE), # "Release Date: January 15, 2025"
+    re.compile(r'Release Date.*?(\w+ \d{4})', re.IGNORECASE),           # "Release Date: March 2025"
+    re.compile(r'Release Date.*?(Q[1-4] \d{4})', re.IGNORECASE),        # "Release Date: Q2 2025"
+]
+RELEASE_DATE_LABEL_PATTERN = re.compile(r'Release Date:?\s*(.+)', re.IGNORECASE)
+APP_URL_ID_PATTERN = re.compile(r'/app/(\d+)')
+DEMO_CONTEXT_WINDOW_CHARS = 200
+DEMO_WORD_PATTERN = re.compile(r'demo', re.IGNORECASE)
+
 
 class RemovalDetectionResult(TypedDict):
     """Type definition for removal detection results"""
@@ -60,23 +112,29 @@ class SteamDataFetcher(BaseFetcher):
             'User-Agent': USER_AGENT
         }
         self.cookies = {'birthtime': '0', 'mature_content': '1'}
+        # Store page requests overlap the USD API request in fetch_data. The pool lives as long as the
+        # fetcher and is sized so every concurrent fetch_data caller can keep its store page in flight.
+        self._store_page_executor = ThreadPoolExecutor(max_workers=STEAM_FETCH_WORKERS, thread_name_prefix='steam-store-page')
 
     def _make_request_with_retry(self, url: str, request_type: str = "API", **kwargs: Any) -> requests.Response | None:
         """Make HTTP request with unified error handling and retry logic"""
 
         for attempt in range(int(self.config['max_retries'])):
+            # Store pages share the API client's session and rate limit cooldown, so one 429 pauses every worker
+            self.http_client.wait_for_rate_limit()
             try:
-                response = requests.get(url, timeout=HTTP_TIMEOUT_SECONDS, **kwargs)
+                response = self.http_client.session.get(url, timeout=HTTP_TIMEOUT_SECONDS, **kwargs)
 
                 if response.status_code == 429:  # Rate limited
-                    should_retry, delay = self.error_handler.handle_rate_limit(attempt)
+                    should_retry, delay = self.error_handler.handle_rate_limit(attempt, response.headers.get('Retry-After'))
                     if should_retry:
-                        time.sleep(delay)
+                        self.http_client.set_rate_limit_cooldown(delay)
                         continue
                     else:
                         return None
 
-                if response.status_code != 200:
+                # 304 Not Modified answers a conditional GET and is handled by the caller
+                if response.status_code not in (200, 304):
                     should_retry, delay = self.error_handler.handle_standard_retry(
                         response.status_code, attempt, request_type
                     )
@@ -108,6 +166,7 @@ class SteamDataFetcher(BaseFetcher):
 
             # First, get basic data from Steam API with EUR (Austria)
             api_data_eur = self._fetch_api_data(app_id, 'at')
+
             if not api_data_eur:
                 # Only create stub entry if the app is referenced by videos
                 if self.data_manager and self.data_manager.is_game_referenced_by_videos('steam', app_id):
@@ -132,21 +191,24 @@ class SteamDataFetcher(BaseFetcher):
                     # No base game found, treat as regular content
                     logging.warning(f"Found {app_type} {app_id} but no base game information available")
 
+            # Only a usable EUR response is worth the store page and USD requests, which run side by side
+            store_page_future = self._store_page_executor.submit(self._request_store_page, steam_url, existing_data)
+            api_data_usd = self._fetch_api_data(app_id, 'us') if fetch_usd else None
+            store_page_response = store_page_future.result()
+
             # Create initial game data from API
             game_data = self._parse_api_data(api_data_eur, app_id, steam_url)
 
-            # Fetch USD price if requested
-            if fetch_usd:
-                api_data_usd = self._fetch_api_data(app_id, 'us')
-                if api_data_usd:
-                    game_data.price_usd = self._get_price(api_data_usd)
-                    # Update USD-specific discount data
-                    usd_discount_data = self._extract_discount_data(api_data_usd)
-                    if usd_discount_data['original_price_usd']:
-                        game_data.original_price_usd = usd_discount_data['original_price_usd']
+            # Apply USD price if requested
+            if api_data_usd:
+                game_data.price_usd = self._get_price(api_data_usd)
+                # Update USD-specific discount data
+                usd_discount_data = self._extract_discount_data(api_data_usd)
+                if usd_discount_data['original_price_usd']:
+                    game_data.original_price_usd = usd_discount_data['original_price_usd']
 
-            # Fetch additional data from store page
-            store_data = self._fetch_store_page_data(steam_url, api_data_eur, existing_data, known_full_game_id)
+            # Parse additional data from store page
+            store_data = self._parse_store_page_data(store_page_response, steam_url, api_data_eur, existing_data, known_full_game_id)
 
             # Merge store page data into game data
             self._merge_store_data(game_data, store_data)
@@ -278,17 +340,31 @@ class SteamDataFetcher(BaseFetcher):
 
         return result
 
-    def _fetch_store_page_data(self, steam_url: str, app_data: dict[str, Any] | None = None, existing_data: 'SteamGameData | None' = None, known_full_game_id: str | None = None) -> dict[str, Any]:
-        """Scrape additional data from Steam store page with retry logic"""
-        response = self._make_request_with_retry(
+    def _request_store_page(self, steam_url: str, existing_data: 'SteamGameData | None' = None) -> requests.Response | None:
+        """Request the Steam store page with retry logic, conditionally when cached store data exists"""
+        headers = self.headers
+        if existing_data and not existing_data.is_stub:
+            headers = self._conditional_headers(existing_data.store_page_etag, existing_data.store_page_last_modified)
+
+        return self._make_request_with_retry(
             steam_url,
             "Steam store page",
-            headers=self.headers,
+            headers=headers,
             cookies=self.cookies
         )
+
+    def _parse_store_page_data(self, response: requests.Response | None, steam_url: str, app_data: dict[str, Any] | None = None, existing_data: 'SteamGameData | None' = None, known_full_game_id: str | None = None) -> dict[str, Any]:
+        """Scrape additional data from a Steam store page response"""
         if not response:
             return {}
 
+        if response.status_code == 304 and existing_data:
+            logging.debug(f"Store page not modified for {steam_url}, reusing cached store data")
+            cached_result = {field: getattr(existing_data, field) for field in STORE_PAGE_FIELDS}
+            if known_full_game_id and cached_result['is_demo']:
+                cached_result['full_game_app_id'] = known_full_game_id
+            return cached_result
+
         soup = BeautifulSoup(response.content, 'lxml')
         html_content = response.text
         page_text = soup.get_text()
@@ -296,17 +372,31 @@ class SteamDataFetcher(BaseFetcher):
         result = {}
 
         # Extract various data types
-        result.update(self._extract_tags(soup))
-        result.update(self._extract_demo_info(soup, page_text, html_content, steam_url, app_data, existing_data, known_full_game_id))
+        result.update(self._extract_tags(soup, html_content))
+        result.update(self._extract_demo_info(soup, page_text, html_content, steam_url, app_data, existing_data, known_full_game_id, response.url))
         result.update(self._extract_playtest_info(html_content))
-        result.update(self._extract_early_access(soup))
+        result.update(self._extract_early_access(soup, html_content))
         result.update(self._extract_review_data(page_text))
         result.update(self._extract_release_info(soup, page_text, app_data))
 
+        # Remember cache validators for the next conditional GET
+        result['store_page_etag'] = response.headers.get('ETag')
+        result['store_page_last_modified'] = response.headers.get('Last-Modified')
+
         return result
 
-    def _extract_tags(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _extract_tags(self, soup: BeautifulSoup, html_content: str) -> dict[str, Any]:
         """Extract Steam tags"""
+        # Prefer the inline tag array, it avoids a DOM selector walk
+        match = APP_TAG_MODAL_PATTERN.search(html_content)
+        if match:
+            try:
+                tag_entries = json.loads(match.group(1))
+                tags = [str(entry['name']).strip() for entry in tag_entries if isinstance(entry, dict) and entry.get('name')]
+                return {'tags': tags[:10]}  # Top 10 tags
+            except (ValueError, KeyError) as e:
+                logging.debug(f"Failed to parse inline Steam tag data, falling back to tag links: {e}")
+
         tags = []
         tag_elements = soup.select('a.app_tag')
         for tag in tag_elements[:10]:  # Top 10 tags
@@ -315,7 +405,7 @@ class SteamDataFetcher(BaseFetcher):
                 tags.append(tag_text)
         return {'tags': tags}
 
-    def _extract_demo_info(self, soup: BeautifulSoup, page_text: str, html_content: str, steam_url: str, app_data: dict[str, Any] | None = None, existing_data: 'SteamGameData | None' = None, known_full_game_id: str | None = None) -> dict[str, Any]:
+    def _extract_demo_info(self, soup: BeautifulSoup, page_text: str, html_content: str, steam_url: str, app_data: dict[str, Any] | None = None, existing_data: 'SteamGameData | None' = None, known_full_game_id: str | None = None, page_url: str | None = None) -> dict[str, Any]:
         """Extract demo-related information"""
         result: dict[str, Any] = {}
 
@@ -323,7 +413,7 @@ class SteamDataFetcher(BaseFetcher):
         categories_from_api = [c.get('description', '') for c in app_data.get('categories', [])] if app_data else []
 
         # Steam categories are 100% reliable for demo detection
-        is_demo = any('demo' in cat.lower() for cat in categories_from_api)
+        is_demo = any(DEMO_WORD_PATTERN.search(cat) for cat in categories_from_api)
         result['is_demo'] = is_demo
 
         # If this is a demo, try to find the full game
@@ -333,9 +423,9 @@ class SteamDataFetcher(BaseFetcher):
                 result['full_game_app_id'] = known_full_game_id
             else:
                 # Extract app_id from steam_url
-                app_id_match = re.search(r'/app/(\d+)', steam_url)
+                app_id_match = APP_URL_ID_PATTERN.search(steam_url)
                 current_app_id = app_id_match.group(1) if app_id_match else None
-                full_game_id = self._find_full_game_id(soup, page_text, current_app_id)
+                full_game_id = self._find_full_game_id(soup, page_text, html_content, current_app_id)
                 if full_game_id:
                     result['full_game_app_id'] = full_game_id
                 elif existing_data and existing_data.full_game_app_id:
@@ -343,7 +433,10 @@ class SteamDataFetcher(BaseFetcher):
                     result['full_game_app_id'] = existing_data.full_game_app_id
         else:
             # For non-demo apps, try to find demo app ID - only set has_demo if we find one
-            demo_app_id = self._find_demo_app_id(soup, html_content)
+            # The final page URL names the same app as the canonical link, without walking the tree for it
+            page_app_id_match = APP_URL_ID_PATTERN.search(page_url) if page_url else None
+            page_app_id = page_app_id_match.group(1) if page_app_id_match else None
+            demo_app_id = self._find_demo_app_id(soup, html_content, page_app_id)
             if demo_app_id:
                 result['has_demo'] = True
                 result['demo_app_id'] = demo_app_id
@@ -352,16 +445,23 @@ class SteamDataFetcher(BaseFetcher):
 
         return result
 
-    def _extract_early_access(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _extract_early_access(self, soup: BeautifulSoup, html_content: str) -> dict[str, Any]:
         """Extract early access information"""
-        early_access = soup.find('div', class_='early_access_header')
+        early_access = self._find_div_by_class(soup, html_content, 'early_access_header')
         return {'is_early_access': early_access is not None}
 
+    def _find_div_by_class(self, soup: BeautifulSoup, html_content: str, class_name: str) -> Tag | None:
+        """Find a div by class, skipping the tree walk when the class name never occurs in the raw HTML"""
+        if class_name not in html_content:
+            return None
+        element = soup.find('div', class_=class_name)
+        return element if isinstance(element, Tag) else None
+
     def _extract_playtest_info(self, html_content: str) -> dict[str, Any]:
         """Detect if game has an active playtest using AJAX endpoint"""
         try:
             # Use regex to ensure we're matching the actual endpoint, not random text
-            has_playtest = bool(re.search(r'/ajaxrequestplaytestaccess/\d+', html_content))
+            has_playtest = next(self._iter_prefixed_ids(html_content, '/ajaxrequestplaytestaccess/'), None) is not None
 
             if has_playtest:
                 logging.debug("Detected active playtest via AJAX endpoint")
@@ -376,18 +476,16 @@ class SteamDataFetcher(BaseFetcher):
         result = {}
 
         # Look for Overall Reviews data
-        overall_match = re.search(r'All Reviews:\s*([^\n\(]+)\s*\((\d{1,3}(?:,\d{3})*)\s*\).*?(\d+)%.*?(\d{1,3}(?:,\d{3})*)', page_text, re.IGNORECASE | re.DOTALL)
-        if not overall_match:
-            overall_match = re.search(r'Overall Reviews:\s*([^\n\(]+)\s*\((\d{1,3}(?:,\d{3})*)\s*reviews?\).*?(\d+)%.*?(\d{1,3}(?:,\d{3})*)', page_text, re.IGNORECASE | re.DOTALL)
+        overall_match = ALL_REVIEWS_PATTERN.search(page_text) or OVERALL_REVIEWS_PATTERN.search(page_text)
 
         # Look for Recent Reviews data
-        recent_match = re.search(r'Recent Reviews:\s*([^\n\(]+)\s*\((\d{1,3}(?:,\d{3})*)\s*\).*?(\d+)%.*?(\d{1,3}(?:,\d{3})*)', page_text, re.IGNORECASE | re.DOTALL)
+        recent_match = RECENT_REVIEWS_PATTERN.search(page_text)
 
         # Prefer Overall Reviews if available
         if overall_match:
-            summary = overall_match.group(1).strip()
-            count = int(overall_match.group(2).replace(',', ''))
-            percentage = int(overall_match.group(3))
+            summary = overall_match.group('summary').strip()
+            count = int(overall_match.group('count').replace(',', ''))
+            percentage = int(overall_match.group('percentage'))
 
             result.update({
                 'positive_review_percentage': percentage,
@@ -397,9 +495,9 @@ class SteamDataFetcher(BaseFetcher):
 
             # Also store recent data if available
             if recent_match:
-                recent_summary = recent_match.group(1).strip()
-                recent_count = int(recent_match.group(2).replace(',', ''))
-                recent_percentage = int(recent_match.group(3))
+                recent_summary = recent_match.group('summary').strip()
+                recent_count = int(recent_match.group('count').replace(',', ''))
+                recent_percentage = int(recent_match.group('percentage'))
                 result.update({
                     'recent_review_percentage': recent_percentage,
                     'recent_review_count': recent_count,
@@ -408,9 +506,9 @@ class SteamDataFetcher(BaseFetcher):
 
         elif recent_match:
             # Only recent data available
-            summary = recent_match.group(1).strip()
-            count = int(recent_match.group(2).replace(',', ''))
-            percentage = int(recent_match.group(3))
+            summary = recent_match.group('summary').strip()
+            count = int(recent_match.group('count').replace(',', ''))
+            percentage = int(recent_match.group('percentage'))
 
             result.update({
                 'positive_review_percentage': percentage,
@@ -425,14 +523,8 @@ class SteamDataFetcher(BaseFetcher):
 
     def _extract_insufficient_reviews(self, page_text: str, result: dict[str, Any]) -> None:
         """Extract information about insufficient or missing reviews"""
-        insufficient_review_patterns = [
-            r'Need more user reviews to generate a score.*?(\d+)\s*user review',
-            r'(\d+)\s*user review.*?Need more user reviews',
-            r'(\d+)\s*review.*?Need more.*?score',
-        ]
-
-        for pattern in insufficient_review_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE | re.DOTALL)
+        for pattern in INSUFFICIENT_REVIEWS_PATTERNS:
+            match = pattern.search(page_text)
             if match:
                 review_count = int(match.group(1))
                 result.update({
@@ -462,19 +554,15 @@ class SteamDataFetcher(BaseFetcher):
 
     def _extract_planned_release_date(self, soup: BeautifulSoup, page_text: str) -> str | None:
         """Extract more specific planned release date for coming soon games"""
-        # Coming soon date patterns
-        coming_soon_patterns = [
-            r'Coming Soon.*?(\w+ \d{1,2},? \d{4})',  # "Coming Soon - January 15, 2025"
-            r'Coming Soon.*?(\w+ \d{4})',            # "Coming Soon - March 2025"
-            r'Coming Soon.*?(Q[1-4] \d{4})',         # "Coming Soon - Q2 2025"
-            r'Coming Soon.*?(\d{4})',                # "Coming Soon - 2025"
-            r'Release Date.*?(\w+ \d{1,2},? \d{4})', # "Release Date: January 15, 2025"
-            r'Release Date.*?(\w+ \d{4})',           # "Release Date: March 2025"
-            r'Release Date.*?(Q[1-4] \d{4})',        # "Release Date: Q2 2025"
-        ]
+        # The date patterns never span lines, so only lines carrying one of the labels can match;
+        # collect those in a single pass and run the patterns over them instead of the whole page
+        label_lines = '\n'.join(
+            line for line in page_text.split('\n')
+            if 'coming soon' in (lowered := line.lower()) or 'release date' in lowered
+        )
 
-        for pattern in coming_soon_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in PLANNED_RELEASE_DATE_PATTERNS:
+            match = pattern.search(label_lines)
             if match:
                 date_str = match.group(1).strip()
                 if is_valid_date_string(date_str):
@@ -484,7 +572,7 @@ class SteamDataFetcher(BaseFetcher):
         release_date_element = soup.find('div', class_='release_date')
         if release_date_element:
             date_text = release_date_element.get_text(strip=True)
-            date_match = re.search(r'Release Date:?\s*(.+)', date_text, re.IGNORECASE)
+            date_match = RELEASE_DATE_LABEL_PATTERN.search(date_text)
             if date_match:
                 extracted_date = date_match.group(1).strip()
                 if is_valid_date_string(extracted_date):
@@ -492,21 +580,31 @@ class SteamDataFetcher(BaseFetcher):
 
         return None
 
-    def _find_demo_app_id(self, soup: BeautifulSoup, html_content: str) -> str | None:
+    def _find_demo_app_id(self, soup: BeautifulSoup, html_content: str, current_app_id: str | None = None) -> str | None:
         """Try to find the demo app ID from a main game page - only using steam:// protocol links"""
-        current_app_id = self._get_current_app_id(soup)
-
         # Only search for steam://install/ protocol links - most reliable and universal
         if html_content:
-            steam_protocol_pattern = r'steam://install/(\d+)'
-            matches = re.findall(steam_protocol_pattern, html_content)
-            for demo_id in matches:
-                if str(demo_id) != current_app_id:
-                    return str(demo_id)
+            for demo_id in self._iter_prefixed_ids(html_content, 'steam://install/'):
+                # Only fall back to the canonical link lookup once there is a candidate to compare
+                if not current_app_id:
+                    current_app_id = self._get_current_app_id(soup)
+                if demo_id != current_app_id:
+                    return demo_id
 
         return None
 
-    def _find_full_game_id(self, soup: BeautifulSoup, page_text: str, current_app_id: str | None = None) -> str | None:
+    def _iter_prefixed_ids(self, html_content: str, prefix: str) -> Iterator[str]:
+        """Yield the digit runs that directly follow each occurrence of a literal prefix"""
+        position = html_content.find(prefix)
+        while position >= 0:
+            start = end = position + len(prefix)
+            while end < len(html_content) and html_content[end].isdigit():
+                end += 1
+            if end > start:
+                yield html_content[start:end]
+            position = html_content.find(prefix, end)
+
+    def _find_full_game_id(self, soup: BeautifulSoup, page_text: str, html_content: str, current_app_id: str | None = None) -> str | None:
         """Try to find the full game app ID from a demo page"""
         # Use provided app_id or try to get it from the page
         if not current_app_id:
@@ -519,7 +617,7 @@ class SteamDataFetcher(BaseFetcher):
 
             if demo_url != response.url:
                 # Demo page redirected
-                match = re.search(r'/app/(\d+)', response.url)
+                match = APP_URL_ID_PATTERN.search(response.url)
                 if match:
                     main_game_id = match.group(1)
                     if main_game_id != current_app_id:
@@ -529,30 +627,40 @@ class SteamDataFetcher(BaseFetcher):
             logging.warning(f"FULL_GAME_DETECTION: Failed to check redirect for demo {current_app_id}: {e}")
 
         # 2. Fallback: Check breadcrumbs - for the 9% that don't redirect
-        breadcrumbs = soup.find('div', class_='breadcrumbs')
-        if breadcrumbs and isinstance(breadcrumbs, Tag):
+        breadcrumbs = self._find_div_by_class(soup, html_content, 'breadcrumbs')
+        if breadcrumbs:
             # Look for the game link right before "Demo" in breadcrumbs
-            breadcrumb_links = breadcrumbs.find_all('a', href=re.compile(r'/app/(\d+)'))
-            for i, link in enumerate(breadcrumb_links):
+            # Substring selector narrows the candidates; the app ID regex then runs once per remaining link
+            breadcrumb_links = []
+            for link in breadcrumbs.select('a[href*="/app/"]'):
                 href = self.safe_get_attr(link, 'href')
-                match = re.search(r'/app/(\d+)', href)
+                match = APP_URL_ID_PATTERN.search(href)
                 if match:
-                    app_id = match.group(1)
-                    # Check if next breadcrumb item contains "Demo"
-                    if app_id != current_app_id and i < len(breadcrumb_links) - 1:
-                        next_text = breadcrumb_links[i + 1].get_text() if i + 1 < len(breadcrumb_links) else ""
-                        if "demo" in next_text.lower() or "demo" in page_text[page_text.find(href):page_text.find(href) + 200].lower():
-                            logging.info(f"FULL_GAME_DETECTION: Found full game {app_id} for demo {current_app_id} via breadcrumb navigation")
-                            return app_id
+                    breadcrumb_links.append((link, href, match.group(1)))
+
+            for i, (_, href, app_id) in enumerate(breadcrumb_links[:-1]):
+                # Check if next breadcrumb item contains "Demo"
+                if app_id != current_app_id:
+                    next_text = breadcrumb_links[i + 1][0].get_text()
+                    if DEMO_WORD_PATTERN.search(next_text) or self._has_demo_context(page_text, href):
+                        logging.info(f"FULL_GAME_DETECTION: Found full game {app_id} for demo {current_app_id} via breadcrumb navigation")
+                        return app_id
 
         return None
 
+    def _has_demo_context(self, page_text: str, href: str) -> bool:
+        """Check the bounded text window following a link href for a demo mention"""
+        index = page_text.find(href)
+        if index < 0:
+            return False
+        return DEMO_WORD_PATTERN.search(page_text, index, index + DEMO_CONTEXT_WINDOW_CHARS) is not None
+
     def _get_current_app_id(self, soup: BeautifulSoup) -> str | None:
         """Get the current app ID from the page"""
         canonical_link = soup.find('link', {'rel': 'canonical'})
         if canonical_link:
             href = self.safe_get_attr(canonical_link, 'href')
-            match = re.search(r'/app/(\d+)', href)
+            match = APP_URL_ID_PATTERN.search(href)
             if match:
                 return match.group(1)
         return None
@@ -623,13 +731,63 @@ class SteamBulkPriceFetcher:
         self.price_service = SteamPriceUpdateService(data_manager)
 
 
-    def _process_batch_fetch_only(self, app_ids: list[str], country_code: str) -> dict[str, dict[str, Any]]:
+    def _process_batch_fetch_only(self, app_ids: list[str], country_code: str) -> dict[str, PriceRow]:
         """Process batches atomically - all succeed or entire operation fails"""
         all_results, _, _ = self._process_batch_fetch_only_with_removal_info(app_ids, country_code)
         return all_results
 
-    def _process_batch_fetch_only_with_removal_info(self, app_ids: list[str], country_code: str) -> tuple[dict[str, dict[str, Any]], list[str], list[str]]:
+    def _process_batch_fetch_only_with_removal_info(self, app_ids: list[str], country_code: str) -> tuple[dict[str, PriceRow], list[str], list[str]]:
         """Process batches atomically and return removal info - all succeed or entire operation fails"""
+        # Existing games are only read for price comparison, so load them once for all batches
+        try:
+            steam_games = self.data_manager.load_steam_games()
+        except (FileNotFoundError, json.JSONDecodeError, PermissionError) as e:
+            logging.warning(f"Failed to load steam games data for comparison: {e}")
+            steam_games = {}
+
+        # Split the apps into contiguous slices of whole batches and fetch them in parallel,
+        # each slice keeping its own adaptive batch sizing
+        initial_batch_size = self.batch_manager.get_initial_batch_size(None)
+        batches = self.batch_manager.create_batches(app_ids, initial_batch_size) if app_ids else []
+        workers = max(1, min(int(self.config.get('concurrent_batches', 1)), len(batches)))
+        batches_per_slice = -(-len(batches) // workers) or 1
+        slices = [
+            [app_id for batch in batches[i:i + batches_per_slice] for app_id in batch]
+            for i in range(0, len(batches), batches_per_slice)
+        ]
+
+        all_results = {}
+        all_removed_games = []
+        successfully_queried = set()
+        batch_count = 0
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='steam-bulk') as executor:
+            futures = [
+                executor.submit(self._process_batch_slice_with_removal_info, slice_apps, country_code, steam_games)
+                for slice_apps in slices
+            ]
+            for future in futures:
+                slice_results, slice_removed, slice_processed, slice_batches = future.result()
+                all_results.update(slice_results)
+                all_removed_games.extend(slice_removed)
+                successfully_queried.update(slice_processed)
+                batch_count += slice_batches
+
+        # Sanity check: Every requested app_id must have been in a successful batch
+        missing_from_batches = set(app_ids) - successfully_queried
+        if missing_from_batches:
+            raise RuntimeError(f"CRITICAL: {len(missing_from_batches)} apps were never part of successful batches")
+
+        logging.info(f"All {len(app_ids)} apps processed successfully across {batch_count} batches")
+        return all_results, all_removed_games, app_ids  # Return original app_ids as successfully processed
+
+    def _process_batch_slice_with_removal_info(self, app_ids: list[str], country_code: str,
+                                               steam_games: dict[str, SteamGameData]) -> tuple[dict[str, PriceRow], list[str], set[str], int]:
+        """Process one slice of apps batch by batch, shrinking batches on server errors
+
+        Returns:
+            Tuple of (results, removed_games, successfully_queried_app_ids, batch_count)
+        """
         all_results = {}
         all_removed_games = []
         app_ids_to_process = app_ids.copy()
@@ -652,7 +810,7 @@ class SteamBulkPriceFetcher:
 
             try:
                 # Process this batch with atomic retries and get removal info
-                batch_results, batch_removed, actually_processed = self._process_batch_with_atomic_retries_and_removal_info(current_batch, country_code)
+                batch_results, batch_removed, actually_processed = self._process_batch_with_atomic_retries_and_removal_info(current_batch, country_code, steam_games)
                 all_results.update(batch_results)
                 all_removed_games.extend(batch_removed)
                 successfully_queried.update(actually_processed)
@@ -666,16 +824,11 @@ class SteamBulkPriceFetcher:
                 logging.error(f"Batch {batch_number} failed completely: {e}")
                 raise RuntimeError("Atomic batch processing failed - aborting entire operation") from e
 
-        # Sanity check: Every requested app_id must have been in a successful batch
-        missing_from_batches = set(app_ids) - successfully_queried
-        if missing_from_batches:
-            raise RuntimeError(f"CRITICAL: {len(missing_from_batches)} apps were never part of successful batches")
-
-        logging.info(f"All {len(app_ids)} apps processed successfully across {batch_number} batches")
-        return all_results, all_removed_games, app_ids  # Return original app_ids as successfully processed
+        return all_results, all_removed_games, successfully_queried, batch_number
 
 
-    def _process_batch_with_atomic_retries_and_removal_info(self, batch_apps: list[str], country_code: str) -> tuple[dict[str, dict[str, Any]], list[str], list[str]]:
+    def _process_batch_with_atomic_retries_and_removal_info(self, batch_apps: list[str], country_code: str,
+                                                          steam_games: dict[str, SteamGameData]) -> tuple[dict[str, PriceRow], list[str], list[str]]:
         """Process a single batch with retries and return removal info - succeed completely or fail completely
 
         Returns:
@@ -696,15 +849,8 @@ class SteamBulkPriceFetcher:
 
                 if response_data:
                     # SUCCESS: This batch got HTTP 200
-                    # Load existing games data for parsing
-                    try:
-                        steam_games = self.data_manager.load_steam_games()
-                        existing_games = {app_id: steam_games.get(app_id) for app_id in current_batch}
-                    except (FileNotFoundError, json.JSONDecodeError, PermissionError) as e:
-                        logging.warning(f"Failed to load steam games data for comparison: {e}")
-                        existing_games = {}
-
-                    parsed_results, removed_games = self.response_parser.parse_bulk_response_with_removal_info(response_data, current_batch, existing_games)
+                    # The parser only looks up the batch's own app ids, so the loaded games are passed as is
+                    parsed_results, removed_games = self.response_parser.parse_bulk_response_with_removal_info(response_data, current_batch, steam_games)
                     logging.debug(f"Batch success: {len(parsed_results)} results, {len(removed_games)} removed for {country_code}")
 
                     return parsed_results, removed_games, current_batch  # Return which apps were actually processed
@@ -739,8 +885,11 @@ class SteamBulkPriceFetcher:
                     logging.warning(f"Server error {status_code} - reduced batch size to {current_batch_size}")
                     continue
                 elif status_code == 429:
-                    # Rate limit - wait and retry same batch
-                    delay = self.config.get('rate_limit_delay', 10)
+                    # Rate limit - wait and retry same batch, honouring the server's Retry-After if it sent one
+                    retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+                    delay = self.error_handler.parse_retry_after(retry_after)
+                    if delay is None:
+                        delay = self.config.get('rate_limit_delay', 10)
                     logging.warning(f"Rate limited - waiting {delay}s before retry")
                     time.sleep(delay)
                     continue
@@ -812,10 +961,10 @@ class SteamBulkPriceFetcher:
         eur_results = {}
 
         # Track processing metrics for monitoring
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             eur_results, api_removed_games, _ = self._process_batch_fetch_only_with_removal_info(app_ids, 'at')
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
 
             # Merge API-detected removed games
             removed_games.extend(api_removed_games)
@@ -827,12 +976,12 @@ class SteamBulkPriceFetcher:
             # Check for restored games (previously removed games that now return success=true)
             self._detect_restored_games(eur_results, app_ids, restored_games)
         except requests.exceptions.RequestException as e:
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             logging.error(f"EUR removal detection network error after {processing_time:.1f}s: {e}")
             # Don't perform removal detection on communication failures
             logging.warning(f"Skipping removal detection for {len(app_ids)} games due to network error")
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             logging.error(f"EUR removal detection failed after {processing_time:.1f}s: {e}")
             # Don't perform removal detection on other failures
             logging.warning(f"Skipping removal detection for {len(app_ids)} games due to processing error")
@@ -857,7 +1006,8 @@ class SteamBulkPriceFetcher:
             This optimization reduces API load by ~50% when there are removed games,
             since we don't waste USD API calls on games we know are removed.
         """
-        existing_games = [app_id for app_id in app_ids if app_id not in removed_games]
+        removed = set(removed_games)
+        existing_games = [app_id for app_id in app_ids if app_id not in removed]
         usd_results = {}
 
         if existing_games:
@@ -872,7 +1022,7 @@ class SteamBulkPriceFetcher:
         return usd_results
 
     def _validate_price_fetch_counts(self, app_ids: list[str], removed_games: list[str],
-                                   eur_results: dict[str, Any], usd_results: dict[str, Any]) -> None:
+                                   eur_results: dict[str, PriceRow], usd_results: dict[str, PriceRow]) -> None:
         """
         Validate that EUR and USD price fetch counts match expectations
 
@@ -924,7 +1074,7 @@ class SteamBulkPriceFetcher:
         if removed_games or restored_games:
             self._update_removal_status(removed_games, restored_games)
 
-    def _apply_price_updates(self, eur_results: dict[str, Any], usd_results: dict[str, Any]) -> PriceUpdateResult:
+    def _apply_price_updates(self, eur_results: dict[str, PriceRow], usd_results: dict[str, PriceRow]) -> PriceUpdateResult:
         """Apply atomic price updates for successful fetches"""
         if eur_results or usd_results:
             return self.price_service.apply_atomic_updates(eur_results, usd_results, dry_run=False)
@@ -942,7 +1092,7 @@ class SteamBulkPriceFetcher:
         }
 
 
-    def _detect_restored_games(self, batch_results: dict[str, dict[str, Any]], app_ids: list[str], restored_games: list[str]) -> None:
+    def _detect_restored_games(self, batch_results: dict[str, PriceRow], app_ids: list[str], restored_games: list[str]) -> None:
         """
         Check for restored games - previously removed games that now return success=true from Steam API
 
@@ -958,10 +1108,13 @@ class SteamBulkPriceFetcher:
             logging.warning(f"Failed to load steam games data: {e}")
             steam_games = {}
 
+        # Games already known to be missing from Steam, collected once instead of per app
+        pending_removal = {app_id for app_id, game in steam_games.items() if game.removal_pending}
+
         for app_id in app_ids:
             # Only check games that exist on Steam (have API response with success=true)
             # Games with success=false are already handled as removed by the response parser
-            if app_id in batch_results or app_id in [g for g in steam_games if steam_games[g].removal_pending]:
+            if app_id in batch_results or app_id in pending_removal:
                 game_data = steam_games.get(app_id)
                 was_removed = bool(game_data and game_data.removal_pending)
 
@@ -6,12 +6,13 @@ Extracted from DataManager for better separation of concerns.
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 if TYPE_CHECKING:
     from .data_manager import DataManager, SteamDataDict
 
 from .models import SteamGameData
+from .steam_api_response_parser import PriceRow
 
 
 class PriceUpdateResult(TypedDict):
@@ -27,7 +28,7 @@ class SteamPriceUpdateService:
     def __init__(self, data_manager: 'DataManager') -> None:
         self.data_manager = data_manager
 
-    def update_prices(self, price_updates: dict[str, dict[str, Any]], currency: str, dry_run: bool = False) -> PriceUpdateResult:
+    def update_prices(self, price_updates: dict[str, PriceRow], currency: str, dry_run: bool = False) -> PriceUpdateResult:
         """
         Update Steam game prices for a specific currency
 
@@ -77,7 +78,7 @@ class SteamPriceUpdateService:
             'errors': []
         }
 
-    def apply_atomic_updates(self, eur_updates: dict[str, dict[str, Any]], usd_updates: dict[str, dict[str, Any]], dry_run: bool = False) -> PriceUpdateResult:
+    def apply_atomic_updates(self, eur_updates: dict[str, PriceRow], usd_updates: dict[str, PriceRow], dry_run: bool = False) -> PriceUpdateResult:
         """
         Apply EUR and USD price updates atomically
 
@@ -119,7 +120,7 @@ class SteamPriceUpdateService:
             'errors': []
         }
 
-    def _process_currency_updates(self, steam_data: 'SteamDataDict', price_updates: dict[str, dict[str, Any]], currency: str) -> tuple[list[str], list[str]]:
+    def _process_currency_updates(self, steam_data: 'SteamDataDict', price_updates: dict[str, PriceRow], currency: str) -> tuple[list[str], list[str]]:
         """Process price updates for a specific currency"""
         successful = []
         failed = []
@@ -144,35 +145,28 @@ class SteamPriceUpdateService:
 
         return successful, failed
 
-    def _apply_price_data_to_game(self, game: SteamGameData, price_data: dict[str, Any], currency: str) -> SteamGameData:
+    def _apply_price_data_to_game(self, game: SteamGameData, price_data: PriceRow, currency: str) -> SteamGameData:
         """Apply price data to an existing game"""
         updates = {}
 
         # Update currency-specific price fields
         if currency == 'eur':
-            if 'price_eur' in price_data:
-                updates['price_eur'] = price_data['price_eur']
-            if 'original_price_eur' in price_data:
-                updates['original_price_eur'] = price_data['original_price_eur']
+            updates['price_eur'] = price_data.price_eur
+            updates['original_price_eur'] = price_data.original_price_eur
         elif currency == 'usd':
-            if 'price_usd' in price_data:
-                updates['price_usd'] = price_data['price_usd']
-            if 'original_price_usd' in price_data:
-                updates['original_price_usd'] = price_data['original_price_usd']
+            updates['price_usd'] = price_data.price_usd
+            updates['original_price_usd'] = price_data.original_price_usd
 
         # Update sale/discount fields (global for all currencies)
-        if 'discount_percent' in price_data:
-            discount_value = price_data['discount_percent']
-            # Only set discount_percent if it's > 0, otherwise use None
-            updates['discount_percent'] = discount_value if discount_value > 0 else None
-        if 'is_on_sale' in price_data:
-            updates['is_on_sale'] = price_data['is_on_sale']
-        if 'is_free' in price_data:
-            updates['is_free'] = price_data['is_free']
+        if price_data.discount_percent is not None:
+            updates['discount_percent'] = price_data.discount_percent
+        updates['is_on_sale'] = price_data.is_on_sale
+        if price_data.is_free is not None:
+            updates['is_free'] = price_data.is_free
 
         return game.model_copy(update=updates)
 
-    def _create_game_with_price_data(self, app_id: str, price_data: dict[str, Any], currency: str) -> SteamGameData:
+    def _create_game_with_price_data(self, app_id: str, price_data: PriceRow, currency: str) -> SteamGameData:
         """Create a new game entry with price data"""
         steam_url = f"https://store.steampowered.com/app/{app_id}/"
 
@@ -183,18 +177,18 @@ class SteamPriceUpdateService:
             name=f"[PRICE DATA ONLY] {app_id}",
             is_stub=True,
             stub_reason="Price data fetched before full game data",
-            discount_percent=price_data.get('discount_percent') if price_data.get('discount_percent', 0) > 0 else None,
-            is_on_sale=price_data.get('is_on_sale', False),
-            is_free=price_data.get('is_free', False)
+            discount_percent=price_data.discount_percent,
+            is_on_sale=price_data.is_on_sale,
+            is_free=bool(price_data.is_free)
         )
 
         # Update with price data using model_copy
         updates = {}
         if currency == 'eur':
-            updates['price_eur'] = price_data.get('price_eur')
-            updates['original_price_eur'] = price_data.get('original_price_eur')
+            updates['price_eur'] = price_data.price_eur
+            updates['original_price_eur'] = price_data.original_price_eur
         elif currency == 'usd':
-            updates['price_usd'] = price_data.get('price_usd')
-            updates['original_price_usd'] = price_data.get('original_price_usd')
+            updates['price_usd'] = price_data.price_usd
+            updates['original_price_usd'] = price_data.original_price_usd
 
         return game_data.model_copy(update=updates)
@@ -3,7 +3,9 @@ Steam Data Updater - Orchestrates Steam game updates across multiple channels
 """
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -19,6 +21,79 @@ from .unified_data_collector import UnifiedDataCollector
 from .update_logger import GameUpdateLogger
 from .utils import extract_steam_app_id
 
+QUARTER_DATE_PATTERN = re.compile(r'q[1-4]\s+\d{4}')
+YEAR_DATE_PATTERN = re.compile(r'^\d{4}$')
+MONTH_YEAR_DATE_PATTERN = re.compile(r'^\w+\s+\d{4}$')
+
+
+def detect_date_granularity(date_str: str) -> str:
+    """Detect the granularity of a date string."""
+    date_str = date_str.lower().strip()
+
+    # Quarter notation
+    if QUARTER_DATE_PATTERN.match(date_str):
+        return 'quarter'
+
+    # Year only
+    if YEAR_DATE_PATTERN.match(date_str):
+        return 'year'
+
+    # Month + Year (two words, second is 4-digit year)
+    if MONTH_YEAR_DATE_PATTERN.match(date_str):
+        return 'month'
+
+    # Assume anything else is day-level if it has more components
+    return 'day'
+
+
+@lru_cache(maxsize=4096)
+def parse_steam_date(date_str: str) -> tuple[datetime | None, str | None]:
+    """
+    Parse Steam release dates with granularity detection.
+    Returns (parsed_date, granularity) or (None, None) if unparseable.
+    For imprecise dates (year, quarter), returns the earliest possible date.
+
+    Memoized since many games share release date strings and dateutil parsing dominates refresh checks.
+    """
+    if not date_str:
+        return None, None
+
+    date_str = date_str.strip()
+
+    # Detect granularity first
+    granularity = detect_date_granularity(date_str)
+
+    # Handle quarter format - use first day of the quarter
+    if granularity == 'quarter' and date_str.upper().startswith('Q'):
+        try:
+            quarter = int(date_str[1])
+            year = int(date_str.split()[1])
+            # First month of each quarter: Q1=Jan, Q2=Apr, Q3=Jul, Q4=Oct
+            quarter_start_month = (quarter - 1) * 3 + 1
+            quarter_start = datetime(year, quarter_start_month, 1)
+            return quarter_start, granularity
+        except (ValueError, IndexError):
+            return None, None
+
+    # Handle year-only format - use January 1st
+    elif granularity == 'year':
+        try:
+            year = int(date_str)
+            year_start = datetime(year, 1, 1)
+            return year_start, granularity
+        except ValueError:
+            return None, None
+
+    # Use dateutil for flexible parsing of all other dates
+    try:
+        parsed = dateutil_parse(date_str)
+        # For month-level dates, ensure we use first day of month
+        if granularity == 'month':
+            parsed = parsed.replace(day=1)
+        return parsed, granularity
+    except Exception:
+        return None, None
+
 
 class SteamDataUpdater:
     """
@@ -105,7 +180,7 @@ class SteamDataUpdater:
             return self._apply_refresh_skew(base_interval, game_data.last_updated)
         else:
             # For released games, use flexible parsing
-            parsed_date, _ = self._parse_steam_date(release_info)
+            parsed_date, _ = parse_steam_date(release_info)
             if parsed_date:
                 age_days = (datetime.now() - parsed_date).days
                 base_interval = self._interval_for_age(age_days)
@@ -122,7 +197,7 @@ class SteamDataUpdater:
         now = datetime.now()
 
         # Use new flexible parsing with granularity detection
-        parsed_date, _ = self._parse_steam_date(release_info)
+        parsed_date, _ = parse_steam_date(release_info)
 
         if parsed_date:
             return (parsed_date - now).days
@@ -202,70 +277,6 @@ class SteamDataUpdater:
         else:
             return 30  # Monthly for older games
 
-    def _parse_steam_date(self, date_str: str) -> tuple[datetime | None, str | None]:
-        """
-        Parse Steam release dates with granularity detection.
-        Returns (parsed_date, granularity) or (None, None) if unparseable.
-        For imprecise dates (year, quarter), returns the earliest possible date.
-        """
-        if not date_str:
-            return None, None
-
-        date_str = date_str.strip()
-
-        # Detect granularity first
-        granularity = self._detect_granularity(date_str)
-
-        # Handle quarter format - use first day of the quarter
-        if granularity == 'quarter' and date_str.upper().startswith('Q'):
-            try:
-                quarter = int(date_str[1])
-                year = int(date_str.split()[1])
-                # First month of each quarter: Q1=Jan, Q2=Apr, Q3=Jul, Q4=Oct
-                quarter_start_month = (quarter - 1) * 3 + 1
-                quarter_start = datetime(year, quarter_start_month, 1)
-                return quarter_start, granularity
-            except (ValueError, IndexError):
-                return None, None
-
-        # Handle year-only format - use January 1st
-        elif granularity == 'year':
-            try:
-                year = int(date_str)
-                year_start = datetime(year, 1, 1)
-                return year_start, granularity
-            except ValueError:
-                return None, None
-
-        # Use dateutil for flexible parsing of all other dates
-        try:
-            parsed = dateutil_parse(date_str)
-            # For month-level dates, ensure we use first day of month
-            if granularity == 'month':
-                parsed = parsed.replace(day=1)
-            return parsed, granularity
-        except Exception:
-            return None, None
-
-    def _detect_granularity(self, date_str: str) -> str:
-        """Detect the granularity of a date string."""
-        date_str = date_str.lower().strip()
-
-        # Quarter notation
-        if re.match(r'q[1-4]\s+\d{4}', date_str):
-            return 'quarter'
-
-        # Year only
-        if re.match(r'^\d{4}$', date_str):
-            return 'year'
-
-        # Month + Year (two words, second is 4-digit year)
-        if re.match(r'^\w+\s+\d{4}$', date_str):
-            return 'month'
-
-        # Assume anything else is day-level if it has more components
-        return 'day'
-
     def _is_overdue_release(self, game_data: SteamGameData) -> bool:
         """Check if game has passed its exact release date but is still marked as coming soon."""
         if not game_data.coming_soon:
@@ -276,7 +287,7 @@ class SteamDataUpdater:
             return False
 
         # Use new flexible parsing
-        parsed_date, granularity = self._parse_steam_date(release_info)
+        parsed_date, granularity = parse_steam_date(release_info)
 
         # Only check day-level dates for overdue (skip imprecise dates)
         if parsed_date and granularity == 'day':
@@ -292,7 +303,7 @@ class SteamDataUpdater:
         return extract_steam_app_id(steam_url)
 
     def _collect_steam_app_ids_from_unified_data(self, all_videos_data: dict[str, Any], steam_app_ids: set[str],
-                                               latest_video_dates: dict[str, datetime]) -> None:
+                                               latest_video_dates: dict[str, str]) -> None:
         """Helper method to collect Steam app IDs from unified video data"""
         total_videos = 0
         for channel_data in all_videos_data.values():
@@ -305,14 +316,9 @@ class SteamDataUpdater:
                     if game_ref.platform == 'steam':
                         steam_app_ids.add(game_ref.platform_id)
 
-                        # Track latest video date for this game
-                        if video.published_at:
-                            try:
-                                video_date = datetime.fromisoformat(video.published_at.replace('Z', '+00:00'))
-                                if game_ref.platform_id not in latest_video_dates or video_date > latest_video_dates[game_ref.platform_id]:
-                                    latest_video_dates[game_ref.platform_id] = video_date
-                            except ValueError:
-                                continue
+                        # Track latest video date for this game (ISO 8601 strings order chronologically)
+                        if video.published_at and video.published_at > latest_video_dates.get(game_ref.platform_id, ''):
+                            latest_video_dates[game_ref.platform_id] = video.published_at
 
         logging.info(f"Collected Steam app IDs from {total_videos} videos across {len(all_videos_data)} channels")
 
@@ -335,7 +341,7 @@ class SteamDataUpdater:
 
         # Collect all Steam app IDs from unified data source and build latest video date cache
         steam_app_ids: set[str] = set()
-        latest_video_dates: dict[str, datetime] = {}  # app_id -> latest datetime
+        latest_video_dates: dict[str, str] = {}  # app_id -> latest ISO published_at
 
         # Use unified data collector to get all video data in consistent format
         all_videos_data = self.data_collector.collect_all_videos_data(channels, pending_scrapers)
@@ -386,13 +392,10 @@ class SteamDataUpdater:
         logging.info(f"Found {len(steam_app_ids)} unique Steam games total")
 
         updates_done = 0
+        pending_updates: list[tuple[str, str]] = []
+        now = datetime.now()
 
         for app_id in steam_app_ids:
-            # Check if we've hit the max updates limit
-            if max_updates and updates_done >= max_updates:
-                logging.info(f"Reached max_updates limit ({max_updates})")
-                break
-
             # Check if data needs updating based on various triggers
             should_update = True
             update_reason = "new game"
@@ -419,19 +422,18 @@ class SteamDataUpdater:
 
                     # Check for recent video reference trigger
                     elif steam_game_data.last_updated:
-                        last_updated_date = datetime.fromisoformat(steam_game_data.last_updated)
                         latest_video_date = latest_video_dates.get(app_id)
 
-                        if latest_video_date and latest_video_date > last_updated_date:
+                        if latest_video_date and latest_video_date > steam_game_data.last_updated:
                             should_update = True
                             update_reason = "recent video reference"
 
                         # Check normal age-based refresh intervals
                         else:
                             refresh_interval_days = self._get_refresh_interval_days(steam_game_data)
-                            stale_date = datetime.now() - timedelta(days=refresh_interval_days)
+                            stale_date = now - timedelta(days=refresh_interval_days)
 
-                            if last_updated_date > stale_date:
+                            if self._is_updated_since(steam_game_data, stale_date):
                                 release_date_info = self._get_release_date_info(steam_game_data)
                                 GameUpdateLogger.log_game_skip("steam", steam_game_data.name, steam_game_data.last_updated,
                                                              refresh_interval_days, release_info=release_date_info)
@@ -445,6 +447,27 @@ class SteamDataUpdater:
                 should_update = False
 
             if should_update:
+                pending_updates.append((app_id, update_reason))
+
+        # Main app fetches are independent network round-trips, so request a window of them concurrently
+        # and apply the results in order; related demo/full game fetches still run sequentially
+        from .constants import STEAM_FETCH_WORKERS, STEAM_SAVE_INTERVAL
+        position = 0
+        last_saved_updates = 0
+        while position < len(pending_updates):
+            # Check if we've hit the max updates limit
+            if max_updates and updates_done >= max_updates:
+                logging.info(f"Reached max_updates limit ({max_updates})")
+                break
+
+            window_size = min(STEAM_FETCH_WORKERS, max_updates - updates_done) if max_updates else STEAM_FETCH_WORKERS
+            window = pending_updates[position:position + window_size]
+            position += len(window)
+
+            with ThreadPoolExecutor(max_workers=len(window), thread_name_prefix='steam-update') as executor:
+                prefetched = list(executor.map(self._fetch_steam_app, [app_id for app_id, _ in window]))
+
+            for (app_id, update_reason), prefetched_app in zip(window, prefetched, strict=True):
                 # Log update info including name and last update if known
                 if app_id in self.steam_data['games']:
                     steam_game_data_for_logging: SteamGameData = self.steam_data['games'][app_id]
@@ -458,40 +481,52 @@ class SteamDataUpdater:
 
                 # Pass Itch URL if this Steam game was discovered from Itch
                 related_itch_url: str | None = steam_to_itch_urls.get(app_id)
-                if self._fetch_steam_app_with_related(app_id, related_itch_url):
+                if self._fetch_steam_app_with_related(app_id, related_itch_url, prefetched_app):
                     updates_done += 1
 
+            # Periodic flush bounds the work lost if a long refresh is interrupted
+            if updates_done - last_saved_updates >= STEAM_SAVE_INTERVAL:
+                self._save_steam_data()
+                last_saved_updates = updates_done
+
         # Save updated data
         self._save_steam_data()
         logging.info(f"Steam data update complete. Updated {updates_done} games.")
 
-    def _fetch_steam_app_with_related(self, app_id: str, itch_url: str | None = None) -> bool:
+    def _fetch_steam_app(self, app_id: str) -> tuple[SteamGameData | None, bool]:
+        """Fetch the main Steam app data, returning it together with whether USD prices were requested"""
+        steam_url = f"https://store.steampowered.com/app/{app_id}"
+
+        # Check if we need to fetch USD price
+        fetch_usd = False
+        if app_id in self.steam_data['games']:
+            existing_data = self.steam_data['games'][app_id]
+            # Fetch USD if it's missing or if EUR price changed
+            fetch_usd = not existing_data.price_usd
+        else:
+            # New game, fetch both prices
+            fetch_usd = True
+
+        # Fetch the main app using SteamDataFetcher
+        existing_game_data = self.steam_data['games'].get(app_id)
+        return self.steam_fetcher.fetch_data(steam_url, fetch_usd=fetch_usd, existing_data=existing_game_data), fetch_usd
+
+    def _fetch_steam_app_with_related(self, app_id: str, itch_url: str | None = None,
+                                      prefetched: tuple[SteamGameData | None, bool] | None = None) -> bool:
         """
         Fetch Steam app data and automatically fetch related demo/full game data.
 
         Args:
             app_id: Steam app ID to fetch
             itch_url: Optional Itch.io URL if this Steam game was discovered from Itch
+            prefetched: Optional result of _fetch_steam_app that was already fetched concurrently
 
         Returns:
             True if any data was updated, False otherwise
         """
         try:
             steam_url = f"https://store.steampowered.com/app/{app_id}"
-
-            # Check if we need to fetch USD price
-            fetch_usd = False
-            if app_id in self.steam_data['games']:
-                existing_data = self.steam_data['games'][app_id]
-                # Fetch USD if it's missing or if EUR price changed
-                fetch_usd = not existing_data.price_usd
-            else:
-                # New game, fetch both prices
-                fetch_usd = True
-
-            # Fetch the main app using SteamDataFetcher
-            existing_game_data = self.steam_data['games'].get(app_id) if app_id in self.steam_data['games'] else None
-            steam_data = self.steam_fetcher.fetch_data(steam_url, fetch_usd=fetch_usd, existing_data=existing_game_data)
+            steam_data, fetch_usd = prefetched if prefetched is not None else self._fetch_steam_app(app_id)
             if not steam_data:
                 GameUpdateLogger.log_game_update_failure(app_id, "steam")
                 return False
@@ -549,16 +584,7 @@ class SteamDataUpdater:
 
             # Handle demo -> full game relationship
             if steam_data.is_demo and steam_data.full_game_app_id:
-                full_game_id = steam_data.full_game_app_id
-
-                # Check if we need to establish/fix bidirectional relationship
-                needs_relationship_fix = self._needs_bidirectional_relationship_fix(app_id, full_game_id, "demo_to_full")
-                if needs_relationship_fix:
-                    logging.info(f"  Full game {full_game_id} doesn't reference demo {app_id}, forcing fetch to establish relationship")
-
-                if needs_relationship_fix or self._should_update_related_app(full_game_id):
-                    logging.info(f"  Found full game {full_game_id}, fetching data")
-                    self._fetch_related_app(full_game_id, "full game", known_demo_id=app_id)
+                self._fetch_related_if_stale(app_id, steam_data.full_game_app_id, "demo_to_full")
 
             # Handle main game -> demo relationship
             # Check both current data and old data for demo_app_id
@@ -574,27 +600,20 @@ class SteamDataUpdater:
                 logging.info(f"  Game no longer has demo, forcing check of previous demo {demo_id}")
 
             if demo_id:
-                # Check if we need to establish/fix bidirectional relationship
-                needs_relationship_fix = self._needs_bidirectional_relationship_fix(app_id, demo_id, "full_to_demo")
-                if needs_relationship_fix:
-                    logging.info(f"  Demo {demo_id} doesn't reference full game {app_id}, forcing fetch to establish relationship")
-
-                if needs_relationship_fix or demo_was_removed or self._should_update_related_app(demo_id):
-                    logging.info(f"  Fetching demo {demo_id}")
-                    demo_fetched = self._fetch_related_app(demo_id, "demo", known_full_game_id=app_id)
-
-                    # If we force-fetched a demo that was removed from sale but still exists,
-                    # restore the bidirectional relationship
-                    if demo_fetched and demo_was_removed and demo_id in self.steam_data['games']:
-                        demo_data = self.steam_data['games'][demo_id]
-                        if demo_data.full_game_app_id == app_id:
-                            # Demo still points to this full game, restore the relationship
-                            logging.info(f"  Restoring demo relationship for game {app_id} -> demo {demo_id}")
-                            updated_game = steam_data.model_copy(update={
-                                'demo_app_id': demo_id,
-                                'has_demo': True
-                            })
-                            self.steam_data['games'][app_id] = updated_game
+                demo_fetched = self._fetch_related_if_stale(app_id, demo_id, "full_to_demo", force=demo_was_removed)
+
+                # If we force-fetched a demo that was removed from sale but still exists,
+                # restore the bidirectional relationship
+                if demo_fetched and demo_was_removed and demo_id in self.steam_data['games']:
+                    demo_data = self.steam_data['games'][demo_id]
+                    if demo_data.full_game_app_id == app_id:
+                        # Demo still points to this full game, restore the relationship
+                        logging.info(f"  Restoring demo relationship for game {app_id} -> demo {demo_id}")
+                        updated_game = steam_data.model_copy(update={
+                            'demo_app_id': demo_id,
+                            'has_demo': True
+                        })
+                        self.steam_data['games'][app_id] = updated_game
 
             return True
 
@@ -602,18 +621,52 @@ class SteamDataUpdater:
             GameUpdateLogger.log_game_update_failure(app_id, "steam", str(e))
             return False
 
+    def _fetch_related_if_stale(self, app_id: str, related_id: str, relationship_type: str, force: bool = False) -> bool:
+        """
+        Fetch the demo or full game related to an app if the relationship needs fixing or its data is stale.
+
+        Args:
+            app_id: The app we're currently processing (demo or full game)
+            related_id: The related app (full game or demo)
+            relationship_type: Either "demo_to_full" or "full_to_demo"
+            force: Fetch regardless of staleness
+
+        Returns:
+            True if the related app was fetched successfully, False otherwise
+        """
+        if relationship_type == "demo_to_full":
+            related_type, source_type = "full game", "demo"
+        else:
+            related_type, source_type = "demo", "full game"
+
+        # Check if we need to establish/fix bidirectional relationship
+        needs_relationship_fix = self._needs_bidirectional_relationship_fix(app_id, related_id, relationship_type)
+        if needs_relationship_fix:
+            logging.info(f"  {related_type.capitalize()} {related_id} doesn't reference {source_type} {app_id}, forcing fetch to establish relationship")
+
+        if not (needs_relationship_fix or force or self._should_update_related_app(related_id)):
+            return False
+
+        logging.info(f"  Fetching {related_type} {related_id}")
+        if relationship_type == "demo_to_full":
+            return self._fetch_related_app(related_id, related_type, known_demo_id=app_id)
+        return self._fetch_related_app(related_id, related_type, known_full_game_id=app_id)
+
     def _should_update_related_app(self, app_id: str) -> bool:
         """Check if a related app (demo/full game) should be fetched"""
         # Don't fetch if we already have recent data
         if app_id in self.steam_data['games']:
             game_data = self.steam_data['games'][app_id]
             if game_data.last_updated:
-                last_updated_date = datetime.fromisoformat(game_data.last_updated)
                 # Use 7 day threshold for related apps
                 stale_date = datetime.now() - timedelta(days=7)
-                return last_updated_date < stale_date
+                return game_data.last_updated < stale_date.isoformat()
         return True
 
+    def _is_updated_since(self, game_data: SteamGameData, since: datetime) -> bool:
+        """Check if a game was updated after the given time by comparing ISO 8601 strings directly"""
+        return game_data.last_updated is not None and game_data.last_updated > since.isoformat()
+
     def _needs_bidirectional_relationship_fix(self, source_id: str, target_id: str, relationship_type: str) -> bool:
         """
         Check if we need to force fetch to establish bidirectional relationship.
@@ -33,24 +33,27 @@ class UnifiedDataCollector:
         """
         unified_data = {}
 
-        # Collect from persistent storage - DataManager ensures Pydantic models
-        for channel_id in channels:
+        # In-memory data from pending scrapers - already in Pydantic format, grouped per channel
+        pending_by_channel: dict[str, list[VideosDataDict]] = {}
+        for scraper in pending_scrapers or []:
+            if (hasattr(scraper, 'channel_id') and hasattr(scraper, 'videos_data')
+                    and scraper.videos_data and 'videos' in scraper.videos_data):
+                pending_by_channel.setdefault(scraper.channel_id, []).append(scraper.videos_data)
+
+        for channel_id in [*channels, *(c for c in pending_by_channel if c not in channels)]:
+            pending = pending_by_channel.get(channel_id, [])
+            if len(pending) == 1:
+                # A scraper loads its channel file on creation and only adds to it, so it already
+                # covers the persistent data. Copy the videos level too, the scraper keeps mutating it.
+                unified_data[channel_id] = {**pending[0], 'videos': dict(pending[0]['videos'])}
+                continue
+
+            # Collect from persistent storage - DataManager ensures Pydantic models. Several scrapers
+            # for one channel (e.g. cron recent + backfill) may each have loaded the file before the
+            # others saved, so all of them are merged on top; later ones take precedence per video ID.
             unified_data[channel_id] = self.data_manager.load_videos_data(channel_id)
-
-        # Merge in-memory data from pending scrapers - already in Pydantic format
-        if pending_scrapers:
-            for scraper in pending_scrapers:
-                if hasattr(scraper, 'channel_id') and hasattr(scraper, 'videos_data'):
-                    channel_id = scraper.channel_id
-
-                    if scraper.videos_data and 'videos' in scraper.videos_data:
-                        if channel_id in unified_data:
-                            # Merge pending data with persistent data
-                            # Pending data takes precedence for same video IDs
-                            unified_data[channel_id]['videos'].update(scraper.videos_data['videos'])
-                        else:
-                            # Channel only has pending data
-                            unified_data[channel_id] = scraper.videos_data.copy()
+            for videos_data in pending:
+                unified_data[channel_id]['videos'].update(videos_data['videos'])
 
         return unified_data
 
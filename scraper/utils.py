@@ -6,23 +6,76 @@ import json
 import os
 import re
 import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .models import GameLinks, VideoGameReference
 
-
+STEAM_URL_PATTERNS = [
+    re.compile(r'https?://store\.steampowered\.com/app/(\d+)'),
+    re.compile(r'https?://steam\.com/app/(\d+)'),
+    re.compile(r'https?://s\.team/a/(\d+)'),
+    re.compile(r'https?://store\.steampowered\.com/news/app/(\d+)'),
+]
+
+ITCH_URL_PATTERNS = [
+    re.compile(r'https?://([^.]+)\.itch\.io/([^/\s]+)'),
+    re.compile(r'https?://itch\.io/games/([^/\s]+)'),
+]
+
+CRAZYGAMES_URL_PATTERNS = [
+    re.compile(r'https?://www\.crazygames\.com/game/([^/\s]+)'),
+    re.compile(r'https?://crazygames\.com/game/([^/\s]+)'),
+]
+
+# Invalid patterns (system requirements, etc.), fused into one alternation
+INVALID_DATE_PATTERN = re.compile(
+    r'\b(?:at|while|during|via|per)\s+\d+'  # "at 1080", "while 60", etc.
+    r'|\d+p\b'                              # "1080p", "720p", etc.
+    r'|fps|hz'                               # Performance specs (also covers mhz/ghz)
+    r'|\b\d+\s*(?:mb|gb|tb)\b',              # Storage specs
+    re.IGNORECASE
+)
+
+MAX_DATE_STRING_LENGTH = 32
+
+# Valid patterns (actual dates), anchored once around a single alternation
+VALID_DATE_PATTERN = re.compile(
+    r'^(?:'
+    r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+(?:\d{1,2},?\s+)?\d{4}'  # "March 15, 2025", "Mar 2025"
+    r'|q[1-4]\s+\d{4}'
+    r'|\d{4}'
+    r'|(?:early|mid|late)\s+\d{4}'
+    r'|(?:spring|summer|fall|autumn|winter)\s+\d{4}'
+    r'|coming soon'
+    r'|tbd'
+    r'|to be announced'
+    r')$',
+    re.IGNORECASE
+)
+
+# Common patterns in gaming videos
+GAME_NAME_TITLE_PATTERNS = [
+    re.compile(r'\|\s*([^|]+?)\s*$', re.IGNORECASE),                                    # "Something | Game Name"
+    re.compile(r'^([^!|]+?)(?:\s+is\s+|\s+Review|\s+Gameplay|\s*\|)', re.IGNORECASE),  # "Game Name is Amazing!" or "Game Name | Channel"
+    re.compile(r'^\s*(.+?)\s+(?:Review|Gameplay|First Impression)', re.IGNORECASE),     # "Game Name Review"
+    re.compile(r'^(?:Playing|I Played|This)\s+(.+?)\s+(?:for|and|is)', re.IGNORECASE), # "I Played Game Name for..."
+    re.compile(r'^(.+?)\s+(?:Has|Will|Can|Gets)', re.IGNORECASE),                      # "Game Name Has Amazing Features"
+]
+GAME_NAME_FILLER_WORDS_PATTERN = re.compile(r'\b(a|an|this|new|amazing|incredible|insane|crazy)\b', re.IGNORECASE)
+TRAILING_PUNCTUATION_PATTERN = re.compile(r'[!?]+$')
+WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+TRAILING_TAG_COUNT_PATTERN = re.compile(r'[\d,]+$')
+
+
+@lru_cache(maxsize=4096)
 def extract_steam_app_id(url: str) -> str | None:
-    """Extract Steam app ID from a Steam URL"""
-    steam_patterns = [
-        r'https?://store\.steampowered\.com/app/(\d+)',
-        r'https?://steam\.com/app/(\d+)',
-        r'https?://s\.team/a/(\d+)',
-        r'https?://store\.steampowered\.com/news/app/(\d+)'
-    ]
-
-    for pattern in steam_patterns:
-        match = re.search(pattern, url)
+    """Extract Steam app ID from a Steam URL (memoized, the same store URLs are parsed repeatedly)"""
+    for pattern in STEAM_URL_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
 
@@ -31,18 +84,11 @@ def extract_steam_app_id(url: str) -> str | None:
 
 def extract_all_steam_app_ids(text: str) -> list[str]:
     """Extract ALL Steam app IDs from text"""
-    steam_patterns = [
-        r'https?://store\.steampowered\.com/app/(\d+)',
-        r'https?://steam\.com/app/(\d+)',
-        r'https?://s\.team/a/(\d+)',
-        r'https?://store\.steampowered\.com/news/app/(\d+)'
-    ]
-
     app_ids = []
     seen = set()
 
-    for pattern in steam_patterns:
-        for match in re.finditer(pattern, text):
+    for pattern in STEAM_URL_PATTERNS:
+        for match in pattern.finditer(text):
             app_id = match.group(1)
             if app_id not in seen:
                 seen.add(app_id)
@@ -53,16 +99,11 @@ def extract_all_steam_app_ids(text: str) -> list[str]:
 
 def extract_all_itch_urls(text: str) -> list[str]:
     """Extract ALL Itch.io URLs from text"""
-    itch_patterns = [
-        r'https?://([^.]+)\.itch\.io/([^/\s]+)',
-        r'https?://itch\.io/games/([^/\s]+)'
-    ]
-
     urls = []
     seen = set()
 
-    for pattern in itch_patterns:
-        for match in re.finditer(pattern, text):
+    for pattern in ITCH_URL_PATTERNS:
+        for match in pattern.finditer(text):
             url = match.group(0)
             if url not in seen:
                 seen.add(url)
@@ -73,16 +114,11 @@ def extract_all_itch_urls(text: str) -> list[str]:
 
 def extract_all_crazygames_urls(text: str) -> list[str]:
     """Extract ALL CrazyGames URLs from text"""
-    crazygames_patterns = [
-        r'https?://www\.crazygames\.com/game/([^/\s]+)',
-        r'https?://crazygames\.com/game/([^/\s]+)'
-    ]
-
     urls = []
     seen = set()
 
-    for pattern in crazygames_patterns:
-        for match in re.finditer(pattern, text):
+    for pattern in CRAZYGAMES_URL_PATTERNS:
+        for match in pattern.finditer(text):
             url = match.group(0)
             if url not in seen:
                 seen.add(url)
@@ -137,25 +173,15 @@ def extract_game_links(description: str) -> GameLinks:
         links.steam = f"https://store.steampowered.com/app/{app_id}"
 
     # Itch.io patterns
-    itch_patterns = [
-        r'https?://([^.]+)\.itch\.io/([^/\s]+)',
-        r'https?://itch\.io/games/([^/\s]+)'
-    ]
-
-    for pattern in itch_patterns:
-        match = re.search(pattern, description)
+    for pattern in ITCH_URL_PATTERNS:
+        match = pattern.search(description)
         if match:
             links.itch = match.group(0)
             break
 
     # CrazyGames patterns
-    crazygames_patterns = [
-        r'https?://www\.crazygames\.com/game/([^/\s]+)',
-        r'https?://crazygames\.com/game/([^/\s]+)'
-    ]
-
-    for pattern in crazygames_patterns:
-        match = re.search(pattern, description)
+    for pattern in CRAZYGAMES_URL_PATTERNS:
+        match = pattern.search(description)
         if match:
             links.crazygames = match.group(0)
             break
@@ -167,34 +193,12 @@ def is_valid_date_string(date_str: str) -> bool:
     """Validate that a date string looks like an actual date, not system specs"""
     date_str = date_str.lower().strip()
 
-    # Invalid patterns (system requirements, etc.)
-    invalid_patterns = [
-        r'\b(at|while|during|via|per)\s+\d+',  # "at 1080", "while 60", etc.
-        r'\d+p\b',                              # "1080p", "720p", etc.
-        r'fps|hz|mhz|ghz',                      # Performance specs
-        r'\b\d+\s*(mb|gb|tb)\b',               # Storage specs
-    ]
-
-    for pattern in invalid_patterns:
-        if re.search(pattern, date_str, re.IGNORECASE):
-            return False
-
-    # Valid patterns (actual dates)
-    valid_patterns = [
-        r'^(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}$',
-        r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{1,2},?\s+\d{4}$',
-        r'^(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}$',
-        r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{4}$',
-        r'^q[1-4]\s+\d{4}$',
-        r'^\d{4}$',
-        r'^(early|mid|late)\s+\d{4}$',
-        r'^(spring|summer|fall|autumn|winter)\s+\d{4}$',
-        r'^coming soon$',
-        r'^tbd$',
-        r'^to be announced$',
-    ]
-
-    return any(re.search(pattern, date_str, re.IGNORECASE) for pattern in valid_patterns)
+    # Every valid form is between "tbd" and "september 15, 2025" long, which rejects most page junk up front;
+    # the anchored valid pattern then fails fast on the rest before the unanchored invalid scan runs
+    if not 3 <= len(date_str) <= MAX_DATE_STRING_LENGTH:
+        return False
+
+    return VALID_DATE_PATTERN.match(date_str) is not None and INVALID_DATE_PATTERN.search(date_str) is None
 
 
 def calculate_name_similarity(name1: str, name2: str) -> float:
@@ -207,43 +211,51 @@ def calculate_name_similarity(name1: str, name2: str) -> float:
 
 def extract_potential_game_names(title: str) -> list[str]:
     """Extract potential game names from video titles"""
-    # Common patterns in gaming videos
-    patterns = [
-        r'\|\s*([^|]+?)\s*$',                                    # "Something | Game Name"
-        r'^([^!|]+?)(?:\s+is\s+|\s+Review|\s+Gameplay|\s*\|)',  # "Game Name is Amazing!" or "Game Name | Channel"
-        r'^\s*(.+?)\s+(?:Review|Gameplay|First Impression)',     # "Game Name Review"
-        r'^(?:Playing|I Played|This)\s+(.+?)\s+(?:for|and|is)', # "I Played Game Name for..."
-        r'^(.+?)\s+(?:Has|Will|Can|Gets)',                      # "Game Name Has Amazing Features"
-    ]
-
-    potential_names = []
-
-    for pattern in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
+    return list(_extract_potential_game_names(title))
+
+
+@lru_cache(maxsize=4096)
+def _extract_potential_game_names(title: str) -> tuple[str, ...]:
+    """Run the title patterns once per distinct title; stub resolution revisits the same titles repeatedly"""
+    potential_names: list[str] = []
+
+    for pattern in GAME_NAME_TITLE_PATTERNS:
+        match = pattern.search(title)
         if match:
             name = match.group(1).strip()
             # Clean up common words and punctuation (but preserve 'the' for game titles)
-            name = re.sub(r'\b(a|an|this|new|amazing|incredible|insane|crazy)\b', '', name, flags=re.IGNORECASE)
-            name = re.sub(r'[!?]+$', '', name)  # Remove trailing exclamation/question marks
-            name = re.sub(r'\s+', ' ', name).strip()
+            name = GAME_NAME_FILLER_WORDS_PATTERN.sub('', name)
+            name = TRAILING_PUNCTUATION_PATTERN.sub('', name)  # Remove trailing exclamation/question marks
+            name = WHITESPACE_RUN_PATTERN.sub(' ', name).strip()
             if len(name) > 3 and name not in potential_names:  # Avoid very short matches and duplicates
                 potential_names.append(name)
 
-    return potential_names
+    return tuple(potential_names)
+
+
+def format_unix_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp as a naive UTC ISO-8601 string (YYYY-MM-DDTHH:MM:SS)"""
+    t = time.gmtime(timestamp)
+    return f'{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}'
+
+
+# Data file encoders, built once instead of on every save; sorted keys keep committed diffs stable
+INDENTED_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
 
 
 def load_json(filepath: str | Path, default: dict[str, Any]) -> dict[str, Any]:
     """Load JSON file or return default"""
-    path = Path(filepath)
-    if path.exists():
-        with path.open() as f:
-            result = json.load(f)
-            return result if isinstance(result, dict) else default
-    return default
+    # Parse the raw bytes in one go rather than streaming decoded text through json.load
+    try:
+        result = json.loads(Path(filepath).read_bytes())
+    except FileNotFoundError:
+        return default
+    return result if isinstance(result, dict) else default
 
 
-def save_data(data_dict: dict[str, Any], file_path: str | Path) -> None:
-    """Save data to JSON file atomically"""
+def save_data(data_dict: dict[str, Any], file_path: str | Path, compact: bool = False) -> None:
+    """Save data to JSON file atomically, indented for readable diffs unless compact is requested"""
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -255,7 +267,9 @@ def save_data(data_dict: dict[str, Any], file_path: str | Path) -> None:
         suffix='.json',
         delete=False
     ) as tmp_file:
-        json.dump(data_dict, tmp_file, indent=2, sort_keys=True)
+        # Serialize in one go and write once; json.dump issues a write per encoder chunk
+        encoder = COMPACT_JSON_ENCODER if compact else INDENTED_JSON_ENCODER
+        tmp_file.write(encoder.encode(data_dict))
         tmp_path = Path(tmp_file.name)
 
     # Atomically replace the original file
@@ -264,7 +278,7 @@ def save_data(data_dict: dict[str, Any], file_path: str | Path) -> None:
 
 def clean_tag_text(tag_text: str) -> str:
     """Clean up tag text - remove trailing numbers like 'Casual1,157'"""
-    return re.sub(r'[\d,]+$', '', tag_text).strip()
+    return TRAILING_TAG_COUNT_PATTERN.sub('', tag_text).strip()
 
 
 
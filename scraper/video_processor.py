@@ -6,7 +6,9 @@ and video metadata management.
 """
 
 import logging
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from .models import VideoData
@@ -14,6 +16,7 @@ from .models import VideoData
 if TYPE_CHECKING:
     from .data_manager import OtherGamesDataDict, VideosDataDict
 from .utils import extract_all_game_links
+from .youtube_extractor import YouTubeDetectionError
 
 
 class VideoProcessor:
@@ -45,7 +48,8 @@ class VideoProcessor:
                 logging.error(f"Invalid cutoff date format: {cutoff_date}. Use YYYY-MM-DD format.")
                 return 0
 
-        known_video_ids = set(videos_data['videos'].keys())
+        # Known videos are looked up directly in the videos dict, which new videos are added to as they're processed
+        known_videos = videos_data['videos']
         new_videos_processed = 0
         from .constants import DEFAULT_MAX_VIDEOS_PER_CHANNEL
         batch_size = min(max_new_videos * 2, DEFAULT_MAX_VIDEOS_PER_CHANNEL)  # Fetch more IDs to account for known videos
@@ -58,9 +62,9 @@ class VideoProcessor:
             smart_start_offset = 0  # Start from beginning (newest videos)
             logging.debug("Fetching newest videos first (cron mode)")
         else:
-            smart_start_offset = max(0, len(known_video_ids) - 10) if known_video_ids else 0
+            smart_start_offset = max(0, len(known_videos) - 10) if known_videos else 0
             if smart_start_offset > 0:
-                logging.info(f"Smart start: skipping to position {smart_start_offset + 1} (have {len(known_video_ids)} videos)")
+                logging.info(f"Smart start: skipping to position {smart_start_offset + 1} (have {len(known_videos)} videos)")
 
         videos_fetched_total = smart_start_offset
 
@@ -70,32 +74,23 @@ class VideoProcessor:
 
             logging.debug(f"Fetching {batch_size} video IDs starting from position {skip_count + 1}")
 
-            # Fetch videos with offset (lightweight - just IDs and basic info)
-            videos = self.get_channel_videos_lightweight(channel_url, skip_count, batch_size)
-
-            if not videos:
+            # First pass: stream videos with offset (lightweight - just IDs and basic info) and identify
+            # new ones without fetching full metadata, stopping as soon as the remaining limit is covered
+            remaining = max_new_videos - new_videos_processed
+            new_videos_in_batch = []
+            videos_fetched_in_batch = 0
+            for video in self.get_channel_videos_lightweight(channel_url, skip_count, batch_size):
+                videos_fetched_in_batch += 1
+                if video['video_id'] not in known_videos:
+                    new_videos_in_batch.append(video)
+                    if len(new_videos_in_batch) >= remaining:
+                        break
+
+            if not videos_fetched_in_batch:
                 logging.info("No more videos available from channel")
                 break
 
-            videos_fetched_total += len(videos)
-            batch_new_count = 0
-            new_videos_in_batch = []
-
-            # First pass: identify new videos without fetching full metadata
-            for video in videos:
-                video_id = video['video_id']
-
-                # Check if we've hit the max new videos limit
-                if new_videos_processed >= max_new_videos:
-                    break
-
-                # Skip if we already have this video
-                if video_id in known_video_ids:
-                    continue
-
-                new_videos_in_batch.append(video)
-                if len(new_videos_in_batch) >= max_new_videos - new_videos_processed:
-                    break
+            videos_fetched_total += videos_fetched_in_batch
 
             if not new_videos_in_batch:
                 consecutive_known_batches += 1
@@ -110,15 +105,27 @@ class VideoProcessor:
             # Second pass: fetch full metadata only for new videos
             logging.info(f"Found {len(new_videos_in_batch)} new videos, fetching full metadata")
             batch_new_count = 0
+            prefetched_videos = self.get_full_video_metadata_batch(channel_url, new_videos_in_batch)
+            fallback_results = self._fetch_full_video_metadata_concurrently(
+                [video['video_id'] for video in new_videos_in_batch if video['video_id'] not in prefetched_videos]
+            )
+            detected_games = self._fetch_youtube_detected_games_concurrently([
+                prefetched_videos[video['video_id']] if video['video_id'] in prefetched_videos
+                else fallback_results[video['video_id']][0]
+                for video in new_videos_in_batch
+            ])
             for video in new_videos_in_batch:
                 video_id = video['video_id']
 
                 if new_videos_processed >= max_new_videos:
                     break
 
-                # Get full video metadata
+                # Get full video metadata, falling back to the per-video fetch if the batch missed it
                 try:
-                    full_video, is_expected_skip = self.get_full_video_metadata(video_id)
+                    if video_id in prefetched_videos:
+                        full_video, is_expected_skip = prefetched_videos[video_id], False
+                    else:
+                        full_video, is_expected_skip = fallback_results[video_id]
                     if full_video:
                         video_date = full_video.get('published_at', '')[:10] if full_video.get('published_at') else 'Unknown'
 
@@ -132,10 +139,9 @@ class VideoProcessor:
                             thumbnail=full_video.get('thumbnail', '')
                         )
                         # Process video with game link extraction
-                        video_data = self.process_video_game_links(video_obj)
+                        video_data = self.process_video_game_links(video_obj, detected_games)
 
                         videos_data['videos'][video_id] = video_data
-                        known_video_ids.add(video_id)  # Add to our tracking set
                         new_videos_processed += 1
                         batch_new_count += 1
 
@@ -170,16 +176,55 @@ class VideoProcessor:
             else:
                 consecutive_known_batches = 0
 
+        self.youtube_extractor.close()
         logging.info(f"Completed: {new_videos_processed} new videos processed")
         return new_videos_processed
 
-    def process_video_game_links(self, video: VideoData) -> VideoData:
-        """Extract and process game links from a video"""
+    def _fetch_full_video_metadata_concurrently(self, video_ids: list[str]) -> dict[str, tuple[dict[str, Any] | None, bool]]:
+        """Fetch full metadata for several videos in parallel, keyed by video ID"""
+        if not video_ids:
+            return {}
+
+        from .constants import VIDEO_METADATA_FETCH_WORKERS
+        with ThreadPoolExecutor(max_workers=VIDEO_METADATA_FETCH_WORKERS, thread_name_prefix='video-metadata') as executor:
+            return dict(zip(video_ids, executor.map(self.get_full_video_metadata, video_ids), strict=True))
+
+    def _fetch_youtube_detected_games_concurrently(
+            self, videos: list[dict[str, Any] | None]) -> dict[str, tuple[str | None, bool]]:
+        """Fetch YouTube's detected game in parallel for videos whose descriptions have no game links"""
+        video_ids = [
+            video['video_id'] for video in videos
+            if video and not extract_all_game_links(video.get('description', ''))
+        ]
+        if not video_ids:
+            return {}
+
+        from .constants import VIDEO_METADATA_FETCH_WORKERS
+        with ThreadPoolExecutor(max_workers=VIDEO_METADATA_FETCH_WORKERS, thread_name_prefix='video-detect') as executor:
+            return dict(zip(video_ids, executor.map(self._detect_youtube_game, video_ids), strict=True))
+
+    def _detect_youtube_game(self, video_id: str) -> tuple[str | None, bool]:
+        """Probe YouTube's detected game, returning (game, checked)
+
+        checked is False when the watch page couldn't be read, so a missing game isn't known to be absent.
+        """
+        try:
+            return self.youtube_extractor.extract_youtube_detected_game(video_id), True
+        except YouTubeDetectionError as e:
+            logging.warning(f"  YouTube detection failed: {e}")
+            return None, False
+
+    def process_video_game_links(self, video: VideoData,
+                                 detected_games: dict[str, tuple[str | None, bool]] | None = None) -> VideoData:
+        """Extract and process game links from a video
+
+        detected_games can carry already fetched YouTube detections by video ID to skip the request.
+        """
         # Extract ALL game references from description using new multi-game logic
         game_references = extract_all_game_links(video.description)
 
-        # Store video data with game references (preserve all existing fields)
-        video_data = video.model_copy(update={'game_references': game_references})
+        # Collect field updates and copy the video once at the end (preserving all existing fields)
+        updates: dict[str, Any] = {'game_references': game_references}
 
         if game_references:
             logging.info(f"  Found {len(game_references)} game reference(s)")
@@ -187,10 +232,25 @@ class VideoProcessor:
             logging.info("  No game links found, trying YouTube detection...")
 
             # Last resort: try YouTube's detected game
-            detected_game = self.youtube_extractor.extract_youtube_detected_game(video.video_id)
+            probed = False
+            if detected_games is not None and video.video_id in detected_games:
+                detected_game, probed = detected_games[video.video_id]
+            elif video.youtube_detected_game:
+                # Detection already stored with the video (reprocessing), no need to scrape the watch page again
+                detected_game = video.youtube_detected_game
+            elif self.youtube_detection_recently_checked(video.youtube_detection_checked):
+                # A recent probe found nothing, don't scrape the watch page again until the recheck interval passes
+                detected_game = None
+            else:
+                detected_game, probed = self._detect_youtube_game(video.video_id)
+
+            # Only a watch page that was actually read and had no game counts as a negative result
+            if probed:
+                updates['youtube_detection_checked'] = None if detected_game else datetime.now().isoformat()
+
             if detected_game:
                 logging.info(f"  YouTube detected game: {detected_game}")
-                video_data = video_data.model_copy(update={'youtube_detected_game': detected_game})
+                updates['youtube_detected_game'] = detected_game
 
                 # Check if this game should skip Steam matching
                 skip_games = self.config_manager.get_skip_steam_matching_games()
@@ -208,9 +268,7 @@ class VideoProcessor:
                             inferred=True,
                             youtube_detected_matched=True
                         )
-                        video_data = video_data.model_copy(update={
-                            'game_references': [inferred_ref]
-                        })
+                        updates['game_references'] = [inferred_ref]
                         logging.info(f"  Matched to Steam: {steam_match['name']} (App ID: {steam_match['app_id']}, confidence: {steam_match['confidence']:.2f})")
                     else:
                         logging.info("  No confident Steam matches found for YouTube detected game")
@@ -219,7 +277,21 @@ class VideoProcessor:
             else:
                 logging.info("  No YouTube detected game found")
 
-        return video_data
+        return video.model_copy(update=updates)
+
+    @staticmethod
+    def youtube_detection_recently_checked(detection_checked: str | None) -> bool:
+        """Check whether a video's youtube_detection_checked stamp falls within the recheck interval"""
+        if not detection_checked:
+            return False
+
+        try:
+            checked_at = datetime.fromisoformat(detection_checked)
+        except ValueError:
+            return False
+
+        from .constants import YOUTUBE_DETECTION_RECHECK_DAYS
+        return datetime.now() - checked_at < timedelta(days=YOUTUBE_DETECTION_RECHECK_DAYS)
 
     def reprocess_video_descriptions(self, videos_data: "VideosDataDict") -> int:
         """Reprocess existing video descriptions to extract game links with current logic"""
@@ -251,12 +323,16 @@ class VideoProcessor:
         logging.info(f"Reprocessing complete. Processed {videos_processed} videos, updated {updated_count} videos.")
         return updated_count
 
-    def get_channel_videos_lightweight(self, channel_url: str, skip_count: int, batch_size: int) -> list[dict[Any, Any]]:
-        """Fetch lightweight video info (just IDs and titles) from YouTube channel"""
-        result = self.youtube_extractor.get_channel_videos_lightweight(channel_url, skip_count, batch_size)
-        return result if isinstance(result, list) else []
+    def get_channel_videos_lightweight(self, channel_url: str, skip_count: int, batch_size: int) -> Iterator[dict[Any, Any]]:
+        """Yield lightweight video info (just IDs and titles) from YouTube channel"""
+        yield from self.youtube_extractor.get_channel_videos_lightweight(channel_url, skip_count, batch_size)
 
     def get_full_video_metadata(self, video_id: str) -> tuple[dict[Any, Any] | None, bool]:
         """Fetch full metadata for a specific video"""
         result = self.youtube_extractor.get_full_video_metadata(video_id)
         return result if isinstance(result, tuple) else (None, False)
+
+    def get_full_video_metadata_batch(self, channel_url: str, videos: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Fetch full metadata for several channel videos in one playlist extraction"""
+        result = self.youtube_extractor.get_full_video_metadata_batch(channel_url, videos)
+        return result if isinstance(result, dict) else {}
@@ -4,13 +4,27 @@ YouTube video extraction and metadata utilities
 
 import json
 import logging
-import re
-from datetime import datetime
+import queue
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import requests
 import yt_dlp
 
+from .constants import HTTP_TIMEOUT_SECONDS, USER_AGENT
+from .utils import format_unix_timestamp
+
+# Assignment that introduces YouTube's initial page data JSON in watch pages
+YT_INITIAL_DATA_MARKER = 'var ytInitialData = '
+JSON_DECODER = json.JSONDecoder()
+# Key of the renderer holding YouTube's detected game; most watch pages don't contain it
+RICH_METADATA_RENDERER_KEY = '"richMetadataRenderer"'
+
+
+class YouTubeDetectionError(Exception):
+    """The watch page couldn't be fetched or read, so whether YouTube detected a game is unknown"""
+
 
 class YouTubeExtractor:
     """Handles YouTube video metadata extraction and game detection"""
@@ -24,6 +38,39 @@ class YouTubeExtractor:
             'force_generic_extractor': False,
             'logger': self._get_quiet_logger(),
         }
+        # Idle YoutubeDL instances for per-video fetches, reused so their HTTP connections stay open.
+        # YoutubeDL isn't thread-safe, so each concurrent fetch checks out its own instance.
+        self._idle_ydls: queue.SimpleQueue[yt_dlp.YoutubeDL] = queue.SimpleQueue()
+        self._ydl_instances: list[yt_dlp.YoutubeDL] = []
+        # Long-lived YoutubeDL instances for channel playlist extractions, one per kind of extraction
+        self._playlist_ydls: dict[str, yt_dlp.YoutubeDL] = {}
+        # Shared session so watch page scrapes reuse keep-alive connections to youtube.com
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+
+    @contextmanager
+    def _pooled_ydl(self) -> Iterator[yt_dlp.YoutubeDL]:
+        """Check out a reusable YoutubeDL instance, creating one if none are idle"""
+        try:
+            ydl = self._idle_ydls.get_nowait()
+        except queue.Empty:
+            ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+            self._ydl_instances.append(ydl)
+        try:
+            yield ydl
+        finally:
+            self._idle_ydls.put(ydl)
+
+    def close(self) -> None:
+        """Close the pooled and playlist YoutubeDL instances and the shared HTTP session"""
+        for ydl in self._ydl_instances:
+            ydl.close()
+        self._ydl_instances.clear()
+        self._idle_ydls = queue.SimpleQueue()
+        for ydl in self._playlist_ydls.values():
+            ydl.close()
+        self._playlist_ydls.clear()
+        self.session.close()
 
     def _get_quiet_logger(self) -> object:
         """Custom logger to suppress yt-dlp ERROR messages for expected cases"""
@@ -39,61 +86,75 @@ class YouTubeExtractor:
                     logging.error(f"yt-dlp: {msg}")
         return QuietLogger()
 
-    def get_channel_videos_lightweight(self, channel_url: str, skip_count: int, batch_size: int) -> list[dict[str, Any]]:
-        """Fetch lightweight video info (just IDs and titles) from YouTube channel"""
-        videos = []
+    def _playlist_ydl(self, kind: str, ydl_opts: dict[str, Any], playlist_opts: dict[str, Any]) -> yt_dlp.YoutubeDL:
+        """Return the reusable YoutubeDL for a kind of playlist extraction, set to the given playlist range
 
-        # Use playlist start/end to simulate offset
+        yt-dlp reads playlist range options when it processes a playlist, so a single instance
+        can serve every batch instead of paying YoutubeDL setup for each one.
+        """
+        ydl = self._playlist_ydls.get(kind)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            self._playlist_ydls[kind] = ydl
+        ydl.params.update(playlist_opts)
+        return ydl
+
+    def get_channel_videos_lightweight(self, channel_url: str, skip_count: int, batch_size: int) -> Iterator[dict[str, Any]]:
+        """Yield lightweight video info (just IDs and titles) from YouTube channel
+
+        Entries are yielded one at a time so callers can stop consuming once they have enough.
+        """
         ydl_opts_lightweight = {
             'quiet': True,
             'no_warnings': True,
             'extract_flat': True,
             'force_generic_extractor': False,
-            'playliststart': skip_count + 1,
-            'playlistend': skip_count + batch_size,
             'logger': self._get_quiet_logger(),
         }
+        # Use playlist start/end to simulate offset
+        ydl = self._playlist_ydl('lightweight', ydl_opts_lightweight, {
+            'playliststart': skip_count + 1,
+            'playlistend': skip_count + batch_size,
+        })
 
-        with yt_dlp.YoutubeDL(ydl_opts_lightweight) as ydl:
-            try:
-                logging.debug(f"Fetching lightweight data from {channel_url}")
-                info = ydl.extract_info(channel_url, download=False)
-
-                if info and 'entries' in info:
-                    entries = info['entries']
-                elif info:
-                    entries = [info]
-                else:
-                    entries = []
+        try:
+            logging.debug(f"Fetching lightweight data from {channel_url}")
+            info = ydl.extract_info(channel_url, download=False)
 
-                # Process entries - just extract basic info
-                for entry in entries:
-                    if not entry:
-                        continue
+            if info and 'entries' in info:
+                entries = info['entries']
+            elif info:
+                entries = [info]
+            else:
+                entries = []
 
-                    if not isinstance(entry, dict):
-                        continue
+            # Process entries - just extract basic info
+            for position, entry in enumerate(entries, start=skip_count + 1):
+                if not entry:
+                    continue
 
-                    video_id = entry.get('id')
-                    if not video_id:
-                        continue
+                if not isinstance(entry, dict):
+                    continue
 
-                    timestamp = entry.get('timestamp')
-                    published_at = None
-                    if timestamp and isinstance(timestamp, int | float) and timestamp > 0:
-                        published_at = datetime.fromtimestamp(timestamp).isoformat()
+                video_id = entry.get('id')
+                if not video_id:
+                    continue
 
-                    videos.append({
-                        'video_id': video_id,
-                        'title': entry.get('title', ''),
-                        'published_at': published_at,
-                        'thumbnail': entry.get('thumbnail', '')
-                    })
+                timestamp = entry.get('timestamp')
+                published_at = None
+                if timestamp and isinstance(timestamp, int | float) and timestamp > 0:
+                    published_at = format_unix_timestamp(timestamp)
 
-            except Exception as e:
-                logging.error(f"Error fetching lightweight channel videos: {e}")
+                yield {
+                    'video_id': video_id,
+                    'title': entry.get('title', ''),
+                    'published_at': published_at,
+                    'thumbnail': entry.get('thumbnail', ''),
+                    'playlist_index': position
+                }
 
-        return videos
+        except Exception as e:
+            logging.error(f"Error fetching lightweight channel videos: {e}")
 
     def get_full_video_metadata(self, video_id: str) -> tuple[dict[str, Any] | None, bool]:
         """Fetch full metadata for a specific video
@@ -104,22 +165,11 @@ class YouTubeExtractor:
         """
         try:
             video_url = f"https://www.youtube.com/watch?v={video_id}"
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            with self._pooled_ydl() as ydl:
                 video_info = ydl.extract_info(video_url, download=False)
 
                 if video_info:
-                    timestamp = video_info.get('timestamp')
-                    published_at = ''
-                    if timestamp and isinstance(timestamp, int | float):
-                        published_at = datetime.fromtimestamp(timestamp).isoformat()
-
-                    return {
-                        'video_id': video_id,
-                        'title': video_info.get('title', ''),
-                        'description': video_info.get('description', ''),
-                        'published_at': published_at,
-                        'thumbnail': video_info.get('thumbnail', '')
-                    }, False
+                    return self._build_video_metadata(video_id, video_info), False
                 else:
                     return None, False
         except Exception as e:
@@ -134,49 +184,114 @@ class YouTubeExtractor:
                 logging.error(f"Error fetching full metadata for video {video_id}: {e}")
                 return None, False
 
-    def extract_youtube_detected_game(self, video_id: str) -> str | None:
-        """Extract YouTube's detected game from JSON data as last resort"""
+    def get_full_video_metadata_batch(self, channel_url: str, videos: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Fetch full metadata for several channel videos in a single playlist extraction
+
+        Uses the playlist positions recorded by get_channel_videos_lightweight to extract
+        only the requested entries. Results are keyed by video ID and only contain videos
+        that were requested, so entries that shifted position or failed to extract are
+        simply missing and can be fetched individually by the caller.
+        """
+        positions = {video['video_id']: video.get('playlist_index') for video in videos}
+        playlist_items = ','.join(str(position) for position in positions.values() if position)
+        if not playlist_items:
+            return {}
+
+        ydl_opts_batch = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': False,
+            'lazy_playlist': True,
+            'ignoreerrors': True,
+            'logger': self._get_quiet_logger(),
+        }
+
+        results: dict[str, dict[str, Any]] = {}
         try:
-            url = f"https://www.youtube.com/watch?v={video_id}"
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-
-            response = requests.get(url, headers=headers)
-            if response.status_code != 200:
-                return None
-
-            page_content = response.text
-
-            # Look for YouTube's initial data JSON
-            pattern = r'var ytInitialData = ({.*?});'
-            match = re.search(pattern, page_content)
-            if not match:
-                return None
-
-            data = json.loads(match.group(1))
-
-            # Navigate to the rich metadata renderer
-            try:
-                contents = data['contents']['twoColumnWatchNextResults']['results']['results']['contents']
-                for content in contents:
-                    if 'videoSecondaryInfoRenderer' in content:
-                        metadata_container = content['videoSecondaryInfoRenderer'].get('metadataRowContainer', {})
-                        rows = metadata_container.get('metadataRowContainerRenderer', {}).get('rows', [])
-
-                        for row in rows:
-                            if 'richMetadataRowRenderer' in row:
-                                rich_contents = row['richMetadataRowRenderer'].get('contents', [])
-                                for rich_content in rich_contents:
-                                    if 'richMetadataRenderer' in rich_content:
-                                        title = rich_content['richMetadataRenderer'].get('title', {})
-                                        if 'simpleText' in title:
-                                            game_title = str(title['simpleText']).strip()
-                                            if game_title and len(game_title) > 3:
-                                                return game_title
-            except (KeyError, TypeError):
-                pass
+            ydl = self._playlist_ydl('batch', ydl_opts_batch, {'playlist_items': playlist_items})
+            logging.debug(f"Fetching full metadata for {len(positions)} videos from {channel_url}")
+            info = ydl.extract_info(channel_url, download=False)
 
-            return None
+            for entry in (info or {}).get('entries') or []:
+                if not isinstance(entry, dict):
+                    continue
 
+                video_id = entry.get('id')
+                # Only accept complete entries we asked for
+                if video_id in positions and entry.get('description') is not None:
+                    results[video_id] = self._build_video_metadata(video_id, entry)
         except Exception as e:
-            logging.debug(f"Error extracting YouTube detected game for {video_id}: {e}")
+            logging.warning(f"Batch metadata fetch failed, falling back to per-video fetches: {e}")
+
+        return results
+
+    def _build_video_metadata(self, video_id: str, video_info: dict[str, Any]) -> dict[str, Any]:
+        """Build the video metadata dict from a yt-dlp info dict"""
+        timestamp = video_info.get('timestamp')
+        published_at = ''
+        if timestamp and isinstance(timestamp, int | float):
+            published_at = format_unix_timestamp(timestamp)
+
+        return {
+            'video_id': video_id,
+            'title': video_info.get('title', ''),
+            'description': video_info.get('description', ''),
+            'published_at': published_at,
+            'thumbnail': video_info.get('thumbnail', '')
+        }
+
+    def extract_youtube_detected_game(self, video_id: str) -> str | None:
+        """Extract YouTube's detected game from JSON data as last resort
+
+        Returns None only for a watch page without a detected game; raises YouTubeDetectionError
+        when the page couldn't be fetched or read.
+        """
+        url = f"https://www.youtube.com/watch?v={video_id}"
+
+        try:
+            response = self.session.get(url, timeout=HTTP_TIMEOUT_SECONDS)
+        except requests.RequestException as e:
+            raise YouTubeDetectionError(f"Error fetching watch page for {video_id}: {e}") from e
+        if response.status_code != 200:
+            raise YouTubeDetectionError(f"Watch page for {video_id} returned HTTP {response.status_code}")
+
+        page_content = response.text
+
+        # Look for YouTube's initial data JSON and decode the object in place,
+        # rather than scanning the page for its end with a lazy regex first
+        marker_pos = page_content.find(YT_INITIAL_DATA_MARKER)
+        if marker_pos == -1:
+            # Consent and bot check pages come back as 200 without any video data
+            raise YouTubeDetectionError(f"Watch page for {video_id} has no initial data")
+
+        # Without a rich metadata renderer there is no detected game, so skip decoding the large blob
+        if page_content.find(RICH_METADATA_RENDERER_KEY, marker_pos) == -1:
             return None
+
+        try:
+            data, _ = JSON_DECODER.raw_decode(page_content, marker_pos + len(YT_INITIAL_DATA_MARKER))
+        except ValueError as e:
+            raise YouTubeDetectionError(f"Invalid initial data in watch page for {video_id}: {e}") from e
+
+        # Navigate to the rich metadata renderer
+        try:
+            contents = data['contents']['twoColumnWatchNextResults']['results']['results']['contents']
+            for content in contents:
+                if 'videoSecondaryInfoRenderer' in content:
+                    metadata_container = content['videoSecondaryInfoRenderer'].get('metadataRowContainer', {})
+                    rows = metadata_container.get('metadataRowContainerRenderer', {}).get('rows', [])
+
+                    for row in rows:
+                        if 'richMetadataRowRenderer' in row:
+                            rich_contents = row['richMetadataRowRenderer'].get('contents', [])
+                            for rich_content in rich_contents:
+                                if 'richMetadataRenderer' in rich_content:
+                                    title = rich_content['richMetadataRenderer'].get('title', {})
+                                    if 'simpleText' in title:
+                                        game_title = str(title['simpleText']).strip()
+                                        if game_title and len(game_title) > 3:
+                                            return game_title
+        except (KeyError, TypeError):
+            pass
+
+        return None
@@ -0,0 +1,70 @@
+"""
+Tests for skipping re-saves of unchanged data files
+"""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from scraper import data_manager as data_manager_module
+from scraper.data_manager import DataManager
+from scraper.models import SteamGameData
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> DataManager:
+    return DataManager(tmp_path, validate_on_save=False)
+
+
+@pytest.fixture
+def save_data_spy():
+    with mock.patch.object(data_manager_module, 'save_data', wraps=data_manager_module.save_data) as spy:
+        yield spy
+
+
+def make_steam_data() -> dict:
+    game = SteamGameData(steam_app_id='10', steam_url='https://store.steampowered.com/app/10', name='Game',
+                         last_updated='2025-01-01T00:00:00')
+    return {'games': {'10': game}, 'last_updated': None}
+
+
+def test_unchanged_model_data_is_not_rewritten(manager: DataManager, save_data_spy: mock.Mock) -> None:
+    manager.save_steam_data(make_steam_data())
+    manager.save_steam_data(make_steam_data())
+
+    assert save_data_spy.call_count == 1
+
+
+def test_changed_model_data_is_rewritten(manager: DataManager, save_data_spy: mock.Mock) -> None:
+    steam_data = make_steam_data()
+    manager.save_steam_data(steam_data)
+    steam_data['games']['10'] = steam_data['games']['10'].model_copy(update={'name': 'Renamed'})
+    manager.save_steam_data(steam_data)
+
+    assert save_data_spy.call_count == 2
+    assert manager.load_steam_data()['games']['10'].name == 'Renamed'
+
+
+def test_externally_modified_file_is_rewritten(manager: DataManager, save_data_spy: mock.Mock) -> None:
+    manager.save_steam_data(make_steam_data())
+    steam_file = manager.get_steam_file_path()
+    stat = steam_file.stat()
+    os.utime(steam_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    manager.save_steam_data(make_steam_data())
+
+    assert save_data_spy.call_count == 2
+
+
+def test_dict_payload_mutated_in_place_is_rewritten(manager: DataManager, save_data_spy: mock.Mock) -> None:
+    # Plain dicts are saved as-is, so the snapshot would be the very object the caller mutates
+    steam_data = {'games': {'10': {'steam_app_id': '10', 'steam_url': 'https://store.steampowered.com/app/10',
+                                   'name': 'Game'}}, 'last_updated': None}
+    manager.save_steam_data(steam_data)
+    steam_data['games']['10']['name'] = 'Renamed'
+    manager.save_steam_data(steam_data)
+
+    assert save_data_spy.call_count == 2
+    assert manager.load_steam_data()['games']['10'].name == 'Renamed'
@@ -0,0 +1,70 @@
+"""
+Tests for release date validation and Steam release date parsing
+"""
+
+from datetime import datetime
+
+import pytest
+
+from scraper.steam_updater import detect_date_granularity, parse_steam_date
+from scraper.utils import is_valid_date_string
+
+
+@pytest.mark.parametrize('date_str', [
+    'January 15, 2025',
+    'Jan 15 2025',
+    'sep 3, 2026',
+    'March 2025',
+    'Jun 2025',
+    'Q2 2025',
+    '2025',
+    'Early 2026',
+    'Autumn 2025',
+    'Coming Soon',
+    'TBD',
+    'To be announced',
+    '  March 2025  ',
+])
+def test_valid_date_strings(date_str: str) -> None:
+    assert is_valid_date_string(date_str)
+
+
+@pytest.mark.parametrize('date_str', [
+    '',
+    '15',
+    'Sept 2025',
+    'Q5 2025',
+    '1080p',
+    'at 1080',
+    '60 fps',
+    '8 GB',
+    'March 2025 at 60',
+    'Release Date: March 2025',
+    'Processor: 2.4 GHz dual core, 4 GB RAM, released in 2025',
+])
+def test_invalid_date_strings(date_str: str) -> None:
+    assert not is_valid_date_string(date_str)
+
+
+@pytest.mark.parametrize(('date_str', 'granularity'), [
+    ('Q3 2025', 'quarter'),
+    ('q1 2026', 'quarter'),
+    ('2025', 'year'),
+    ('March 2025', 'month'),
+    ('15 Mar, 2025', 'day'),
+    ('Mar 15, 2025', 'day'),
+])
+def test_detect_date_granularity(date_str: str, granularity: str) -> None:
+    assert detect_date_granularity(date_str) == granularity
+
+
+@pytest.mark.parametrize(('date_str', 'expected'), [
+    ('Q3 2025', (datetime(2025, 7, 1), 'quarter')),
+    ('2026', (datetime(2026, 1, 1), 'year')),
+    ('March 2025', (datetime(2025, 3, 1), 'month')),
+    ('Mar 15, 2025', (datetime(2025, 3, 15), 'day')),
+    ('', (None, None)),
+    ('not a date at all', (None, None)),
+])
+def test_parse_steam_date(date_str: str, expected: tuple[datetime | None, str | None]) -> None:
+    assert parse_steam_date(date_str) == expected
@@ -0,0 +1,76 @@
+"""
+Tests for parsing Steam appdetails price responses into PriceRow values
+"""
+
+import pytest
+
+from scraper.models import SteamGameData
+from scraper.steam_api_response_parser import PriceRow, SteamApiResponseParser
+
+
+@pytest.fixture
+def parser() -> SteamApiResponseParser:
+    return SteamApiResponseParser()
+
+
+def make_game(price_eur: int | None = None, price_usd: int | None = None) -> SteamGameData:
+    return SteamGameData(steam_app_id='10', steam_url='https://store.steampowered.com/app/10', name='Game',
+                         price_eur=price_eur, price_usd=price_usd)
+
+
+def test_eur_sale_price(parser: SteamApiResponseParser) -> None:
+    app_data = {'price_overview': {'currency': 'EUR', 'initial': 1999, 'final': 999, 'discount_percent': 50}}
+
+    assert parser._parse_single_app_response(app_data, '10') == PriceRow(
+        is_on_sale=True, is_free=False, price_eur=999, original_price_eur=1999, discount_percent=50,
+    )
+
+
+def test_usd_full_price_has_no_original_price(parser: SteamApiResponseParser) -> None:
+    app_data = {'price_overview': {'currency': 'USD', 'initial': 1499, 'final': 1499, 'discount_percent': 0}}
+
+    assert parser._parse_single_app_response(app_data, '10') == PriceRow(is_free=False, price_usd=1499)
+
+
+def test_zero_final_price_is_free(parser: SteamApiResponseParser) -> None:
+    app_data = {'price_overview': {'currency': 'EUR', 'initial': 0, 'final': 0, 'discount_percent': 0}}
+
+    assert parser._parse_single_app_response(app_data, '10') == PriceRow(is_free=True)
+
+
+def test_unknown_currency_is_skipped(parser: SteamApiResponseParser) -> None:
+    app_data = {'price_overview': {'currency': 'GBP', 'initial': 999, 'final': 999, 'discount_percent': 0}}
+
+    assert parser._parse_single_app_response(app_data, '10') is None
+
+
+@pytest.mark.parametrize('app_data', [{}, [], {'name': 'Game'}])
+def test_missing_price_without_existing_price_is_skipped(parser: SteamApiResponseParser, app_data: dict) -> None:
+    assert parser._parse_single_app_response(app_data, '10') is None
+    assert parser._parse_single_app_response(app_data, '10', make_game()) is None
+
+
+@pytest.mark.parametrize('app_data', [{}, [], {'name': 'Game'}])
+def test_disappeared_price_needs_full_refresh(parser: SteamApiResponseParser, app_data: dict) -> None:
+    assert parser._parse_single_app_response(app_data, '10', make_game(price_usd=999)) == PriceRow(needs_full_refresh=True)
+
+
+def test_appeared_price_needs_full_refresh(parser: SteamApiResponseParser) -> None:
+    app_data = {'price_overview': {'currency': 'EUR', 'initial': 999, 'final': 999, 'discount_percent': 0}}
+
+    row = parser._parse_single_app_response(app_data, '10', make_game())
+
+    assert row == PriceRow(is_free=False, price_eur=999, needs_full_refresh=True)
+
+
+def test_bulk_response_separates_removed_apps(parser: SteamApiResponseParser) -> None:
+    response = {
+        '10': {'success': True, 'data': {'price_overview': {'currency': 'EUR', 'initial': 999, 'final': 999}}},
+        '20': {'success': False},
+        '30': {'success': True, 'data': []},
+    }
+
+    results, removed = parser.parse_bulk_response_with_removal_info(response, ['10', '20', '30', '40'])
+
+    assert results == {'10': PriceRow(is_free=False, price_eur=999)}
+    assert removed == ['20', '40']
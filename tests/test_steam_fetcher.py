@@ -0,0 +1,95 @@
+"""
+Tests for Steam store page text extraction
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scraper.steam_fetcher import SteamDataFetcher
+
+
+@pytest.fixture
+def fetcher() -> SteamDataFetcher:
+    return SteamDataFetcher()
+
+
+def test_review_data_prefers_all_reviews_and_keeps_recent(fetcher: SteamDataFetcher) -> None:
+    page_text = (
+        "Recent Reviews:\nMostly Positive\n(50)\n- 78% of the 50 user reviews in the last 30 days are positive.\n"
+        "All Reviews:\nVery Positive\n(1,234)\n- 91% of the 1,234 user reviews for this game are positive.\n"
+    )
+
+    assert fetcher._extract_review_data(page_text) == {
+        'positive_review_percentage': 91,
+        'review_count': 1234,
+        'review_summary': 'Very Positive',
+        'recent_review_percentage': 78,
+        'recent_review_count': 50,
+        'recent_review_summary': 'Mostly Positive',
+    }
+
+
+def test_review_data_percentage_far_after_label(fetcher: SteamDataFetcher) -> None:
+    # Tooltip markup can put the percentage well over 500 characters after the label
+    filler = 'x' * 800
+    page_text = (
+        f"All Reviews:\nVery Positive\n(1,234)\n{filler}\n- 91% of the 1,234 user reviews\n"
+        f"Recent Reviews:\nPositive\n(12)\n{filler}\n- 83% of the 12 user reviews\n"
+    )
+
+    result = fetcher._extract_review_data(page_text)
+
+    assert result['positive_review_percentage'] == 91
+    assert result['recent_review_percentage'] == 83
+    assert result['recent_review_count'] == 12
+    assert result['recent_review_summary'] == 'Positive'
+
+
+def test_review_data_overall_label_with_review_unit(fetcher: SteamDataFetcher) -> None:
+    page_text = "Overall Reviews:\nPositive\n(42 reviews)\n- 88% of the 42 user reviews are positive"
+
+    assert fetcher._extract_review_data(page_text) == {
+        'positive_review_percentage': 88,
+        'review_count': 42,
+        'review_summary': 'Positive',
+    }
+
+
+def test_insufficient_reviews_patterns_keep_their_order(fetcher: SteamDataFetcher) -> None:
+    # The "N user reviews ... Need more user reviews" pattern wins over an earlier bare "N reviews"
+    page_text = "blah 5 reviews blah\nAll Reviews:\n\n3 user reviews\n\n- Need more user reviews to generate a score"
+
+    assert fetcher._extract_review_data(page_text) == {
+        'review_count': 3,
+        'insufficient_reviews': True,
+        'review_summary': 'Need more reviews for score',
+    }
+
+
+def test_no_user_reviews(fetcher: SteamDataFetcher) -> None:
+    assert fetcher._extract_review_data("All Reviews:\nNo user reviews") == {
+        'review_count': 0,
+        'review_summary': 'No user reviews',
+    }
+
+
+@pytest.mark.parametrize(('page_text', 'expected'), [
+    ("Coming Soon - January 15, 2025", "January 15, 2025"),
+    ("Release Date: March 2026", "March 2026"),
+    # A full date anywhere beats a bare year found earlier
+    ("Coming Soon 2025 then January 15, 2025", "January 15, 2025"),
+    # Coming Soon dates beat Release Date ones
+    ("Release Date: 2026\nComing Soon - Q2 2025", "Q2 2025"),
+    # A bare year only counts after Coming Soon
+    ("Release Date: 2026", None),
+])
+def test_planned_release_date_pattern_order(fetcher: SteamDataFetcher, page_text: str, expected: str | None) -> None:
+    soup = BeautifulSoup('<div></div>', 'html.parser')
+
+    assert fetcher._extract_planned_release_date(soup, page_text) == expected
+
+
+def test_planned_release_date_falls_back_to_release_date_element(fetcher: SteamDataFetcher) -> None:
+    soup = BeautifulSoup('<div class="release_date">Release Date: 2027</div>', 'html.parser')
+
+    assert fetcher._extract_planned_release_date(soup, "No date here") == '2027'
@@ -0,0 +1,66 @@
+"""
+Tests for merging persisted and pending scraper video data
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from scraper.data_manager import DataManager
+from scraper.models import VideoData
+from scraper.unified_data_collector import UnifiedDataCollector
+
+
+def make_video(video_id: str) -> VideoData:
+    return VideoData(video_id=video_id, title=video_id, description='', published_at='2025-01-01T00:00:00')
+
+
+def make_scraper(channel_id: str, *video_ids: str) -> SimpleNamespace:
+    videos = {video_id: make_video(video_id) for video_id in video_ids}
+    return SimpleNamespace(channel_id=channel_id, videos_data={'videos': videos, 'last_updated': None})
+
+
+@pytest.fixture
+def data_manager(tmp_path: Path) -> DataManager:
+    manager = DataManager(tmp_path, validate_on_save=False)
+    manager.save_videos_data({'videos': {'saved': make_video('saved')}, 'last_updated': None}, 'channel')
+    return manager
+
+
+def test_single_pending_scraper_stands_in_for_the_file(data_manager: DataManager) -> None:
+    collector = UnifiedDataCollector(data_manager)
+
+    result = collector.collect_all_videos_data(['channel'], [make_scraper('channel', 'saved', 'new')])
+
+    assert set(result['channel']['videos']) == {'saved', 'new'}
+
+
+def test_pending_scrapers_for_one_channel_are_all_merged(data_manager: DataManager) -> None:
+    # Cron backfill: both scrapers loaded the file before either saved its new videos
+    collector = UnifiedDataCollector(data_manager)
+    recent = make_scraper('channel', 'recent')
+    backfill = make_scraper('channel', 'backfill')
+
+    result = collector.collect_all_videos_data(['channel'], [recent, backfill])
+
+    assert set(result['channel']['videos']) == {'saved', 'recent', 'backfill'}
+
+
+def test_result_does_not_share_the_scraper_videos_dict(data_manager: DataManager) -> None:
+    collector = UnifiedDataCollector(data_manager)
+    scraper = make_scraper('channel', 'saved')
+
+    result = collector.collect_all_videos_data(['channel'], [scraper])
+    scraper.videos_data['videos']['later'] = make_video('later')
+
+    assert 'later' not in result['channel']['videos']
+
+
+def test_channels_without_pending_scrapers_load_from_disk(data_manager: DataManager) -> None:
+    collector = UnifiedDataCollector(data_manager)
+
+    result = collector.collect_all_videos_data(['channel'], [make_scraper('other', 'pending')])
+
+    assert set(result['channel']['videos']) == {'saved'}
+    assert set(result['other']['videos']) == {'pending'}